@@ -0,0 +1,36 @@
+"""player_earnings_status_run_pending_index
+
+Revision ID: 0c5e8f3a7d19
+Revises: f1c7b2e9d046
+Create Date: 2026-10-18 17:24:51.093384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c5e8f3a7d19'
+down_revision: Union[str, None] = 'f1c7b2e9d046'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Table is created outside migrations (see 13b18bbcdc60)
+    if not sa.inspect(op.get_bind()).has_table('player_daily_earnings_status'):
+        return
+    # CONCURRENTLY can't run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index('idx_player_earnings_status_run_pending', 'player_daily_earnings_status', ['earnings_run_id', 'player_wallet'], unique=False, postgresql_where=sa.text("status = 'pending'"), postgresql_concurrently=True)
+        op.drop_index('idx_player_earnings_status_run', table_name='player_daily_earnings_status', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('player_daily_earnings_status'):
+        return
+    with op.get_context().autocommit_block():
+        op.create_index('idx_player_earnings_status_run', 'player_daily_earnings_status', ['earnings_run_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('idx_player_earnings_status_run_pending', table_name='player_daily_earnings_status', postgresql_concurrently=True)
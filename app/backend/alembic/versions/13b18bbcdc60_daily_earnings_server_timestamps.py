@@ -0,0 +1,51 @@
+"""daily_earnings_server_timestamps
+
+Revision ID: 13b18bbcdc60
+Revises: 8c2d4b7e91a3
+Create Date: 2026-10-18 15:41:12.508193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '13b18bbcdc60'
+down_revision: Union[str, None] = '8c2d4b7e91a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Daily earnings tables were created outside migrations (3f7f3e22194e is empty),
+# so only touch them where they exist
+# The columns are naive timestamps holding UTC, so now() is converted to UTC
+# rather than stored in the session TimeZone
+TIMESTAMP_COLUMNS = {
+    'daily_earnings_runs': ['started_at', 'created_at', 'updated_at'],
+    'player_daily_earnings_status': ['created_at', 'updated_at'],
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table_name, columns in TIMESTAMP_COLUMNS.items():
+        if not inspector.has_table(table_name):
+            continue
+        for column in columns:
+            op.alter_column(table_name, column,
+                   existing_type=sa.DateTime(),
+                   server_default=sa.text("timezone('utc', now())"),
+                   existing_nullable=False)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table_name, columns in TIMESTAMP_COLUMNS.items():
+        if not inspector.has_table(table_name):
+            continue
+        for column in columns:
+            op.alter_column(table_name, column,
+                   existing_type=sa.DateTime(),
+                   server_default=None,
+                   existing_nullable=False)
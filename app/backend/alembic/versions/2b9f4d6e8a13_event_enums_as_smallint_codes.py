@@ -0,0 +1,57 @@
+"""event_enums_as_smallint_codes
+
+Revision ID: 2b9f4d6e8a13
+Revises: 0c5e8f3a7d19
+Create Date: 2026-10-18 17:48:26.517902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b9f4d6e8a13'
+down_revision: Union[str, None] = '0c5e8f3a7d19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Enum labels in declaration order; a label's position is its SMALLINT code
+# (frozen here, the models may append members later)
+ENUM_COLUMNS = {
+    'event_type': ('eventtype', (
+        'PLAYER_CREATED', 'BUSINESS_CREATED', 'BUSINESS_UPGRADED', 'BUSINESS_SOLD',
+        'EARNINGS_UPDATED', 'EARNINGS_CLAIMED', 'BUSINESS_NFT_MINTED', 'BUSINESS_NFT_BURNED',
+        'BUSINESS_NFT_UPGRADED', 'BUSINESS_TRANSFERRED', 'BUSINESS_DEACTIVATED', 'SLOT_UNLOCKED',
+        'PREMIUM_SLOT_PURCHASED', 'BUSINESS_CREATED_IN_SLOT', 'BUSINESS_UPGRADED_IN_SLOT',
+        'BUSINESS_SOLD_FROM_SLOT', 'REFERRAL_BONUS_ADDED',
+    )),
+    'status': ('eventstatus', ('PENDING', 'PROCESSING', 'PROCESSED', 'FAILED', 'SKIPPED')),
+}
+
+
+def _label_array(labels) -> str:
+    return "ARRAY[" + ", ".join(f"'{label}'" for label in labels) + "]::text[]"
+
+
+def upgrade() -> None:
+    for column, (enum_name, labels) in ENUM_COLUMNS.items():
+        op.alter_column('events', column,
+                   existing_type=postgresql.ENUM(*labels, name=enum_name),
+                   type_=sa.SmallInteger(),
+                   existing_nullable=False,
+                   postgresql_using=f"array_position({_label_array(labels)}, {column}::text) - 1")
+        postgresql.ENUM(name=enum_name).drop(op.get_bind())
+
+
+def downgrade() -> None:
+    for column, (enum_name, labels) in ENUM_COLUMNS.items():
+        enum_type = postgresql.ENUM(*labels, name=enum_name)
+        enum_type.create(op.get_bind())
+        op.alter_column('events', column,
+                   existing_type=sa.SmallInteger(),
+                   type_=enum_type,
+                   existing_nullable=False,
+                   postgresql_using=f"({_label_array(labels)})[{column} + 1]::{enum_name}")
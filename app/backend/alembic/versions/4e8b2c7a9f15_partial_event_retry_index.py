@@ -0,0 +1,34 @@
+"""partial_event_retry_index
+
+Revision ID: 4e8b2c7a9f15
+Revises: 7d3a1f5c9e28
+Create Date: 2026-10-18 18:21:07.482619
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e8b2c7a9f15'
+down_revision: Union[str, None] = '7d3a1f5c9e28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# EventStatus.FAILED code (see 2b9f4d6e8a13)
+FAILED_STATUS = 3
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_event_pending_retry', table_name='events', postgresql_concurrently=True, if_exists=True)
+        op.create_index('idx_event_pending_retry', 'events', ['retry_count'], unique=False, postgresql_where=sa.text(f"status = {FAILED_STATUS}"), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_event_pending_retry', table_name='events', postgresql_concurrently=True)
+        op.create_index('idx_event_pending_retry', 'events', ['status', 'retry_count'], unique=False, postgresql_concurrently=True)
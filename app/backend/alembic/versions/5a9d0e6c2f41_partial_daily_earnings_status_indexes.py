@@ -0,0 +1,35 @@
+"""partial_daily_earnings_status_indexes
+
+Revision ID: 5a9d0e6c2f41
+Revises: 13b18bbcdc60
+Create Date: 2026-10-18 15:58:30.114027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9d0e6c2f41'
+down_revision: Union[str, None] = '13b18bbcdc60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Table is created outside migrations (see 13b18bbcdc60)
+    if not sa.inspect(op.get_bind()).has_table('player_daily_earnings_status'):
+        return
+    op.execute('DROP INDEX IF EXISTS idx_player_earnings_status_failed')
+    op.create_index('idx_player_earnings_status_failed', 'player_daily_earnings_status', ['earnings_date', 'status', 'needs_manual_review'], unique=False, postgresql_where=sa.text("status <> 'success'"))
+    op.create_index('idx_player_earnings_status_pending', 'player_daily_earnings_status', ['earnings_date', 'player_wallet'], unique=False, postgresql_where=sa.text("status = 'pending'"))
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('player_daily_earnings_status'):
+        return
+    op.drop_index('idx_player_earnings_status_pending', table_name='player_daily_earnings_status')
+    op.drop_index('idx_player_earnings_status_failed', table_name='player_daily_earnings_status')
+    op.create_index('idx_player_earnings_status_failed', 'player_daily_earnings_status', ['status', 'needs_manual_review'], unique=False)
@@ -0,0 +1,89 @@
+"""partition_events_by_block_time
+
+Revision ID: 6f2a9c4e1b58
+Revises: e8d4b2f6a731
+Create Date: 2026-10-18 19:31:44.027165
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f2a9c4e1b58'
+down_revision: Union[str, None] = 'e8d4b2f6a731'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Old table while rows are copied between layouts
+STAGING_TABLE = 'events_unpartitioned'
+SIGNATURE_COLUMNS = ['transaction_signature', 'instruction_index', 'event_index']
+
+
+def _next_month(month: datetime) -> datetime:
+    return datetime(month.year + 1, 1, 1) if month.month == 12 else datetime(month.year, month.month + 1, 1)
+
+
+def _create_indexes(signature_columns) -> None:
+    op.create_index('idx_event_type_slot', 'events', ['event_type', 'slot'], unique=False)
+    op.create_index('idx_event_player_type', 'events', ['player_wallet', 'event_type'], unique=False)
+    op.create_index('idx_event_signature_unique', 'events', signature_columns, unique=True)
+    op.create_index('idx_event_status_created', 'events', ['status', 'created_at'], unique=False)
+    op.create_index('idx_event_block_time_brin', 'events', ['block_time'], unique=False, postgresql_using='brin', postgresql_with={'pages_per_range': 32})
+    op.create_index('idx_event_created_brin', 'events', ['created_at'], unique=False, postgresql_using='brin')
+    op.create_index('idx_event_business_mint', 'events', ['business_mint'], unique=False)
+    op.create_index('idx_event_pending_retry', 'events', ['retry_count'], unique=False, postgresql_where=sa.text('status = 3'))
+    op.create_index('idx_event_processed_at', 'events', ['processed_at'], unique=False)
+    op.create_index('idx_event_parsed_gin', 'events', ['parsed_data'], unique=False, postgresql_using='gin', postgresql_ops={'parsed_data': 'jsonb_path_ops'})
+    op.create_index('ix_events_updated_at', 'events', ['updated_at'], unique=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    op.rename_table('events', STAGING_TABLE)
+    # Columns, NOT NULLs, defaults and comments; the id identity, keys and
+    # indexes are rebuilt after the copy
+    op.execute(f"CREATE TABLE events (LIKE {STAGING_TABLE} INCLUDING DEFAULTS INCLUDING COMMENTS) PARTITION BY RANGE (block_time)")
+
+    # Monthly partitions from the oldest event through next month
+    now = datetime.utcnow()
+    current = datetime(now.year, now.month, 1)
+    oldest = bind.execute(sa.text(f"SELECT date_trunc('month', min(block_time)) FROM {STAGING_TABLE}")).scalar()
+    month = min(oldest, current) if oldest else current
+    while month <= _next_month(current):
+        end = _next_month(month)
+        op.execute(
+            f"CREATE TABLE events_{month:%Y_%m} PARTITION OF events "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+        )
+        month = end
+    op.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+
+    op.execute(f"INSERT INTO events SELECT * FROM {STAGING_TABLE}")
+    op.drop_table(STAGING_TABLE)
+
+    # Identity columns aren't allowed on partitioned tables before Postgres 17
+    op.execute("CREATE SEQUENCE events_id_seq AS bigint CACHE 100 OWNED BY events.id")
+    op.execute("SELECT setval('events_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM events")
+    op.alter_column('events', 'id', existing_type=sa.BigInteger(), server_default=sa.text("nextval('events_id_seq'::regclass)"))
+
+    # Keys on a partitioned table must include the partition key
+    op.create_primary_key('events_pkey', 'events', ['id', 'block_time'])
+    _create_indexes(SIGNATURE_COLUMNS + ['block_time'])
+
+
+def downgrade() -> None:
+    op.execute(f"CREATE TABLE {STAGING_TABLE} (LIKE events INCLUDING DEFAULTS INCLUDING COMMENTS)")
+    # The copied id default points at the sequence dropped with events
+    op.alter_column(STAGING_TABLE, 'id', existing_type=sa.BigInteger(), server_default=None)
+    op.execute(f"INSERT INTO {STAGING_TABLE} SELECT * FROM events")
+    op.drop_table('events')
+    op.rename_table(STAGING_TABLE, 'events')
+
+    op.execute("ALTER TABLE events ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY (CACHE 100)")
+    op.execute("SELECT setval(pg_get_serial_sequence('events', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM events")
+    op.create_primary_key('events_pkey', 'events', ['id'])
+    _create_indexes(SIGNATURE_COLUMNS)
@@ -0,0 +1,29 @@
+"""drop_earnings_history_amount_index
+
+Revision ID: 9a6d3e1b7c42
+Revises: 4e8b2c7a9f15
+Create Date: 2026-10-18 18:34:52.219078
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a6d3e1b7c42'
+down_revision: Union[str, None] = '4e8b2c7a9f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_earnings_history_amount', table_name='earnings_history', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('idx_earnings_history_amount', 'earnings_history', ['amount'], unique=False, postgresql_concurrently=True)
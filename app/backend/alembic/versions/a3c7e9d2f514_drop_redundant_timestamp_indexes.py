@@ -0,0 +1,44 @@
+"""drop_redundant_timestamp_indexes
+
+Revision ID: a3c7e9d2f514
+Revises: 6f2a9c4e1b58
+Create Date: 2026-10-18 19:58:12.690347
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e9d2f514'
+down_revision: Union[str, None] = '6f2a9c4e1b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# TimestampMixin tables whose updated_at index nothing filters or sorts on
+# (players keeps ix_players_updated_at)
+UPDATED_AT_TABLES = (
+    'business_slots', 'businesses', 'earnings_history', 'events',
+    'player_prestige_stats', 'player_quest_progress', 'prestige_actions',
+    'prestige_config', 'prestige_history', 'prestige_levels',
+    'quest_categories', 'quest_rewards', 'quest_templates', 'quests',
+    'referral_codes', 'referral_commissions', 'referral_config',
+    'referral_relations', 'referral_stats', 'referral_withdrawals', 'users',
+)
+
+
+def upgrade() -> None:
+    # Same column as ix_players_created_at
+    op.drop_index('idx_player_created_at', table_name='players', if_exists=True)
+    for table in UPDATED_AT_TABLES:
+        op.drop_index(f'ix_{table}_updated_at', table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in UPDATED_AT_TABLES:
+        if inspector.has_table(table):
+            op.create_index(f'ix_{table}_updated_at', table, ['updated_at'], unique=False)
+    op.create_index('idx_player_created_at', 'players', ['created_at'], unique=False)
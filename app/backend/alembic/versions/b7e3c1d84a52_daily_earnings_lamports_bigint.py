@@ -0,0 +1,47 @@
+"""daily_earnings_lamports_bigint
+
+Revision ID: b7e3c1d84a52
+Revises: 5a9d0e6c2f41
+Create Date: 2026-10-18 16:07:54.630881
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3c1d84a52'
+down_revision: Union[str, None] = '5a9d0e6c2f41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Table is created outside migrations (see 13b18bbcdc60)
+    if not sa.inspect(op.get_bind()).has_table('player_daily_earnings_status'):
+        return
+    op.alter_column('player_daily_earnings_status', 'expected_earnings_lamports',
+               existing_type=sa.Integer(),
+               type_=sa.BigInteger(),
+               existing_nullable=False,
+               postgresql_using='expected_earnings_lamports::bigint')
+    op.alter_column('player_daily_earnings_status', 'actual_earnings_applied',
+               existing_type=sa.Integer(),
+               type_=sa.BigInteger(),
+               existing_nullable=True,
+               postgresql_using='actual_earnings_applied::bigint')
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('player_daily_earnings_status'):
+        return
+    op.alter_column('player_daily_earnings_status', 'actual_earnings_applied',
+               existing_type=sa.BigInteger(),
+               type_=sa.Integer(),
+               existing_nullable=True)
+    op.alter_column('player_daily_earnings_status', 'expected_earnings_lamports',
+               existing_type=sa.BigInteger(),
+               type_=sa.Integer(),
+               existing_nullable=False)
@@ -0,0 +1,38 @@
+"""bigint_identity_event_ids
+
+Revision ID: c5f1a8e3d296
+Revises: 9a6d3e1b7c42
+Create Date: 2026-10-18 18:52:16.804413
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f1a8e3d296'
+down_revision: Union[str, None] = '9a6d3e1b7c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('events', 'earnings_history')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        # SERIAL -> BIGINT identity, continuing after the existing ids
+        op.alter_column(table, 'id', existing_type=sa.Integer(), type_=sa.BigInteger(), server_default=None)
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY (CACHE 100)")
+        op.execute(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {table}")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY")
+        op.alter_column(table, 'id', existing_type=sa.BigInteger(), type_=sa.Integer())
+        op.execute(f"CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(f"SELECT setval('{table}_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {table}")
+        op.alter_column(table, 'id', existing_type=sa.Integer(), server_default=sa.text(f"nextval('{table}_id_seq'::regclass)"))
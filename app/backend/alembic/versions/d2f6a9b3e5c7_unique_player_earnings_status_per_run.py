@@ -0,0 +1,31 @@
+"""unique_player_earnings_status_per_run
+
+Revision ID: d2f6a9b3e5c7
+Revises: b7e3c1d84a52
+Create Date: 2026-10-18 16:21:09.482716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f6a9b3e5c7'
+down_revision: Union[str, None] = 'b7e3c1d84a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Table is created outside migrations (see 13b18bbcdc60)
+    if not sa.inspect(op.get_bind()).has_table('player_daily_earnings_status'):
+        return
+    op.create_index('uq_player_earnings_status_run_player', 'player_daily_earnings_status', ['earnings_run_id', 'player_wallet'], unique=True)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('player_daily_earnings_status'):
+        return
+    op.drop_index('uq_player_earnings_status_run_player', table_name='player_daily_earnings_status')
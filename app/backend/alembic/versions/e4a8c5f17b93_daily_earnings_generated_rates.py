@@ -0,0 +1,35 @@
+"""daily_earnings_generated_rates
+
+Revision ID: e4a8c5f17b93
+Revises: d2f6a9b3e5c7
+Create Date: 2026-10-18 16:36:48.205573
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a8c5f17b93'
+down_revision: Union[str, None] = 'd2f6a9b3e5c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are created outside migrations (see 13b18bbcdc60)
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('daily_earnings_runs'):
+        op.add_column('daily_earnings_runs', sa.Column('success_rate', sa.Float(), sa.Computed("CASE WHEN total_players_found = 0 THEN 0 ELSE players_processed * 100.0 / total_players_found END", persisted=True), nullable=True, comment='Success rate as percentage (generated)'))
+    if inspector.has_table('player_daily_earnings_status'):
+        op.add_column('player_daily_earnings_status', sa.Column('earnings_variance_percentage', sa.Float(), sa.Computed("CASE WHEN expected_earnings_lamports = 0 OR COALESCE(actual_earnings_applied, 0) = 0 THEN 0 ELSE abs(expected_earnings_lamports - actual_earnings_applied) * 100.0 / expected_earnings_lamports END", persisted=True), nullable=True, comment='Variance between expected and actual earnings as percentage (generated)'))
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('player_daily_earnings_status'):
+        op.drop_column('player_daily_earnings_status', 'earnings_variance_percentage')
+    if inspector.has_table('daily_earnings_runs'):
+        op.drop_column('daily_earnings_runs', 'success_rate')
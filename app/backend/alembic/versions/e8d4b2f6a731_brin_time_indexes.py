@@ -0,0 +1,40 @@
+"""brin_time_indexes
+
+Revision ID: e8d4b2f6a731
+Revises: c5f1a8e3d296
+Create Date: 2026-10-18 19:07:38.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8d4b2f6a731'
+down_revision: Union[str, None] = 'c5f1a8e3d296'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index('idx_event_block_time_brin', 'events', ['block_time'], unique=False, postgresql_using='brin', postgresql_with={'pages_per_range': 32}, postgresql_concurrently=True)
+        op.create_index('idx_event_created_brin', 'events', ['created_at'], unique=False, postgresql_using='brin', postgresql_concurrently=True)
+        op.create_index('idx_earnings_history_created_brin', 'earnings_history', ['created_at'], unique=False, postgresql_using='brin', postgresql_concurrently=True)
+        op.drop_index('idx_event_block_time', table_name='events', postgresql_concurrently=True, if_exists=True)
+        # The BRIN indexes replace the TimestampMixin created_at B-trees
+        op.drop_index('ix_events_created_at', table_name='events', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_earnings_history_created_at', table_name='earnings_history', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_earnings_history_created_at', 'earnings_history', ['created_at'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_events_created_at', 'events', ['created_at'], unique=False, postgresql_concurrently=True)
+        op.create_index('idx_event_block_time', 'events', ['block_time'], unique=False, postgresql_concurrently=True)
+        op.drop_index('idx_earnings_history_created_brin', table_name='earnings_history', postgresql_concurrently=True)
+        op.drop_index('idx_event_created_brin', table_name='events', postgresql_concurrently=True)
+        op.drop_index('idx_event_block_time_brin', table_name='events', postgresql_concurrently=True)
@@ -0,0 +1,65 @@
+"""player_earnings_status_wallet_bytea
+
+Revision ID: f1c7b2e9d046
+Revises: e4a8c5f17b93
+Create Date: 2026-10-18 17:02:15.738460
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import base58
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c7b2e9d046'
+down_revision: Union[str, None] = 'e4a8c5f17b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = 'player_daily_earnings_status'
+
+
+def _create_wallet_indexes() -> None:
+    op.create_index('idx_player_earnings_status_player_date', TABLE, ['player_wallet', 'earnings_date'], unique=False)
+    op.create_index('idx_player_earnings_status_pending', TABLE, ['earnings_date', 'player_wallet'], unique=False, postgresql_where=sa.text("status = 'pending'"))
+    op.create_index('uq_player_earnings_status_run_player', TABLE, ['earnings_run_id', 'player_wallet'], unique=True)
+
+
+def _replace_wallet_column(new_type: sa.types.TypeEngine, convert) -> None:
+    """Swap player_wallet for a column of new_type, converting each distinct wallet in Python."""
+    bind = op.get_bind()
+    op.add_column(TABLE, sa.Column('player_wallet_new', new_type, nullable=True))
+    
+    wallets = bind.execute(sa.text(f'SELECT DISTINCT player_wallet FROM {TABLE}')).scalars().all()
+    for wallet in wallets:
+        bind.execute(
+            sa.text(f'UPDATE {TABLE} SET player_wallet_new = :new WHERE player_wallet = :old'),
+            {'new': convert(wallet), 'old': wallet}
+        )
+    
+    # Dropping the column drops the indexes on it
+    op.drop_column(TABLE, 'player_wallet')
+    op.alter_column(TABLE, 'player_wallet_new', new_column_name='player_wallet', nullable=False)
+    _create_wallet_indexes()
+
+
+def _wallet_to_bytes(wallet: str) -> bytes:
+    raw = base58.b58decode(wallet)
+    if len(raw) != 32:
+        raise ValueError(f'Invalid wallet address in {TABLE}: {wallet}')
+    return raw
+
+
+def upgrade() -> None:
+    # Table is created outside migrations (see 13b18bbcdc60)
+    if not sa.inspect(op.get_bind()).has_table(TABLE):
+        return
+    _replace_wallet_column(sa.LargeBinary(length=32), _wallet_to_bytes)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table(TABLE):
+        return
+    _replace_wallet_column(sa.String(length=44), lambda raw: base58.b58encode(bytes(raw)).decode())
@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db_session
 from app.core.config import settings
 from app.websocket.connection_manager import connection_manager
-from app.models.event import Event
+from app.models.event import Event, EventType
 from app.models.player import Player
 from app.models.business import Business
 
@@ -21,6 +21,9 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# events.event_type holds SMALLINT codes; raw SQL binds and decodes them with this
+EVENT_TYPE_CODES = Event.__table__.c.event_type.type
+
 
 @dataclass
 class SystemMetrics:
@@ -272,7 +275,9 @@ class MonitoringService:
                     ORDER BY count DESC
                 """), {"yesterday": yesterday})
                 
-                events_by_type = {row[0]: row[1] for row in result.fetchall()}
+                events_by_type = {
+                    EVENT_TYPE_CODES.member(row[0]).value: row[1] for row in result.fetchall()
+                }
                 
                 # Events processing rate (events per hour for last 24h)
                 result = await db.execute(text("""
@@ -343,9 +348,9 @@ class MonitoringService:
                 result = await db.execute(text("""
                     SELECT COUNT(*)
                     FROM events
-                    WHERE event_type = 'EarningsUpdated' 
+                    WHERE event_type = :event_type
                     AND created_at > :yesterday
-                """), {"yesterday": yesterday})
+                """), {"yesterday": yesterday, "event_type": EVENT_TYPE_CODES.code(EventType.EARNINGS_UPDATED)})
                 
                 earnings_updates_24h = result.scalar() or 0
                 
@@ -353,9 +358,9 @@ class MonitoringService:
                 result = await db.execute(text("""
                     SELECT COUNT(*)
                     FROM events
-                    WHERE event_type = 'EarningsClaimed' 
+                    WHERE event_type = :event_type
                     AND created_at > :yesterday
-                """), {"yesterday": yesterday})
+                """), {"yesterday": yesterday, "event_type": EVENT_TYPE_CODES.code(EventType.EARNINGS_CLAIMED)})
                 
                 earnings_claims_24h = result.scalar() or 0
                 
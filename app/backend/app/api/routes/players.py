@@ -160,9 +160,9 @@ async def get_player_profile(
         points_needed, progress_percentage = player.prestige_progress_to_next
         
         # Calculate enhanced net profit information
-        liquidation_value = player.calculate_business_liquidation_value()
+        liquidation_value = await Player.get_business_liquidation_value(db, player.wallet)
         net_profit_old = player.total_earned - (player.total_invested + player.total_upgrade_spent + player.total_slot_spent)
-        net_profit_new = player.net_profit  # Includes liquidation value but NOT pending earnings (to avoid double counting)
+        net_profit_new = player.calculate_net_profit(liquidation_value)  # Includes liquidation value but NOT pending earnings (to avoid double counting)
         
         # Return simple response without complex validation
         player_data = {
@@ -1110,9 +1110,9 @@ async def get_complete_player_profile(
         last_activity = last_activity_result.scalar_one_or_none()
         
         # Calculate liquidation value and detailed breakdown
-        liquidation_value = player.calculate_business_liquidation_value()
+        liquidation_value = await Player.get_business_liquidation_value(db, player.wallet)
         net_profit_old = player.total_earned - (player.total_invested + player.total_upgrade_spent + player.total_slot_spent)
-        net_profit_new = player.net_profit  # Includes liquidation value but NOT pending earnings (to avoid double counting)
+        net_profit_new = player.calculate_net_profit(liquidation_value)  # Includes liquidation value but NOT pending earnings (to avoid double counting)
         
         # Build complete profile
         complete_profile = {
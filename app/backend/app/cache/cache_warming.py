@@ -18,6 +18,9 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Weight of the latest run in a task's average duration (EWMA, alpha = 1/8)
+DURATION_EWMA_ALPHA = 0.125
+
 
 class WarmingPriority(str, Enum):
     """Priority levels for cache warming."""
@@ -48,7 +51,7 @@ class WarmingTask:
     last_run: Optional[datetime] = None
     success_count: int = 0
     error_count: int = 0
-    average_duration: float = 0.0
+    average_duration: float = 0.0  # EWMA of successful runs, seconds
     
     def __post_init__(self):
         if self.dependencies is None:
@@ -224,10 +227,11 @@ class CacheWarmingManager:
                 # Update task metrics
                 task.last_run = task_start
                 task.success_count += 1
-                task.average_duration = (
-                    (task.average_duration * (task.success_count - 1) + duration) / 
-                    task.success_count
-                )
+                if task.success_count == 1:
+                    task.average_duration = duration
+                else:
+                    # Recent runs dominate, so slowdowns show up after a few runs
+                    task.average_duration += (duration - task.average_duration) * DURATION_EWMA_ALPHA
                 
                 results[task.name] = {
                     "success": True,
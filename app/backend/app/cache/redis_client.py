@@ -241,6 +241,20 @@ class RedisClient:
             return []
     
     # Pattern operations
+    # Pub/Sub operations
+    async def publish(self, channel: str, message: Union[str, bytes]) -> int:
+        """
+        Publish a message; returns the number of subscribers that received it.
+        
+        Unlike the other commands this re-raises on failure, so a lost
+        notification is never reported as delivered to nobody.
+        """
+        try:
+            return await self.client.publish(channel, message)
+        except Exception as e:
+            logger.error("Redis PUBLISH failed", channel=channel, error=str(e))
+            raise
+    
     async def keys(self, pattern: str = "*") -> List[str]:
         """Get keys matching pattern."""
         try:
@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     api_v1_prefix: str = "/api/v1"
     host: str = "127.0.0.1"
     port: int = 8000
+    workers: int = 1  # uvicorn worker processes outside debug
     site_domain: str = Field(
         default="localhost",
         env="SITE_DOMAIN",
@@ -38,6 +39,9 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = 10
     database_max_overflow: int = 20
+    database_pool_timeout: int = 5  # seconds to wait for a free connection
+    database_pool_recycle: int = 1800  # seconds
+    health_db_timeout_s: float = 0.5  # seconds, health endpoint DB probe
     
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
@@ -61,6 +65,8 @@ class Settings(BaseSettings):
         env="SOLANA_PROGRAM_ID"
     )
     solana_commitment: str = "confirmed"
+    solana_rpc_max_connections: int = 64
+    solana_rpc_keepalive_expiry: int = 300  # seconds
     
     # Admin wallet for price updates
     admin_private_key: Optional[str] = Field(
@@ -95,6 +101,7 @@ class Settings(BaseSettings):
     websocket_enabled: bool = True
     websocket_host: str = "127.0.0.1"
     websocket_port: int = 8001
+    ws_max_connections: int = 1000  # per API process
     
     # Telegram Mini Apps
     telegram_bot_token: Optional[str] = Field(
@@ -222,7 +229,10 @@ class DatabaseConfig:
             "pool_size": settings.database_pool_size,
             "max_overflow": settings.database_max_overflow,
             "pool_pre_ping": True,
-            "pool_recycle": 3600,
+            "pool_recycle": settings.database_pool_recycle,
+            "pool_timeout": settings.database_pool_timeout,
+            # Compiled statement cache (default 500) sized for the app's statement shapes
+            "query_cache_size": 1200,
         }
 
 
@@ -254,6 +264,9 @@ class SolanaConfig:
             "endpoint": settings.solana_rpc_url,
             "commitment": settings.solana_commitment,
             "timeout": 30,
+            "connect_timeout": 2,
+            "max_connections": settings.solana_rpc_max_connections,
+            "keepalive_expiry": settings.solana_rpc_keepalive_expiry,
         }
     
     @staticmethod
@@ -3,9 +3,11 @@ Database configuration and session management.
 Uses SQLAlchemy 2.0 with async support.
 """
 
-from typing import AsyncGenerator
+import json
+from typing import Any, AsyncGenerator
 from contextlib import asynccontextmanager
 
+import orjson
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -27,6 +29,15 @@ sync_engine = None
 sync_session_maker = None
 
 
+def json_serializer(value: Any) -> str:
+    """Serialize JSON columns with orjson, falling back to stdlib json."""
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # orjson rejects integers wider than 64 bits and unknown types
+        return json.dumps(value)
+
+
 async def init_database() -> None:
     """Initialize database connections and session makers."""
     global async_engine, async_session_maker, sync_engine, sync_session_maker
@@ -37,6 +48,8 @@ async def init_database() -> None:
     async_engine = create_async_engine(
         DatabaseConfig.get_database_url(async_driver=True),
         **DatabaseConfig.get_engine_config(),
+        json_serializer=json_serializer,
+        json_deserializer=orjson.loads,
         echo=settings.debug
     )
     
@@ -50,6 +63,8 @@ async def init_database() -> None:
     sync_engine = create_engine(
         DatabaseConfig.get_database_url(async_driver=False),
         **DatabaseConfig.get_engine_config(),
+        json_serializer=json_serializer,
+        json_deserializer=orjson.loads,
         echo=settings.debug
     )
     
@@ -61,6 +76,17 @@ async def init_database() -> None:
     logger.info("Database connections initialized")
 
 
+async def warm_up_database() -> None:
+    """Open the first pooled connection so startup fails fast on an unreachable database."""
+    if not async_engine:
+        raise RuntimeError("Database not initialized. Call init_database() first.")
+    
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    
+    logger.info("Database connection pool ready")
+
+
 async def close_database() -> None:
     """Close database connections."""
     global async_engine, sync_engine
@@ -136,6 +162,7 @@ class DatabaseManager:
     async def create_tables() -> None:
         """Create all tables in the database."""
         from app.models.base import Base
+        from app.models.event import Event
         
         if not async_engine:
             raise RuntimeError("Database not initialized")
@@ -143,6 +170,8 @@ class DatabaseManager:
         logger.info("Creating database tables")
         async with async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            # events is partitioned and takes no rows until partitions exist
+            await Event.ensure_partitions(conn)
         logger.info("Database tables created")
     
     @staticmethod
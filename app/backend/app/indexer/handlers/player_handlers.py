@@ -5,7 +5,8 @@ Event handlers for player-related events.
 from datetime import datetime
 
 import structlog
-from sqlalchemy import select, update
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.event_parser import ParsedEvent
@@ -30,33 +31,29 @@ class PlayerHandlers:
         try:
             data = event.data
             
-            # Check if player already exists
+            # Create new player; ON CONFLICT replaces the existence check, so
+            # the same PlayerCreated handled twice concurrently can't double-insert
             result = await db.execute(
-                select(Player).where(Player.wallet == data["wallet"])
+                pg_insert(Player).values(
+                    wallet=data["wallet"],
+                    referrer_wallet=data.get("referrer"),
+                    unlocked_slots_count=data.get("slots_unlocked", 3),  # Fixed field name
+                    total_invested=0,
+                    total_earned=0,
+                    pending_earnings=0,  # Fixed field name
+                    has_paid_entry=True,  # ✅ КЛЮЧЕВОЕ ИСПРАВЛЕНИЕ - игрок заплатил entry fee
+                    is_active=True,
+                    last_earnings_update=event.block_time or datetime.utcnow(),
+                    on_chain_created_at=event.block_time or datetime.utcnow(),
+                    created_at=event.block_time or datetime.utcnow(),
+                    updated_at=event.block_time or datetime.utcnow()
+                ).on_conflict_do_nothing(index_elements=["wallet"])
             )
-            existing_player = result.scalar_one_or_none()
             
-            if existing_player:
+            if result.rowcount == 0:
                 self.logger.debug("Player already exists", wallet=data["wallet"])
                 return
-                
-            # Create new player
-            player = Player(
-                wallet=data["wallet"],
-                referrer_wallet=data.get("referrer"),
-                unlocked_slots_count=data.get("slots_unlocked", 3),  # Fixed field name
-                total_invested=0,
-                total_earned=0,
-                pending_earnings=0,  # Fixed field name
-                has_paid_entry=True,  # ✅ КЛЮЧЕВОЕ ИСПРАВЛЕНИЕ - игрок заплатил entry fee
-                is_active=True,
-                last_earnings_update=event.block_time or datetime.utcnow(),
-                on_chain_created_at=event.block_time or datetime.utcnow(),
-                created_at=event.block_time or datetime.utcnow(),
-                updated_at=event.block_time or datetime.utcnow()
-            )
             
-            db.add(player)
             self.stats.players_created += 1
             
             # Note: No earnings schedule needed in permissionless architecture
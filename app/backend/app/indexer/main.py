@@ -11,7 +11,7 @@ from typing import Dict, Any
 from app.core.config import settings
 from app.core.database import get_db_session, init_database
 from app.core.logging import setup_logging
-from .simple_realtime_notifier import SimpleRealtimeNotifier
+from .simple_realtime_notifier import ensure_started
 
 import structlog
 
@@ -43,8 +43,7 @@ class IndexerMain:
             await init_database()
             
             # Initialize simple real-time notifier (UI only)
-            self.simple_notifier = SimpleRealtimeNotifier()
-            await self.simple_notifier.initialize()
+            self.simple_notifier = await ensure_started()
             
             logger.info("✅ Simplified indexer service initialized successfully")
             
@@ -162,4 +161,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop outside development; must be set before asyncio.run creates the loop
+    if not settings.is_development:
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            logger.warning("uvloop not installed, using default asyncio event loop")
     asyncio.run(main())
\ No newline at end of file
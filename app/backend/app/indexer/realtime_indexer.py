@@ -4,21 +4,24 @@ Replaces batch processing with instant WebSocket subscriptions.
 """
 
 import asyncio
+import itertools
 import json
+import logging
 from typing import Dict, List, Optional, Callable, Any
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 
 import websockets
 import structlog
+from cachetools import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_session
 from app.core.config import settings
 from app.core.exceptions import IndexerError
 from app.services.event_parser import get_event_parser, ParsedEvent
-from app.services.solana_client import get_solana_client
-from app.models.event import Event, EventType as DBEventType
+from app.services.solana_client import get_solana_client, SolanaClient
+from app.models.event import Event, EventType as DBEventType, EVENT_UNIQUE_KEY
 from app.websocket.notification_service import NotificationService
 from app.indexer.handlers.business_handlers import BusinessHandlers
 from app.indexer.handlers.earnings_handlers import EarningsHandlers  
@@ -27,8 +30,76 @@ from app.indexer.handlers.player_handlers import PlayerHandlers
 
 logger = structlog.get_logger(__name__)
 
+# Window for dropping duplicate signatures (program + logs notifications,
+# redelivery after reconnect)
+SEEN_SIGNATURES_MAXSIZE = 50_000
+SEEN_SIGNATURES_TTL = 300  # seconds
 
-@dataclass 
+# WebSocket client tuning: no per-message deflate, keepalive pings to detect
+# dead peers, and larger buffers for notification bursts
+WEBSOCKET_CONNECT_OPTIONS = {
+    "compression": None,
+    "max_queue": 2 ** 16,
+    "ping_interval": 20,
+    "ping_timeout": 20,
+    "read_limit": 2 ** 20,
+    "write_limit": 2 ** 20,
+}
+
+# Reconnect backoff: 0.5s doubling per attempt, capped at 30s
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30
+
+# Parser event names -> database event types
+DB_EVENT_TYPE_MAPPING = {
+    "BusinessCreated": DBEventType.BUSINESS_CREATED,
+    "BusinessCreatedInSlot": DBEventType.BUSINESS_CREATED,  # Slot version
+    "BusinessUpgraded": DBEventType.BUSINESS_UPGRADED,
+    "BusinessSold": DBEventType.BUSINESS_SOLD,
+    "BusinessSoldFromSlot": DBEventType.BUSINESS_SOLD,  # Slot version
+    "PlayerCreated": DBEventType.PLAYER_CREATED,
+    "EarningsUpdated": DBEventType.EARNINGS_UPDATED,
+    "EarningsClaimed": DBEventType.EARNINGS_CLAIMED,
+}
+
+# Solana replaces the tail of over-long log output with this line
+LOG_TRUNCATED_MARKER = "Log truncated"
+
+# Subscription requests are constant for the lifetime of the process (the
+# program id is fixed at startup), so serialize them once and resend the same
+# frame on every (re)connect.
+PROGRAM_SUBSCRIBE_REQUEST = json.dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "programSubscribe",
+    "params": [
+        settings.solana_program_id,  # Our program ID
+        {
+            "commitment": "confirmed",
+            "encoding": "base64"
+        }
+    ]
+})
+
+LOGS_SUBSCRIBE_REQUEST = json.dumps({
+    "jsonrpc": "2.0",
+    "id": 2,
+    "method": "logsSubscribe",
+    "params": [
+        {"mentions": [settings.solana_program_id]},  # Filter by our program
+        {
+            "commitment": "confirmed"
+        }
+    ]
+})
+
+UNSUBSCRIBE_METHODS = {
+    "program": "programUnsubscribe",
+    "logs": "logsUnsubscribe",
+}
+
+
+@dataclass(slots=True)
 class RealtimeStats:
     """Statistics for real-time indexing."""
     events_processed: int = 0
@@ -46,6 +117,11 @@ class RealtimeStats:
     earnings_claimed: int = 0
 
 
+# Field names resolved once; the health check reads attributes directly
+# instead of deep-copying through asdict()
+_STAT_FIELDS = tuple(f.name for f in fields(RealtimeStats))
+
+
 class RealTimeIndexer:
     """
     Real-time indexer using WebSocket subscriptions for instant event processing.
@@ -62,19 +138,29 @@ class RealTimeIndexer:
         self.logger = logger.bind(service="realtime_indexer")
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.event_parser = get_event_parser()
-        self.solana_client = get_solana_client()  # 🔧 Добавляем SolanaClient для RPC запросов
+        self.solana_client: Optional[SolanaClient] = None  # shared singleton, resolved in initialize()
         self.notification_service: Optional[NotificationService] = None
         self.stats = RealtimeStats()
         self._running = False
         self._should_stop = False
         self._subscriptions: Dict[str, int] = {}  # subscription_type -> subscription_id
         self._tasks: List[asyncio.Task] = []
+        self._debug = False
+        self._seen_signatures: TTLCache = TTLCache(
+            maxsize=SEEN_SIGNATURES_MAXSIZE, ttl=SEEN_SIGNATURES_TTL
+        )
     
     async def initialize(self):
         """Initialize the real-time indexer."""
         try:
             self.logger.info("Initializing real-time indexer")
             
+            # Resolve DEBUG level once so per-message logging costs nothing at INFO
+            self._debug = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+            
+            # Reuse the process-wide RPC client (and its pooled HTTP session)
+            self.solana_client = await get_solana_client()
+            
             # Initialize notification service for WebSocket updates
             from app.websocket.notification_service import get_notification_service
             self.notification_service = get_notification_service()
@@ -161,7 +247,7 @@ class RealTimeIndexer:
             ws_url = settings.solana_ws_url
             self.logger.info("Connecting to Solana WebSocket", url=ws_url)
             
-            self.websocket = await websockets.connect(ws_url)
+            self.websocket = await websockets.connect(ws_url, **WEBSOCKET_CONNECT_OPTIONS)
             
             self.logger.info("✅ Connected to Solana WebSocket successfully")
             
@@ -174,21 +260,7 @@ class RealTimeIndexer:
         try:
             self.logger.info("📡 Sending program account subscription request")
             
-            # programSubscribe request
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "programSubscribe",
-                "params": [
-                    settings.solana_program_id,  # Our program ID
-                    {
-                        "commitment": "confirmed",
-                        "encoding": "base64"
-                    }
-                ]
-            }
-            
-            await self.websocket.send(json.dumps(request))
+            await self.websocket.send(PROGRAM_SUBSCRIBE_REQUEST)
             self.logger.info("📤 Program subscription request sent")
                 
         except Exception as e:
@@ -200,20 +272,7 @@ class RealTimeIndexer:
         try:
             self.logger.info("📡 Sending program logs subscription request")
             
-            # logsSubscribe request - filter by our program
-            request = {
-                "jsonrpc": "2.0", 
-                "id": 2,
-                "method": "logsSubscribe",
-                "params": [
-                    {"mentions": [settings.solana_program_id]},  # Filter by our program
-                    {
-                        "commitment": "confirmed"
-                    }
-                ]
-            }
-            
-            await self.websocket.send(json.dumps(request))
+            await self.websocket.send(LOGS_SUBSCRIBE_REQUEST)
             self.logger.info("📤 Logs subscription request sent")
                 
         except Exception as e:
@@ -230,20 +289,19 @@ class RealTimeIndexer:
                 message = await self.websocket.recv()
                 message_data = json.loads(message)
                 
-                # DEBUG: Log ALL incoming messages
-                self.logger.info("📨 Received WebSocket message", 
-                               method=message_data.get("method"), 
-                               has_params=bool(message_data.get("params")),
-                               message_keys=list(message_data.keys()))
+                if self._debug:
+                    self.logger.debug("📨 Received WebSocket message",
+                                      method=message_data.get("method"),
+                                      has_params=bool(message_data.get("params")),
+                                      message_keys=list(message_data.keys()))
                 
                 # Check if it's a subscription response
                 if "id" in message_data and "result" in message_data:
                     await self._handle_subscription_response(message_data)
                 # Check if it's a subscription notification
                 elif "method" in message_data and "params" in message_data:
-                    self.logger.info("🎯 Processing subscription notification", method=message_data.get("method"))
                     await self._handle_subscription_notification(message_data)
-                else:
+                elif self._debug:
                     self.logger.debug("📝 Non-notification message", message_data=message_data)
                 
             except websockets.exceptions.ConnectionClosed:
@@ -290,20 +348,18 @@ class RealTimeIndexer:
             method = message_data.get("method")
             params = message_data.get("params", {})
             
-            # 🔍 ENHANCED DEBUG: Log ALL subscription notifications
-            self.logger.info("🎯 Processing subscription notification", 
-                           method=method, 
-                           has_params=bool(params),
-                           params_keys=list(params.keys()) if params else [])
+            if self._debug:
+                self.logger.debug("🎯 Processing subscription notification",
+                                  method=method,
+                                  has_params=bool(params),
+                                  params_keys=list(params.keys()) if params else [])
             
             if method == "programNotification":
-                self.logger.info("📋 Handling program notification")
                 await self._handle_program_notification(params)
             elif method == "logsNotification":
-                self.logger.info("📋 Handling logs notification") 
                 await self._handle_logs_notification(params)
-            else:
-                self.logger.info(f"🤷 Unknown notification method: {method}")
+            elif self._debug:
+                self.logger.debug("🤷 Unknown notification method", method=method)
             
         except Exception as e:
             self.logger.error("Error handling subscription notification", error=str(e))
@@ -318,7 +374,8 @@ class RealTimeIndexer:
             account_info = result.get("value", {})
             pubkey = result.get("pubkey")
             
-            self.logger.info("🔄 Program account changed", pubkey=pubkey)
+            if self._debug:
+                self.logger.debug("🔄 Program account changed", pubkey=pubkey)
             
             # Here you could decode account data and trigger specific events
             # For now, we rely more on logs for event parsing
@@ -329,39 +386,30 @@ class RealTimeIndexer:
     
     async def _handle_logs_notification(self, params: Dict):
         """Handle logs notification and parse events."""
+        signature = None
         try:
             subscription_id = params.get("subscription")
             result = params.get("result", {})
             
-            # 🔍 ДЕТАЛЬНОЕ ЛОГИРОВАНИЕ
-            self.logger.info(f"🔍 DEBUG logs notification raw params", 
-                            subscription_id=subscription_id,
-                            has_result=bool(result),
-                            result_keys=list(result.keys()) if result else [])
-            
             value = result.get("value", {})
             logs = value.get("logs", [])
             signature = value.get("signature")
-            slot = value.get("slot")
+            slot = value.get("slot") or result.get("context", {}).get("slot")
             block_time = value.get("blockTime")
             err = value.get("err")
             
-            # 🔍 ДЕТАЛЬНОЕ ЛОГИРОВАНИЕ параметров
-            self.logger.info(f"🔍 DEBUG extracted values", 
-                            signature=signature,
-                            slot=slot, 
-                            logs_count=len(logs) if logs else 0,
-                            has_error=bool(err))
-            
-            # 🔍 LOG ALL SIGNATURES: Log every signature we receive via WebSocket
-            if signature:
-                self.logger.info(f"📝 WebSocket received transaction", signature=signature[:20] + "...")
-            else:
-                self.logger.warning(f"📝 WebSocket notification with NO signature", value_keys=list(value.keys()) if value else [])
+            if self._debug:
+                self.logger.debug("🔍 Logs notification received",
+                                  subscription_id=subscription_id,
+                                  signature=signature,
+                                  slot=slot,
+                                  logs_count=len(logs) if logs else 0,
+                                  has_error=bool(err))
             
             # Skip failed transactions
             if err:
-                self.logger.debug("Skipping failed transaction", signature=signature, error=err)
+                if self._debug:
+                    self.logger.debug("Skipping failed transaction", signature=signature, error=err)
                 return
             
             # 🔍 ПРОВЕРЯЕМ signature
@@ -371,56 +419,104 @@ class RealTimeIndexer:
                                   raw_value=value)
                 return
             
-            self.logger.info(f"🎯 Processing real-time logs", signature=signature, slot=slot)
-            
-            # 🔍 EXTRA DEBUG: Check if signature matches our target
-            if signature in ["4JArkZW4G3TsFEsS9Ebz2FpP6VuhoEtLM2m95vNY6e3j9zwRj53eKmWq8P8oQ88FmAtxnL6q92zqZmsTBb6AoPjG", 
-                           "3XRfta7u6JBELdUf1u7tbv5nFRBzCNYu9CYRoskLBo4ZxrLeTa9qz3M9yDniqL9qrDsNMQeTbrL16gsAVa218xiE"]:
-                self.logger.info(f"🎯🎯 FOUND TARGET TRANSACTION!", signature=signature)
-            
-            # 🔧 ИСПРАВЛЕНИЕ: WebSocket логи truncated - получаем полную транзакцию через RPC
-            self.logger.info(f"📡 Fetching full transaction for real-time processing", signature=signature)
-            
-            try:
-                # Получаем полную транзакцию через RPC (как в force_process_transaction)
-                tx_info = await self.solana_client.get_transaction(signature)
-                if not tx_info:
-                    self.logger.warning(f"⚠️ Could not fetch transaction for real-time processing", signature=signature)
-                    return
-                
-                # Парсим события из instruction data (не из логов!)
-                parsed_events = self.event_parser.parse_transaction_events(tx_info)
-                self.logger.info(f"✅ Parsed {len(parsed_events)} events from RPC transaction", signature=signature)
-                
-            except Exception as e:
-                self.logger.error(f"❌ Failed to fetch/parse RPC transaction for real-time", 
-                                signature=signature, error=str(e))
-                # Fallback к старому методу парсинга логов
-                parsed_events = self.event_parser.parse_logs_for_events(
-                    logs=logs,
-                    signature=signature,
-                    slot=slot,
-                    block_time=block_time
-                )
-                self.logger.info(f"📊 Fallback: Found {len(parsed_events)} events from WebSocket logs", signature=signature)
+            # Drop duplicates before any RPC/DB work. Check-and-set has no await
+            # in between, so it is atomic on the event loop.
+            if signature in self._seen_signatures:
+                if self._debug:
+                    self.logger.debug("Skipping duplicate signature", signature=signature)
+                return
+            self._seen_signatures[signature] = None
+            
+            # Try the WebSocket logs first: when every event was fully decoded
+            # from its Borsh blob, the RPC round-trip adds nothing
+            log_events = self.event_parser.parse_logs_for_events(
+                logs=logs,
+                signature=signature,
+                slot=slot,
+                block_time=block_time
+            )
+            
+            if self._logs_are_complete(logs, log_events):
+                parsed_events = log_events
+                if self._debug:
+                    self.logger.debug("⚡ Parsed complete events from WebSocket logs",
+                                      signature=signature, events_count=len(parsed_events))
+            else:
+                # 🔧 ИСПРАВЛЕНИЕ: WebSocket логи truncated - получаем полную транзакцию через RPC
+                try:
+                    # Получаем полную транзакцию через RPC (как в force_process_transaction)
+                    tx_info = await self.solana_client.get_transaction(signature)
+                    if not tx_info:
+                        self.logger.warning("⚠️ Could not fetch transaction for real-time processing", signature=signature)
+                        return
+                    
+                    # Парсим события из instruction data (не из логов!)
+                    parsed_events = self.event_parser.parse_transaction_events(tx_info)
+                    if self._debug:
+                        self.logger.debug("✅ Parsed events from RPC transaction",
+                                          signature=signature, events_count=len(parsed_events))
+                    
+                except Exception as e:
+                    self.logger.error("❌ Failed to fetch/parse RPC transaction for real-time",
+                                    signature=signature, error=str(e))
+                    # Fallback к событиям из логов WebSocket
+                    parsed_events = log_events
+                    if self._debug:
+                        self.logger.debug("📊 Fallback: parsed events from WebSocket logs",
+                                          signature=signature, events_count=len(parsed_events))
+            
+            # One timestamp for everything produced by this notification
+            now = datetime.utcnow()
             
             # Store events in database
             if parsed_events:
+                # block_time is part of the events unique key, so a replay only
+                # dedupes if every event carries the real block time
+                await self._resolve_block_time(parsed_events, slot)
+                
                 await self._store_events(parsed_events)
                 
                 # 🔧 CRITICAL FIX: Process events through business handlers
                 await self._process_events_handlers(parsed_events)
                 
-                # Send real-time notifications to WebSocket clients
-                for event in parsed_events:
-                    await self._send_realtime_notification(event)
+                # Send real-time notifications to WebSocket clients in one fan-out
+                timestamp = now.isoformat()
+                await asyncio.gather(*(
+                    self._send_realtime_notification(event, timestamp)
+                    for event in parsed_events
+                ))
             
             self.stats.events_processed += len(parsed_events)
-            self.stats.last_event_time = datetime.utcnow()
+            self.stats.last_event_time = now
             
         except Exception as e:
             self.logger.error("Error handling logs notification", error=str(e), signature=signature)
             self.stats.errors_encountered += 1
+            # Let a redelivery retry the failed signature
+            if signature:
+                self._seen_signatures.pop(signature, None)
+    
+    async def _resolve_block_time(self, parsed_events: List[ParsedEvent], slot: Optional[int]):
+        """Fill in the block time of events parsed from WebSocket logs, which don't carry it."""
+        missing = [event for event in parsed_events if event.block_time is None]
+        if not missing:
+            return
+        
+        block_slot = slot or missing[0].slot
+        block_time = await self.solana_client.get_block_time(block_slot) if block_slot else None
+        if block_time is None:
+            # Raising lets a redelivery retry the signature instead of storing a made-up key
+            raise IndexerError(f"Block time unavailable for slot {block_slot}")
+        
+        for event in missing:
+            event.block_time = block_time
+    
+    @staticmethod
+    def _logs_are_complete(logs: List[str], events: List[ParsedEvent]) -> bool:
+        """Check whether events parsed from WebSocket logs can skip the RPC fetch."""
+        if not events or not all(event.data_complete for event in events):
+            return False
+        return not any(LOG_TRUNCATED_MARKER in line for line in logs)
     
     async def _process_events_handlers(self, parsed_events: List[ParsedEvent]):
         """Process events through business handlers."""
@@ -464,20 +560,17 @@ class RealTimeIndexer:
                     handler = handler_mapping.get(event_type)
                     
                     if handler:
-                        self.logger.info("🏃‍♂️ Processing event via handler", 
-                                       event_type=event_type, 
-                                       signature=parsed_event.signature)
                         await handler(db, parsed_event)
-                        self.logger.info("✅ Event processed via handler", 
-                                       event_type=event_type,
-                                       signature=parsed_event.signature)
+                        if self._debug:
+                            self.logger.debug("✅ Event processed via handler",
+                                              event_type=event_type,
+                                              signature=parsed_event.signature)
                     else:
                         self.logger.warning("⚠️ No handler for event type", 
                                           event_type=event_type)
                 
                 # Commit all changes
                 await db.commit()
-                self.logger.info("💾 Event handlers - all changes committed")
                 
             except Exception as e:
                 await db.rollback()
@@ -485,56 +578,67 @@ class RealTimeIndexer:
                 raise
     
     async def _store_events(self, parsed_events: List[ParsedEvent]):
-        """Store parsed events in database."""
+        """
+        Store parsed events in database.
+        
+        Inserts the batch through Event.bulk_insert with ON CONFLICT DO NOTHING
+        on the (transaction_signature, instruction_index, event_index, block_time)
+        unique index, so redelivered transactions are skipped without a lookup.
+        """
         async with get_async_session() as db:
             try:
-                for parsed_event in parsed_events:
+                # One timestamp for the whole batch
+                now = datetime.utcnow()
+                rows = []
+                
+                for event_index, parsed_event in enumerate(parsed_events):
                     # Map to database event type
-                    db_event_type_mapping = {
-                        "BusinessCreated": DBEventType.BUSINESS_CREATED,
-                        "BusinessCreatedInSlot": DBEventType.BUSINESS_CREATED,  # Slot version
-                        "BusinessUpgraded": DBEventType.BUSINESS_UPGRADED,
-                        "BusinessSold": DBEventType.BUSINESS_SOLD,
-                        "BusinessSoldFromSlot": DBEventType.BUSINESS_SOLD,  # Slot version
-                        "PlayerCreated": DBEventType.PLAYER_CREATED,
-                        "EarningsUpdated": DBEventType.EARNINGS_UPDATED,
-                        "EarningsClaimed": DBEventType.EARNINGS_CLAIMED,
-                    }
-                    
-                    db_event_type = db_event_type_mapping.get(parsed_event.event_type.value)
+                    db_event_type = DB_EVENT_TYPE_MAPPING.get(parsed_event.event_type.value)
                     if not db_event_type:
                         self.logger.warning("Unknown event type", event_type=parsed_event.event_type.value)
                         continue
                     
+                    if parsed_event.block_time is None:
+                        self.logger.warning("Event without block time", signature=parsed_event.signature)
+                        continue
+                    
                     # Extract player wallet
                     player_wallet = None
                     if parsed_event.data:
                         player_wallet = parsed_event.data.get("owner") or parsed_event.data.get("wallet")
                     
-                    # Create event record
-                    event = Event(
-                        transaction_signature=parsed_event.signature,
-                        slot=parsed_event.slot or 0,  # 🔧 FIX: Use 0 as fallback for None slot
-                        block_time=parsed_event.block_time or datetime.utcnow(),  # 🔧 FIX: Use current time as fallback
-                        event_type=db_event_type,
-                        raw_data=parsed_event.raw_data,
-                        parsed_data=parsed_event.data,
-                        player_wallet=player_wallet,
-                        processed_at=datetime.utcnow()
-                    )
-                    
-                    db.add(event)
-                    self.stats.events_stored += 1
+                    rows.append({
+                        "transaction_signature": parsed_event.signature,
+                        "instruction_index": 0,
+                        "event_index": event_index,  # Position within the transaction
+                        "slot": parsed_event.slot or 0,  # 🔧 FIX: Use 0 as fallback for None slot
+                        "block_time": parsed_event.block_time,
+                        "event_type": db_event_type,
+                        "raw_data": parsed_event.raw_data,
+                        "parsed_data": parsed_event.data,
+                        "player_wallet": player_wallet,
+                        "processed_at": now,
+                    })
+                
+                if not rows:
+                    return
                 
+                stored = await Event.bulk_insert(
+                    db, rows, ignore_conflicts=True, conflict_target=EVENT_UNIQUE_KEY
+                )
                 await db.commit()
-                self.logger.info(f"✅ Stored {len(parsed_events)} events in database")
+                
+                self.stats.events_stored += stored
+                if self._debug:
+                    self.logger.debug("✅ Stored events in database",
+                                      events_count=len(rows), stored=stored)
                 
             except Exception as e:
                 await db.rollback()
                 self.logger.error("Failed to store events", error=str(e))
                 raise
     
-    async def _send_realtime_notification(self, parsed_event: ParsedEvent):
+    async def _send_realtime_notification(self, parsed_event: ParsedEvent, timestamp: Optional[str] = None):
         """Send real-time notification to WebSocket clients."""
         try:
             if not self.notification_service:
@@ -547,13 +651,14 @@ class RealTimeIndexer:
                 "signature": parsed_event.signature,
                 "slot": parsed_event.slot,
                 "data": parsed_event.data,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp or datetime.utcnow().isoformat()
             }
             
             # Send to all connected WebSocket clients
             await self.notification_service.broadcast_event(notification)
             
-            self.logger.info("📡 Sent real-time notification", event_type=parsed_event.event_type.value)
+            if self._debug:
+                self.logger.debug("📡 Sent real-time notification", event_type=parsed_event.event_type.value)
             
         except Exception as e:
             self.logger.error("Failed to send real-time notification", error=str(e))
@@ -561,47 +666,47 @@ class RealTimeIndexer:
     async def _unsubscribe(self, subscription_type: str, subscription_id: int):
         """Unsubscribe from a WebSocket subscription."""
         try:
-            if subscription_type == "program":
-                method = "programUnsubscribe"
-            elif subscription_type == "logs":
-                method = "logsUnsubscribe"
-            else:
+            method = UNSUBSCRIBE_METHODS.get(subscription_type)
+            if not method:
                 return
             
-            request = {
-                "jsonrpc": "2.0",
-                "id": 999,
-                "method": method,
-                "params": [subscription_id]
-            }
-            
-            await self.websocket.send(json.dumps(request))
+            # Only the subscription id varies, so fill a fixed template
+            await self.websocket.send(
+                f'{{"jsonrpc":"2.0","id":999,"method":"{method}","params":[{int(subscription_id)}]}}'
+            )
             self.logger.info(f"Unsubscribed from {subscription_type}", subscription_id=subscription_id)
             
         except Exception as e:
             self.logger.error(f"Failed to unsubscribe from {subscription_type}", error=str(e))
     
     async def _reconnect_websocket(self):
-        """Reconnect WebSocket and restore subscriptions."""
-        try:
-            self.logger.info("Attempting to reconnect WebSocket...")
-            
-            # Clear existing subscriptions
-            self._subscriptions.clear()
-            self.stats.subscriptions_active = 0
-            
-            # Reconnect
-            await self._connect_websocket()
-            
-            # Restore subscriptions (send requests - responses handled in main loop)
-            await self._send_program_subscription()
-            await self._send_logs_subscription()
-            
-            self.logger.info("✅ WebSocket reconnected successfully")
+        """Reconnect WebSocket with exponential backoff and restore subscriptions."""
+        # Clear existing subscriptions
+        self._subscriptions.clear()
+        self.stats.subscriptions_active = 0
+        
+        for attempt in itertools.count():
+            if self._should_stop:
+                return
             
-        except Exception as e:
-            self.logger.error("Failed to reconnect WebSocket", error=str(e))
-            await asyncio.sleep(5)  # Wait before next attempt
+            try:
+                self.logger.info("Attempting to reconnect WebSocket...", attempt=attempt + 1)
+                
+                # Reconnect
+                await self._connect_websocket()
+                
+                # Restore subscriptions (send requests - responses handled in main loop)
+                await self._send_program_subscription()
+                await self._send_logs_subscription()
+                
+                self.logger.info("✅ WebSocket reconnected successfully", attempt=attempt + 1)
+                return
+                
+            except Exception as e:
+                delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** attempt)
+                self.logger.error("Failed to reconnect WebSocket",
+                                  error=str(e), attempt=attempt + 1, retry_in=delay)
+                await asyncio.sleep(delay)
     
     async def _periodic_health_check(self):
         """Periodic health check and statistics logging."""
@@ -614,7 +719,7 @@ class RealTimeIndexer:
                 
                 self.logger.info(
                     "Real-time indexer health check",
-                    stats=asdict(self.stats),
+                    stats={name: getattr(self.stats, name) for name in _STAT_FIELDS},
                     subscriptions=len(self._subscriptions),
                     websocket_connected=bool(self.websocket and not self.websocket.closed)
                 )
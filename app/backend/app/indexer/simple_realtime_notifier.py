@@ -9,28 +9,76 @@ This service provides:
 - No blockchain subscriptions (signatures come from frontend)
 - Clean separation: blockchain processing vs UI notifications
 - Based on proven WebSocket notification infrastructure
+
+WebSocket clients are connected to the API/WebSocket processes, not to the
+indexer, so notifications are published to per-wallet Redis channels and
+delivered by each process's NotificationRelay (app/websocket/pubsub.py).
+Without Redis the notifier falls back to the in-process NotificationService.
+
+Runs best on uvloop: the indexer entrypoint installs it outside development,
+and initialize() warns when the running loop is plain asyncio.
 """
 
 import asyncio
+import logging
+import sys
+import time
 import structlog
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
 
+from app.cache.redis_client import RedisClient, get_redis_client
+from app.websocket.connection_manager import connection_manager
 from app.websocket.notification_service import get_notification_service
+from app.websocket.pubsub import (
+    NOTIFICATION_METHODS,
+    SIGNATURE_PROCESSING,
+    publish_wallet_notification,
+)
 from app.core.config import settings
+from app.core.exceptions import IndexerError
 
 
 logger = structlog.get_logger(__name__)
 
+# Same-wallet updates queued within this window go out as one bundle
+COALESCE_WINDOW = 0.005  # seconds
+COALESCE_MAX_PENDING = 16
+
+# State snapshots: only the latest one per wallet in a window matters
+SNAPSHOT_EVENT_TYPES = frozenset({"earnings_updated", "player_updated"})
+
 
-@dataclass
 class SimpleNotifierStats:
     """Statistics for simple real-time notifier."""
-    start_time: Optional[datetime] = None
-    notifications_sent: int = 0
-    websocket_connections: int = 0
-    errors_encountered: int = 0
+    
+    __slots__ = ("start_monotonic", "start_wall", "websocket_connections")
+    
+    def __init__(self):
+        self.start_monotonic: Optional[float] = None
+        self.start_wall: Optional[float] = None
+        self.websocket_connections = 0
+    
+    def mark_started(self):
+        """Record the start time; formatting is deferred to to_dict()."""
+        self.start_monotonic = time.monotonic()
+        self.start_wall = time.time()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict for status responses."""
+        if self.start_wall is None:
+            return {
+                "start_time": None,
+                "uptime_seconds": 0.0,
+                "websocket_connections": self.websocket_connections,
+            }
+        return {
+            "start_time": datetime.utcfromtimestamp(self.start_wall).isoformat(),
+            "uptime_seconds": time.monotonic() - self.start_monotonic,
+            "websocket_connections": self.websocket_connections,
+        }
 
 
 class SimpleRealtimeNotifier:
@@ -47,6 +95,9 @@ class SimpleRealtimeNotifier:
     - Clean, simple, reliable
     """
     
+    # Event type -> NotificationService method, resolved once in initialize()
+    _NOTIFICATION_DISPATCH = NOTIFICATION_METHODS
+    
     def __init__(self):
         """Initialize the simple real-time notifier."""
         self.logger = logger.bind(service="simple_realtime_notifier")
@@ -55,25 +106,80 @@ class SimpleRealtimeNotifier:
         self._running = False
         self._should_stop = False
         self.stats = SimpleNotifierStats()
+        # Hot-path counters live on the notifier itself (one attribute hop less)
+        self._sent_n = 0
+        self._err_n = 0
         self.notification_service: Optional[Any] = None
+        self._dispatch: Dict[str, Callable[..., Awaitable[Any]]] = {}
+        self._notify_processing: Optional[Callable[..., Awaitable[Any]]] = None
+        self._redis: Optional[RedisClient] = None
+        self._init_lock = asyncio.Lock()
+        # Per-notification logs are skipped entirely when INFO is disabled
+        self._log_info = False
+        # Loggers pre-bound per event type, built in initialize()
+        self._log_by_event: Dict[str, Any] = {}
+        # Coalescing buffer for queue_update()
+        self._pending: Dict[str, List[Tuple[str, Dict[str, Any]]]] = defaultdict(list)
+        self._flush_timers: Dict[str, asyncio.TimerHandle] = {}
+        # Latest flush per wallet; each one waits for the previous, so awaiting
+        # these drains everything in flight
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        self._initialized = False
         
         self.logger.info("SimpleRealtimeNotifier initialized")
     
     async def initialize(self):
-        """Initialize the simple notifier."""
-        try:
-            self.logger.info("Initializing simple real-time notifier")
-            
-            # Get notification service (WebSocket manager)
-            self.notification_service = get_notification_service()
-            
-            self.stats.start_time = datetime.utcnow()
+        """Initialize the simple notifier (idempotent, safe to call concurrently)."""
+        async with self._init_lock:
+            if self._initialized:
+                return
             
-            self.logger.info("✅ Simple real-time notifier initialized successfully")
-            
-        except Exception as e:
-            self.logger.error("Failed to initialize simple notifier", error=str(e))
-            raise
+            try:
+                self.logger.info("Initializing simple real-time notifier")
+                
+                # Get notification service (WebSocket manager)
+                self._log_info = logging.getLogger(__name__).isEnabledFor(logging.INFO)
+                
+                loop_module = type(asyncio.get_running_loop()).__module__
+                if not loop_module.startswith("uvloop") and not settings.is_development:
+                    self.logger.warning("Notifier running without uvloop", loop=loop_module)
+                
+                self.notification_service = get_notification_service()
+                
+                try:
+                    self._redis = await get_redis_client()
+                except Exception as e:
+                    self.logger.warning("Redis unavailable, notifying in-process only", error=str(e))
+                    self._redis = None
+                
+                if self._redis:
+                    # Publish once per event; WebSocket processes fan out locally
+                    self._dispatch = {
+                        event_type: partial(self._publish, event_type)
+                        for event_type in self._NOTIFICATION_DISPATCH
+                    }
+                    self._notify_processing = self._publish_processing
+                else:
+                    self._dispatch = {
+                        event_type: getattr(self.notification_service, method_name)
+                        for event_type, method_name in self._NOTIFICATION_DISPATCH.items()
+                    }
+                    self._notify_processing = self.notification_service.notify_signature_processing
+                self._dispatch[SIGNATURE_PROCESSING] = self._send_processing
+                
+                self._log_by_event = {
+                    event_type: self.logger.bind(event_type=event_type)
+                    for event_type in (*self._NOTIFICATION_DISPATCH, SIGNATURE_PROCESSING)
+                }
+                
+                self.stats.mark_started()
+                self._initialized = True
+                
+                self.logger.info("✅ Simple real-time notifier initialized successfully")
+                
+            except Exception as e:
+                self.logger.error("Failed to initialize simple notifier", error=str(e))
+                raise
     
     async def start(self):
         """Start the simple notifier (just initialization, no background tasks)."""
@@ -95,107 +201,243 @@ class SimpleRealtimeNotifier:
         """Stop the simple notifier."""
         self.logger.info("Stopping simple real-time notifier")
         
+        # Deliver anything still waiting in the coalescing buffer
+        for user_wallet in list(self._pending):
+            self._flush(user_wallet)
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks.values(), return_exceptions=True)
+        
         self._should_stop = True
         self._running = False
         
         self.logger.info("Simple real-time notifier stopped")
     
-    async def send_business_update(
-        self, 
-        user_wallet: str, 
-        event_type: str, 
-        business_data: Dict[str, Any]
-    ):
+    def _require_initialized(self):
+        """Fail fast when a send happens before ensure_started()."""
+        if not self._initialized:
+            raise IndexerError("SimpleRealtimeNotifier.initialize() must be awaited first")
+    
+    async def _safe_send(
+        self,
+        user_wallet: str,
+        event_type: str,
+        notification,
+        data: Dict[str, Any]
+    ) -> bool:
+        """Await a single notification, recording failures instead of raising."""
+        try:
+            await notification
+        except Exception as e:
+            self._err_n += 1
+            self.logger.error("Failed to send notification",
+                            user_wallet=user_wallet,
+                            event_type=event_type,
+                            error=str(e))
+            return False
+        
+        self._sent_n += 1
+        if self._log_info:
+            self._log_sent(event_type, user_wallet, data)
+        return True
+    
+    async def send_bundle(
+        self,
+        user_wallet: str,
+        updates: List[Tuple[str, Dict[str, Any]]]
+    ) -> int:
         """
-        Send business update notification to user.
+        Send several notifications for one wallet, one after another.
+        
+        SignatureProcessor often produces bursts (business_created +
+        earnings_updated + player_updated, processing -> success) for the same
+        wallet; they are delivered in the order given so the UI never sees a
+        status go backwards. Different wallets are flushed concurrently.
         
         Args:
             user_wallet: User's wallet address
-            event_type: Type of business event (created, upgraded, sold)
-            business_data: Business data for the notification
-        """
-        try:
-            if not self.notification_service:
-                await self.initialize()
-            
-            # Send appropriate notification based on event type
-            if event_type == "business_created":
-                await self.notification_service.notify_business_created(
-                    user_wallet, business_data
-                )
-            elif event_type == "business_upgraded":
-                await self.notification_service.notify_business_upgraded(
-                    user_wallet, business_data
-                )
-            elif event_type == "business_sold":
-                await self.notification_service.notify_business_sold(
-                    user_wallet, business_data
-                )
+            updates: (event_type, data) pairs
             
-            self.stats.notifications_sent += 1
-            
-            self.logger.info("🎯 Business update notification sent",
-                           user_wallet=user_wallet,
-                           event_type=event_type,
-                           business_id=business_data.get("business_id"))
-            
-        except Exception as e:
-            self.stats.errors_encountered += 1
-            self.logger.error("Failed to send business update notification",
+        Returns:
+            Number of notifications sent successfully
+        """
+        self._require_initialized()
+        
+        sent = 0
+        for event_type, data in updates:
+            notify = self._dispatch.get(event_type)
+            if notify is None:
+                self.logger.warning("Unknown notification event type",
+                                  user_wallet=user_wallet,
+                                  event_type=event_type)
+                continue
+            if await self._safe_send(user_wallet, event_type, notify(user_wallet, data), data):
+                sent += 1
+        return sent
+    
+    async def _publish(self, event_type: str, user_wallet: str, data: Dict[str, Any]):
+        """Publish a wallet notification to Redis."""
+        receivers = await publish_wallet_notification(self._redis, user_wallet, event_type, data)
+        self._check_delivered(receivers, user_wallet, event_type)
+    
+    async def _publish_processing(self, **kwargs):
+        """Publish a signature processing status notification to Redis."""
+        receivers = await publish_wallet_notification(
+            self._redis, kwargs["user_wallet"], SIGNATURE_PROCESSING, kwargs
+        )
+        self._check_delivered(receivers, kwargs["user_wallet"], SIGNATURE_PROCESSING)
+    
+    @staticmethod
+    def _check_delivered(receivers: int, user_wallet: str, event_type: str):
+        """Treat a publish no relay received as a failed send, so it isn't counted as sent."""
+        if not receivers:
+            raise IndexerError(
+                f"No NotificationRelay subscribed for {event_type} to {user_wallet}"
+            )
+    
+    def queue_update(self, user_wallet: str, event_type: str, data: Dict[str, Any]):
+        """
+        Queue a notification and send it together with other updates for the
+        same wallet that arrive within COALESCE_WINDOW.
+        
+        Snapshot events (earnings/player) replace an earlier pending one of the
+        same type, so a burst only delivers the latest state.
+        """
+        self._require_initialized()
+        
+        # Interned keys make the repeated wallet/event dict lookups identity hits
+        user_wallet = sys.intern(user_wallet)
+        event_type = sys.intern(event_type)
+        pending = self._pending[user_wallet]
+        if event_type in SNAPSHOT_EVENT_TYPES:
+            pending[:] = [update for update in pending if update[0] != event_type]
+        pending.append((event_type, data))
+        
+        if len(pending) >= COALESCE_MAX_PENDING:
+            self._flush(user_wallet)
+        elif user_wallet not in self._flush_timers:
+            loop = asyncio.get_running_loop()
+            self._flush_timers[user_wallet] = loop.call_later(
+                COALESCE_WINDOW, self._flush, user_wallet
+            )
+    
+    def _flush(self, user_wallet: str):
+        """Send a wallet's pending updates as one ordered bundle, after any earlier one."""
+        timer = self._flush_timers.pop(user_wallet, None)
+        if timer:
+            timer.cancel()
+        updates = self._pending.pop(user_wallet, None)
+        if not updates:
+            return
+        
+        previous = self._flush_tasks.get(user_wallet)
+        task = asyncio.create_task(self._deliver(user_wallet, updates, previous))
+        self._flush_tasks[user_wallet] = task
+        task.add_done_callback(partial(self._flush_done, user_wallet))
+    
+    async def _deliver(
+        self,
+        user_wallet: str,
+        updates: List[Tuple[str, Dict[str, Any]]],
+        previous: Optional[asyncio.Task]
+    ) -> int:
+        """Send a flushed bundle once the wallet's previous one is done, keeping enqueue order."""
+        if previous is not None:
+            await asyncio.wait((previous,))
+        
+        sent = await self.send_bundle(user_wallet, updates)
+        if sent < len(updates):
+            self.logger.warning("Coalesced notifications not delivered",
+                              user_wallet=user_wallet,
+                              queued=len(updates),
+                              sent=sent)
+        return sent
+    
+    def _flush_done(self, user_wallet: str, task: asyncio.Task):
+        """Forget a finished flush and record a failure instead of dropping it."""
+        if self._flush_tasks.get(user_wallet) is task:
+            del self._flush_tasks[user_wallet]
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._err_n += 1
+            self.logger.error("Failed to flush notifications",
                             user_wallet=user_wallet,
-                            event_type=event_type,
-                            error=str(e))
+                            error=str(error))
+    
+    async def send(self, kind: str, user_wallet: str, data: Dict[str, Any]) -> bool:
+        """
+        Send one notification of any kind.
+        
+        Args:
+            kind: Event type (business_*, earnings_updated, player_updated,
+                signature_processing)
+            user_wallet: User's wallet address
+            data: Notification data; for signature_processing the status fields
+            
+        Returns:
+            True if the notification was sent
+        """
+        self._require_initialized()
+        
+        kind = sys.intern(kind)
+        notify = self._dispatch.get(kind)
+        if notify is None:
+            self.logger.warning("Unknown notification event type",
+                              user_wallet=user_wallet,
+                              event_type=kind)
+            return False
+        
+        return await self._safe_send(user_wallet, kind, notify(user_wallet, data), data)
+    
+    def _log_sent(self, kind: str, user_wallet: str, data: Dict[str, Any]):
+        """Log a sent notification with the fields relevant to its kind."""
+        log = self._log_by_event[kind]
+        if kind == SIGNATURE_PROCESSING:
+            log.info("🔄 Processing status notification sent",
+                     signature=f"{data['signature'][:20]}...",
+                     status=data["status"],
+                     user_wallet=user_wallet,
+                     slot_index=data.get("slot_index"))
+        elif kind == "earnings_updated":
+            log.info("💰 Earnings update notification sent",
+                     user_wallet=user_wallet,
+                     new_balance=data.get("earnings_balance"))
+        elif kind == "player_updated":
+            log.info("👤 Player update notification sent", user_wallet=user_wallet)
+        else:
+            log.info("🎯 Business update notification sent",
+                     user_wallet=user_wallet,
+                     business_id=data.get("business_id"))
+    
+    def _send_processing(self, user_wallet: str, data: Dict[str, Any]):
+        """Adapt processing status data to the keyword-based notify call."""
+        return self._notify_processing(user_wallet=user_wallet, **data)
+    
+    async def send_business_update(
+        self, 
+        user_wallet: str, 
+        event_type: str, 
+        business_data: Dict[str, Any]
+    ):
+        """Queue business update notification to user (coalesced per wallet)."""
+        self.queue_update(user_wallet, event_type, business_data)
     
     async def send_earnings_update(
         self, 
         user_wallet: str, 
         earnings_data: Dict[str, Any]
     ):
-        """Send earnings update notification to user."""
-        try:
-            if not self.notification_service:
-                await self.initialize()
-            
-            await self.notification_service.notify_earnings_updated(
-                user_wallet, earnings_data
-            )
-            
-            self.stats.notifications_sent += 1
-            
-            self.logger.info("💰 Earnings update notification sent",
-                           user_wallet=user_wallet,
-                           new_balance=earnings_data.get("earnings_balance"))
-            
-        except Exception as e:
-            self.stats.errors_encountered += 1
-            self.logger.error("Failed to send earnings update notification",
-                            user_wallet=user_wallet,
-                            error=str(e))
+        """Queue earnings update notification to user (coalesced per wallet)."""
+        self.queue_update(user_wallet, "earnings_updated", earnings_data)
     
     async def send_player_update(
         self, 
         user_wallet: str, 
         player_data: Dict[str, Any]
     ):
-        """Send player update notification to user."""
-        try:
-            if not self.notification_service:
-                await self.initialize()
-            
-            await self.notification_service.notify_player_updated(
-                user_wallet, player_data
-            )
-            
-            self.stats.notifications_sent += 1
-            
-            self.logger.info("👤 Player update notification sent",
-                           user_wallet=user_wallet)
-            
-        except Exception as e:
-            self.stats.errors_encountered += 1
-            self.logger.error("Failed to send player update notification",
-                            user_wallet=user_wallet,
-                            error=str(e))
+        """Queue player update notification to user (coalesced per wallet)."""
+        self.queue_update(user_wallet, "player_updated", player_data)
     
     async def send_processing_status(
         self,
@@ -210,74 +452,58 @@ class SimpleRealtimeNotifier:
         Send transaction processing status to user.
         
         This is the main method for our new architecture - immediate feedback
-        about transaction processing status.
+        about transaction processing status. It is queued with the business,
+        earnings and player updates of the same burst so they go out together.
         """
-        try:
-            if not self.notification_service:
-                await self.initialize()
-            
-            await self.notification_service.notify_signature_processing(
-                signature=signature,
-                status=status,
-                user_wallet=user_wallet,
-                slot_index=slot_index,
-                business_level=business_level,
-                result=result
-            )
-            
-            self.stats.notifications_sent += 1
-            
-            self.logger.info("🔄 Processing status notification sent",
-                           signature=signature[:20] + "...",
-                           status=status,
-                           user_wallet=user_wallet,
-                           slot_index=slot_index)
-            
-        except Exception as e:
-            self.stats.errors_encountered += 1
-            self.logger.error("Failed to send processing status notification",
-                            signature=signature,
-                            status=status,
-                            user_wallet=user_wallet,
-                            error=str(e))
+        self.queue_update(user_wallet, SIGNATURE_PROCESSING, {
+            "signature": signature,
+            "status": status,
+            "slot_index": slot_index,
+            "business_level": business_level,
+            "result": result,
+        })
+    
+    def _stats_dict(self) -> Dict[str, Any]:
+        """Plain stats snapshot; avoids asdict()'s deepcopy on every status poll."""
+        return {
+            **self.stats.to_dict(),
+            "notifications_sent": self._sent_n,
+            "errors_encountered": self._err_n,
+        }
     
     async def get_status(self) -> Dict[str, Any]:
         """Get current notifier status."""
         try:
-            # Get WebSocket connection count from connection manager
-            from app.websocket.connection_manager import connection_manager
-            connection_count = len(connection_manager._connections)
-            
             return {
                 "running": self._running,
-                "websocket_connections": connection_count,
-                "stats": asdict(self.stats),
+                "websocket_connections": connection_manager.count,
+                "stats": self._stats_dict(),
                 "message": "Simple real-time notifier - UI notifications only"
             }
         except Exception as e:
             return {
                 "running": self._running,
                 "error": str(e),
-                "stats": asdict(self.stats)
+                "stats": self._stats_dict()
             }
 
 
-# Global simple notifier instance
-_simple_realtime_notifier: Optional[SimpleRealtimeNotifier] = None
+# Global simple notifier instance, built at import; call ensure_started() once
+# at service startup before sending
+simple_realtime_notifier = SimpleRealtimeNotifier()
+
+
+async def ensure_started() -> SimpleRealtimeNotifier:
+    """Initialize the global notifier (idempotent)."""
+    await simple_realtime_notifier.initialize()
+    return simple_realtime_notifier
 
 
 async def get_simple_realtime_notifier() -> SimpleRealtimeNotifier:
-    """Get or create global simple real-time notifier instance."""
-    global _simple_realtime_notifier
-    if _simple_realtime_notifier is None:
-        _simple_realtime_notifier = SimpleRealtimeNotifier()
-        await _simple_realtime_notifier.initialize()
-    return _simple_realtime_notifier
+    """Get the global simple real-time notifier instance."""
+    return await ensure_started()
 
 
 async def shutdown_simple_realtime_notifier():
     """Shutdown the global simple real-time notifier."""
-    global _simple_realtime_notifier
-    if _simple_realtime_notifier:
-        await _simple_realtime_notifier.stop()
-        _simple_realtime_notifier = None
\ No newline at end of file
+    await simple_realtime_notifier.stop()
\ No newline at end of file
@@ -4,28 +4,128 @@ Provides basic transaction indexing functionality that can be used by the event
 """
 
 import asyncio
-from typing import Dict, List, Optional, Set, Callable, Any
+import logging
+import random
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
+import orjson
+import websockets
+from cachetools import LRUCache
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, and_
+from sqlalchemy import select, desc, and_, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 import structlog
 
-from app.core.database import get_async_session
+from app.core.database import get_async_session, json_serializer
 from app.core.config import settings
 from app.core.exceptions import IndexerError, ValidationError
 from app.services.solana_client import SolanaClient, get_solana_client, TransactionInfo
 from app.services.event_parser import EventParser, get_event_parser, ParsedEvent
 from app.utils.validation import TransactionValidator, validate_event_data
-from app.models.event import Event
+from app.models.checkpoint import Checkpoint
+from app.models.event import Event, EventType as DBEventType, EventStatus, EVENT_UNIQUE_KEY
 
 
 logger = structlog.get_logger(__name__)
 
+# Signatures per getTransaction JSON-RPC batch request
+RPC_BATCH_SIZE = 100
+# Concurrent getTransaction calls when the endpoint rejects batch requests
+RPC_FALLBACK_CONCURRENCY = 20
+# Chunks with at least this many event rows go through binary COPY into a
+# staging table instead of a multi-VALUES INSERT
+COPY_MIN_ROWS = 200
+EVENT_COPY_COLUMNS = (
+    "transaction_signature", "instruction_index", "event_index", "slot",
+    "block_time", "event_type", "raw_data", "parsed_data", "player_wallet",
+    "processed_at", "status", "retry_count", "indexer_version",
+)
+# Per-connection staging table, emptied on every commit
+CREATE_EVENTS_STAGING_SQL = text(
+    "CREATE TEMP TABLE IF NOT EXISTS events_copy_staging ON COMMIT DELETE ROWS AS "
+    f"SELECT {', '.join(EVENT_COPY_COLUMNS)} FROM events WITH NO DATA"
+)
+INSERT_FROM_EVENTS_STAGING_SQL = text(
+    f"INSERT INTO events ({', '.join(EVENT_COPY_COLUMNS)}) "
+    f"SELECT {', '.join(EVENT_COPY_COLUMNS)} FROM events_copy_staging "
+    "ON CONFLICT (transaction_signature, instruction_index, event_index, block_time) DO NOTHING"
+)
+# Values the ORM would fill from column defaults (COPY bypasses them)
+EVENT_COPY_DEFAULTS = (
+    Event.__table__.c.status.type.code(EventStatus.PENDING),
+    0,
+    Event.__table__.c.indexer_version.default.arg,
+)
+# COPY bypasses column types, so event types are written as their SMALLINT codes
+EVENT_TYPE_COLUMN = Event.__table__.c.event_type.type
 
-@dataclass
+# Row key of this service in indexer_checkpoints
+CHECKPOINT_SERVICE_NAME = "transaction_indexer"
+# Reindex: slot windows indexed concurrently, and the minimum spacing between
+# window starts across workers (keeps RPC load near the old serial pace x workers)
+REINDEX_WORKERS = 4
+REINDEX_WINDOW_INTERVAL = 0.25
+# Current slot reuse window; slots advance ~2.5/s, plenty for batch bounds and lag checks
+SLOT_CACHE_TTL = 1.0
+# Remembered transaction validation results (re-indexed overlaps and retries)
+VALIDATION_CACHE_SIZE = 10000
+
+# New program transactions are pushed over logsSubscribe; the request is
+# constant for the process, so it is serialized once
+LOGS_SUBSCRIBE_REQUEST = json.dumps({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "logsSubscribe",
+    "params": [
+        {"mentions": [settings.solana_program_id]},
+        {"commitment": settings.solana_commitment}
+    ]
+})
+# Pushed signatures are fetched together: up to RPC_BATCH_SIZE or after this many seconds
+LIVE_BATCH_WINDOW = 0.2
+# Slot-range pass that picks up anything the subscription missed (disconnects, drops)
+RECONCILE_INTERVAL = 300
+# getSignaturesForAddress page size (RPC maximum)
+SIGNATURES_PAGE_SIZE = 1000
+# Signatures indexed per catch-up pass from the checkpoint cursor (oldest first)
+CATCH_UP_LIMIT = 5000
+# Subscription reconnect backoff: 0.5s doubling per attempt, capped at 30s
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30
+# Reconcile pass retry after errors: 2^errors seconds capped at 5 minutes, plus
+# up to 5s of jitter so replicas don't retry in lockstep
+RETRY_MAX_DELAY = 300
+RETRY_JITTER = 5
+# RPC circuit breaker: open after this many consecutive failures, probe again after the cool-down
+RPC_FAILURE_THRESHOLD = 5
+RPC_RESET_TIMEOUT = 30
+
+# Parser event types -> database event types (read-only)
+DB_EVENT_TYPE_MAPPING = MappingProxyType({
+    "BusinessCreated": DBEventType.BUSINESS_CREATED,
+    "BusinessCreatedInSlot": DBEventType.BUSINESS_CREATED_IN_SLOT,
+    "BusinessUpgraded": DBEventType.BUSINESS_UPGRADED,
+    "BusinessUpgradedInSlot": DBEventType.BUSINESS_UPGRADED_IN_SLOT,
+    "BusinessSold": DBEventType.BUSINESS_SOLD,
+    "BusinessSoldFromSlot": DBEventType.BUSINESS_SOLD_FROM_SLOT,
+    "PlayerCreated": DBEventType.PLAYER_CREATED,
+    "EarningsUpdated": DBEventType.EARNINGS_UPDATED,
+    "EarningsClaimed": DBEventType.EARNINGS_CLAIMED,
+    "SlotUnlocked": DBEventType.SLOT_UNLOCKED,
+    "PremiumSlotPurchased": DBEventType.PREMIUM_SLOT_PURCHASED,
+})
+# Parser event types that are stored; anything else is skipped before validation
+KNOWN_EVENT_NAMES = frozenset(DB_EVENT_TYPE_MAPPING)
+
+
+@dataclass(slots=True)
 class IndexerCheckpoint:
     """Checkpoint for tracking indexer progress."""
     last_processed_slot: int
@@ -33,9 +133,19 @@ class IndexerCheckpoint:
     last_update: datetime
     processed_count: int
     error_count: int
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Flat field snapshot (no asdict() recursion/deepcopy)."""
+        return {
+            "last_processed_slot": self.last_processed_slot,
+            "last_processed_signature": self.last_processed_signature,
+            "last_update": self.last_update,
+            "processed_count": self.processed_count,
+            "error_count": self.error_count,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexingStats:
     """Statistics for indexing operations."""
     transactions_processed: int = 0
@@ -44,6 +154,60 @@ class IndexingStats:
     errors_encountered: int = 0
     start_time: Optional[datetime] = None
     last_processed_slot: Optional[int] = None
+    last_processed_signature: Optional[str] = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Flat field snapshot (no asdict() recursion/deepcopy)."""
+        return {
+            "transactions_processed": self.transactions_processed,
+            "events_found": self.events_found,
+            "events_stored": self.events_stored,
+            "errors_encountered": self.errors_encountered,
+            "start_time": self.start_time,
+            "last_processed_slot": self.last_processed_slot,
+            "last_processed_signature": self.last_processed_signature,
+        }
+
+
+class CircuitBreaker:
+    """Fail fast after repeated failures, letting one probe call through per cool-down."""
+    
+    __slots__ = ("failure_threshold", "reset_timeout", "_failures", "_opened_at")
+    
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+        
+    def allow(self) -> bool:
+        """Whether a call may go out now (closed, or half-open probe)."""
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            return False
+        # Half-open: this call is the probe; others fail fast until it resolves
+        self._opened_at = now
+        return True
+        
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        
+    def record_failure(self):
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+
+def _negated_slot(sig_info: Dict[str, Any]) -> int:
+    """Sort key turning slot-descending signature lists into ascending ones."""
+    return -sig_info["slot"]
 
 
 class TransactionIndexer:
@@ -66,6 +230,19 @@ class TransactionIndexer:
         self.checkpoint: Optional[IndexerCheckpoint] = None
         self._running = False
         self._should_stop = False
+        # Switched off once the RPC endpoint rejects a batch request
+        self._rpc_batching = True
+        # Per-transaction traces are only built when DEBUG is enabled
+        self._debug = False
+        # Signature -> validation result; validators are pure functions of the transaction
+        self._validation_cache: LRUCache = LRUCache(maxsize=VALIDATION_CACHE_SIZE)
+        # Signatures pushed by the logs subscription, drained in batches
+        self._signature_queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        # (slot, monotonic fetch time) of the last get_slot call
+        self._slot_cache: Optional[Tuple[int, float]] = None
+        self._rpc_breaker = CircuitBreaker(RPC_FAILURE_THRESHOLD, RPC_RESET_TIMEOUT)
+        self._consecutive_errors = 0
         
     async def __aenter__(self):
         """Async context manager entry."""
@@ -79,6 +256,7 @@ class TransactionIndexer:
     async def initialize(self):
         """Initialize the indexer components."""
         try:
+            self._debug = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
             self.solana_client = await get_solana_client()
             self.event_parser = get_event_parser()
             self.stats.start_time = datetime.utcnow()
@@ -95,15 +273,17 @@ class TransactionIndexer:
     async def shutdown(self):
         """Shutdown the indexer."""
         self._should_stop = True
-        if self.solana_client:
-            await self.solana_client.close()
+        # The Solana client is the process-wide shared instance; other services
+        # keep using its connection pool, so it is closed at application shutdown
+        self.solana_client = None
         self.logger.info("Transaction indexer shutdown")
         
     async def index_transactions_batch(
         self,
         start_slot: int,
         end_slot: Optional[int] = None,
-        limit: int = 1000
+        limit: int = 1000,
+        save_checkpoint: bool = True
     ) -> IndexingStats:
         """
         Index a batch of transactions between slots.
@@ -112,6 +292,8 @@ class TransactionIndexer:
             start_slot: Starting slot number
             end_slot: Ending slot number (optional)
             limit: Maximum number of transactions to process
+            save_checkpoint: Advance the checkpoint to the newest indexed
+                signature; callers indexing several windows save it themselves
             
         Returns:
             Indexing statistics
@@ -133,163 +315,399 @@ class TransactionIndexer:
             )
             
             # Get signatures for our program
-            signatures = await self.solana_client.get_signatures_for_address(
+            signatures = await self._rpc(
+                self.solana_client.get_signatures_for_address,
                 settings.solana_program_id,
                 limit=limit
             )
             
-            # Filter signatures by slot range
-            filtered_signatures = []
-            self.logger.info(f"🔍 Filtering slots - Range: {start_slot} to {end_slot}")
-            for sig_info in signatures:
-                slot = sig_info["slot"]
-                signature = sig_info["signature"]
-                is_in_range = slot >= start_slot and (end_slot is None or slot <= end_slot)
-                
-                self.logger.info(f"📍 Checking slot {slot}: in_range={is_in_range}")
-                
-                if is_in_range:
-                    filtered_signatures.append(sig_info)
-                    self.logger.info(f"✅ Slot {slot} included (signature: {signature[:20]}...)")
-                    
+            # Filter signatures by slot range. The RPC returns them newest
+            # first (slot descending), so the range is one contiguous slice
+            # found by binary search on the negated slot.
+            first = 0 if end_slot is None else bisect_left(signatures, -end_slot, key=_negated_slot)
+            last = bisect_right(signatures, -start_slot, key=_negated_slot)
+            filtered_signatures = signatures[first:last]
+            
             self.logger.info(
                 "Found signatures in range",
                 total_signatures=len(signatures),
                 filtered_signatures=len(filtered_signatures)
             )
             
-            # Process each transaction
+            # Process transactions, fetching them from RPC a chunk at a time
             async with get_async_session() as db:
-                for sig_info in filtered_signatures:
-                    if self._should_stop:
-                        break
-                        
-                    try:
-                        await self._process_transaction(
-                            db,
-                            sig_info["signature"],
-                            batch_stats
-                        )
-                        
-                        # Update checkpoint periodically
-                        if batch_stats.transactions_processed % 100 == 0:
-                            await self._save_checkpoint(db, sig_info["slot"], sig_info["signature"])
-                            
-                    except Exception as e:
-                        batch_stats.errors_encountered += 1
-                        self.logger.error(
-                            "Failed to process transaction",
-                            signature=sig_info["signature"],
-                            error=str(e)
-                        )
-                        
-                # Final checkpoint save
+                await self._index_signatures(db, filtered_signatures, batch_stats)
+                
+                # Final checkpoint save (signatures are newest first)
                 if filtered_signatures:
-                    last_sig = filtered_signatures[-1]
-                    await self._save_checkpoint(db, last_sig["slot"], last_sig["signature"])
+                    newest = filtered_signatures[0]
+                    batch_stats.last_processed_slot = newest["slot"]
+                    batch_stats.last_processed_signature = newest["signature"]
+                    if save_checkpoint:
+                        await self._save_checkpoint(db, newest["slot"], newest["signature"], batch_stats.start_time)
                     
-            self.logger.info("Batch indexing completed", stats=asdict(batch_stats))
+            self.logger.info("Batch indexing completed", stats=batch_stats.as_dict())
             return batch_stats
             
         except Exception as e:
             self.logger.error("Batch indexing failed", error=str(e))
             raise IndexerError(f"Batch indexing failed: {e}")
             
-    async def _process_transaction(
+    async def index_new_transactions(self, limit: int = CATCH_UP_LIMIT) -> IndexingStats:
+        """
+        Index program transactions newer than the checkpoint signature.
+        
+        The checkpoint signature is passed as the ``until`` cursor so the RPC
+        node returns only newer signatures, paged backwards with ``before``
+        until the cursor is reached. At most ``limit`` of the oldest ones are
+        indexed, oldest first, and the checkpoint moves to the newest of those;
+        anything newer is picked up by the next pass.
+        
+        Args:
+            limit: Maximum number of signatures to index per pass
+            
+        Returns:
+            Indexing statistics
+            
+        Raises:
+            IndexerError: If indexing fails
+        """
+        try:
+            if not self.solana_client:
+                raise IndexerError("Indexer not initialized")
+            if not self.checkpoint or not self.checkpoint.last_processed_signature:
+                raise IndexerError("No checkpoint signature to index from")
+                
+            batch_stats = IndexingStats(start_time=datetime.utcnow())
+            until = self.checkpoint.last_processed_signature
+            
+            # Pages arrive newest first; only the oldest `limit` are kept so
+            # nothing between the checkpoint and this pass is skipped
+            oldest: deque = deque(maxlen=limit)
+            total = 0
+            before = None
+            while True:
+                page = await self._rpc(
+                    self.solana_client.get_signatures_for_address,
+                    settings.solana_program_id,
+                    limit=SIGNATURES_PAGE_SIZE,
+                    before=before,
+                    until=until
+                )
+                oldest.extend(page)
+                total += len(page)
+                if len(page) < SIGNATURES_PAGE_SIZE:
+                    break
+                before = page[-1]["signature"]
+                
+            if not oldest:
+                return batch_stats
+            if total > limit:
+                self.logger.warning(
+                    "Catch-up limit reached, newer signatures are indexed by the next pass",
+                    limit=limit,
+                    pending=total - limit
+                )
+                
+            # Oldest first, so the checkpoint only ever covers indexed history
+            signatures = list(reversed(oldest))
+            async with get_async_session() as db:
+                await self._index_signatures(db, signatures, batch_stats)
+                
+                # The newest indexed signature becomes the next cursor (not
+                # after an interrupted pass, which would skip the unprocessed rest)
+                if not self._should_stop:
+                    newest = signatures[-1]
+                    await self._save_checkpoint(db, newest["slot"], newest["signature"], batch_stats.start_time)
+                
+            self.logger.info(
+                "Indexed transactions since checkpoint",
+                signatures=len(signatures),
+                stats=batch_stats.as_dict()
+            )
+            return batch_stats
+            
+        except Exception as e:
+            self.logger.error("Catch-up indexing failed", error=str(e))
+            raise IndexerError(f"Catch-up indexing failed: {e}")
+            
+    async def _index_signatures(
         self,
         db: AsyncSession,
-        signature: str,
+        signatures: List[Dict[str, Any]],
         stats: IndexingStats
     ):
-        """Process a single transaction."""
-        try:
-            self.logger.info(f"🔄 Processing transaction: {signature[:20]}...")
-            
-            # Check if already processed
-            existing_events = await db.execute(
-                select(Event).where(Event.transaction_signature == signature)
+        """Fetch, parse and store the not yet indexed transactions among signatures."""
+        # Events of one batch share a processing timestamp
+        processed_at = stats.start_time or datetime.utcnow()
+        
+        # Skip already processed transactions with one query (the
+        # unique signature index covers the lookup)
+        pending_signatures = signatures
+        if signatures:
+            existing_result = await db.execute(
+                select(Event.transaction_signature).where(
+                    Event.transaction_signature.in_(
+                        [sig_info["signature"] for sig_info in signatures]
+                    )
+                )
             )
-            if existing_events.first():
-                self.logger.debug("Transaction already processed", signature=signature)
-                return
+            existing = set(existing_result.scalars().all())
+            if existing:
+                self.logger.debug("Transactions already processed", count=len(existing))
+                pending_signatures = [
+                    sig_info for sig_info in signatures
+                    if sig_info["signature"] not in existing
+                ]
+        
+        chunks = [
+            pending_signatures[chunk_start:chunk_start + RPC_BATCH_SIZE]
+            for chunk_start in range(0, len(pending_signatures), RPC_BATCH_SIZE)
+        ]
+        if not chunks:
+            return
+        
+        next_fetch = asyncio.create_task(self._fetch_chunk(chunks[0]))
+        try:
+            for chunk_number, chunk in enumerate(chunks):
+                transactions = await next_fetch
+                next_fetch = None
+                if self._should_stop:
+                    break
                 
-            self.logger.info(f"📡 Getting transaction from RPC: {signature[:20]}...")
-            # Get transaction details
-            tx_info = await self.solana_client.get_transaction(signature)
-            if not tx_info:
-                self.logger.warning(f"❌ Transaction not found on RPC: {signature[:20]}...")
-                return
+                # Fetch the next chunk while this one is parsed and stored
+                if chunk_number + 1 < len(chunks):
+                    next_fetch = asyncio.create_task(self._fetch_chunk(chunks[chunk_number + 1]))
                 
-            self.logger.info(f"✅ Transaction retrieved successfully: {signature[:20]}...")
+                # Event rows of the whole chunk, inserted in one statement
+                event_rows: List[Dict[str, Any]] = []
                 
-            stats.transactions_processed += 1
+                for sig_info, tx_info in zip(chunk, transactions):
+                    if self._should_stop:
+                        break
+                    
+                    if isinstance(tx_info, Exception):
+                        stats.errors_encountered += 1
+                        self.logger.error(
+                            "Failed to fetch transaction",
+                            signature=sig_info["signature"],
+                            error=str(tx_info)
+                        )
+                        continue
+                    
+                    if not tx_info:
+                        self.logger.warning("❌ Transaction not found on RPC", signature=sig_info["signature"][:20])
+                        continue
+                    
+                    try:
+                        self._process_transaction(tx_info, stats, event_rows, processed_at)
+                    except Exception as e:
+                        stats.errors_encountered += 1
+                        self.logger.error(
+                            "Failed to process transaction",
+                            signature=sig_info["signature"],
+                            error=str(e)
+                        )
+                
+                await self._insert_events(db, event_rows, stats)
+        
+        finally:
+            if next_fetch is not None:
+                next_fetch.cancel()
+    
+    def _fetch_chunk(self, chunk: List[Dict[str, Any]]) -> Awaitable[List[Any]]:
+        """Start fetching the transactions of a chunk of signature infos."""
+        return self._fetch_transactions([sig_info["signature"] for sig_info in chunk])
+
+    async def _rpc(self, call: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Make an RPC call through the circuit breaker."""
+        if not self._rpc_breaker.allow():
+            raise IndexerError("Solana RPC circuit open, skipping call")
+        try:
+            result = await call(*args, **kwargs)
+        except Exception:
+            self._rpc_breaker.record_failure()
+            raise
+        self._rpc_breaker.record_success()
+        return result
+        
+    async def _current_slot(self, max_age: float = SLOT_CACHE_TTL) -> int:
+        """Current slot, reusing a value fetched less than max_age seconds ago."""
+        now = time.monotonic()
+        if self._slot_cache and now - self._slot_cache[1] < max_age:
+            return self._slot_cache[0]
             
-            self.logger.info(f"🔍 Validating transaction: {signature[:20]}...")
-            # Validate transaction
-            if not self._validate_transaction(tx_info):
-                self.logger.warning(f"❌ Transaction validation failed: {signature[:20]}...")
-                return
+        slot = await self._rpc(self.solana_client.get_slot)
+        self._slot_cache = (slot, now)
+        return slot
+        
+    async def _fetch_transactions(self, signatures: List[str]) -> List[Any]:
+        """
+        Fetch transactions for a chunk of signatures.
+        
+        Uses one JSON-RPC batch request; if the endpoint rejects batches, falls
+        back to bounded concurrent getTransaction calls for this and later chunks.
+        Failed fallback fetches are returned as exceptions in place.
+        """
+        if self._rpc_batching:
+            try:
+                return await self._rpc(self.solana_client.get_transactions_batch, signatures)
+            except IndexerError:
+                raise
+            except Exception as e:
+                self._rpc_batching = False
+                self.logger.warning(
+                    "RPC batch request rejected, falling back to concurrent requests",
+                    error=str(e)
+                )
                 
-            self.logger.info(f"✅ Transaction validation passed: {signature[:20]}...")
-            self.logger.info(f"🔍 Parsing events from transaction: {signature[:20]}...")
-            # Parse events from transaction
-            parsed_events = self.event_parser.parse_transaction_events(tx_info)
-            self.logger.info(f"🎯 Found {len(parsed_events)} events in transaction: {signature[:20]}...")
-            stats.events_found += len(parsed_events)
-            
-            # Store events in database
-            for event in parsed_events:
-                try:
-                    await self._store_event(db, event)
-                    stats.events_stored += 1
-                except Exception as e:
-                    self.logger.error(
-                        "Failed to store event",
-                        signature=signature,
-                        event_type=event.event_type.value,
-                        error=str(e)
-                    )
-                    stats.errors_encountered += 1
-                    
-            # Commit transaction
-            await db.commit()
+        semaphore = asyncio.Semaphore(RPC_FALLBACK_CONCURRENCY)
+        
+        async def fetch(signature: str) -> Optional[TransactionInfo]:
+            async with semaphore:
+                return await self.solana_client.get_transaction(signature)
+                
+        return await asyncio.gather(
+            *(fetch(signature) for signature in signatures),
+            return_exceptions=True
+        )
+        
+    def _process_transaction(
+        self,
+        tx_info: TransactionInfo,
+        stats: IndexingStats,
+        event_rows: List[Dict[str, Any]],
+        processed_at: datetime
+    ):
+        """
+        Validate a fetched transaction and append its event rows for insertion.
+        
+        Rows are only appended once every event of the transaction is valid,
+        so an invalid event drops the whole transaction (the caller counts
+        the error) and never leaves it half indexed.
+        """
+        signature = tx_info.signature
+        stats.transactions_processed += 1
+        
+        # Validate transaction
+        if not self._validate_transaction(tx_info):
+            if self._debug:
+                self.logger.debug("❌ Transaction validation failed", signature=signature[:20])
+            return
             
+        # Parse events from transaction (skipped when no log line can hold one)
+        if not self.event_parser.has_event_logs(tx_info.logs):
+            return
+        parsed_events = self.event_parser.parse_transaction_events(tx_info)
+        stats.events_found += len(parsed_events)
+        
+        # Build rows for the batched insert; event types without a table
+        # mapping are skipped (event_index keeps their position)
+        event_rows.extend([
+            self._build_event_row(event, event_index, processed_at)
+            for event_index, event in enumerate(parsed_events)
+            if event.event_type.value in KNOWN_EVENT_NAMES
+        ])
+        
+        if self._debug:
             self.logger.debug(
                 "Transaction processed",
                 signature=signature,
                 events_count=len(parsed_events)
             )
+        
+    async def _insert_events(
+        self,
+        db: AsyncSession,
+        event_rows: List[Dict[str, Any]],
+        stats: IndexingStats
+    ):
+        """
+        Insert event rows through Event.bulk_insert and commit.
+        
+        ON CONFLICT DO NOTHING on the (transaction_signature, instruction_index,
+        event_index, block_time) unique index makes re-indexing the same
+        transaction a no-op.
+        Large chunks (backfill) are loaded with binary COPY instead.
+        """
+        if not event_rows:
+            return
+            
+        try:
+            if len(event_rows) >= COPY_MIN_ROWS:
+                stored = await self._bulk_copy_events(db, event_rows)
+            else:
+                stored = await Event.bulk_insert(
+                    db, event_rows, ignore_conflicts=True, conflict_target=EVENT_UNIQUE_KEY
+                )
+            await db.commit()
+            stats.events_stored += max(stored, 0)
             
         except Exception as e:
             await db.rollback()
+            stats.errors_encountered += 1
             self.logger.error(
-                "Transaction processing failed",
-                signature=signature,
+                "Failed to insert events",
+                events_count=len(event_rows),
                 error=str(e)
             )
-            raise
             
+    async def _bulk_copy_events(self, db: AsyncSession, event_rows: List[Dict[str, Any]]) -> int:
+        """
+        Load event rows with asyncpg binary COPY; returns the number inserted.
+        
+        COPY has no ON CONFLICT, so rows go to a temp staging table first and
+        are moved with INSERT ... SELECT ... ON CONFLICT DO NOTHING. Runs in
+        the session's transaction; the caller commits.
+        """
+        await db.execute(CREATE_EVENTS_STAGING_SQL)
+        
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        records = [
+            (
+                row["transaction_signature"],
+                row["instruction_index"],
+                row["event_index"],
+                row["slot"],
+                row["block_time"],
+                EVENT_TYPE_COLUMN.code(row["event_type"]),
+                json_serializer(row["raw_data"]),
+                json_serializer(row["parsed_data"]) if row["parsed_data"] is not None else None,
+                row["player_wallet"],
+                row["processed_at"],
+                *EVENT_COPY_DEFAULTS,
+            )
+            for row in event_rows
+        ]
+        await raw_connection.driver_connection.copy_records_to_table(
+            "events_copy_staging",
+            records=records,
+            columns=EVENT_COPY_COLUMNS
+        )
+        
+        result = await db.execute(INSERT_FROM_EVENTS_STAGING_SQL)
+        return result.rowcount
+        
     def _validate_transaction(self, tx_info: TransactionInfo) -> bool:
-        """Validate transaction data."""
+        """Validate transaction data (cached per signature)."""
+        cached = self._validation_cache.get(tx_info.signature)
+        if cached is not None:
+            return cached
+            
         try:
             # Basic validation
-            if not TransactionValidator.validate_transaction_signature(tx_info.signature):
-                return False
-                
-            if not TransactionValidator.validate_slot_number(tx_info.slot):
-                return False
-                
-            if not TransactionValidator.validate_block_time(tx_info.block_time):
-                return False
-                
-            if not TransactionValidator.validate_transaction_success(tx_info.success, tx_info.logs):
-                return False
-                
-            # Only process successful transactions
-            if not tx_info.success:
-                return False
-                
-            return True
+            is_valid = (
+                TransactionValidator.validate_transaction_signature(tx_info.signature)
+                and TransactionValidator.validate_slot_number(tx_info.slot)
+                and TransactionValidator.validate_block_time(tx_info.block_time)
+                and TransactionValidator.validate_transaction_success(tx_info.success, tx_info.logs)
+                # Only process successful transactions
+                and tx_info.success
+            )
+            
+            self._validation_cache[tx_info.signature] = is_valid
+            return is_valid
             
         except Exception as e:
             self.logger.error(
@@ -299,102 +717,72 @@ class TransactionIndexer:
             )
             return False
             
-    async def _store_event(self, db: AsyncSession, parsed_event: ParsedEvent):
-        """Store a parsed event in the database."""
-        try:
-            # Validate event data
-            if not self.event_parser.validate_event_data(parsed_event):
-                raise ValidationError("Event validation failed")
-                
-            # Additional validation using utils
-            validation_errors = validate_event_data(
-                parsed_event.event_type.value,
-                parsed_event.data
-            )
-            if validation_errors:
-                raise ValidationError(f"Event validation errors: {validation_errors}")
-                
-            # Create event record
-            from app.models.event import EventType as DBEventType
-            
-            # Map parser event types to database event types
-            db_event_type_mapping = {
-                "BusinessCreated": DBEventType.BUSINESS_CREATED,
-                "BusinessCreatedInSlot": DBEventType.BUSINESS_CREATED_IN_SLOT,
-                "BusinessUpgraded": DBEventType.BUSINESS_UPGRADED,
-                "BusinessUpgradedInSlot": DBEventType.BUSINESS_UPGRADED_IN_SLOT,
-                "BusinessSold": DBEventType.BUSINESS_SOLD,
-                "BusinessSoldFromSlot": DBEventType.BUSINESS_SOLD_FROM_SLOT,
-                "PlayerCreated": DBEventType.PLAYER_CREATED,
-                "EarningsUpdated": DBEventType.EARNINGS_UPDATED,
-                "EarningsClaimed": DBEventType.EARNINGS_CLAIMED,
-                "SlotUnlocked": DBEventType.SLOT_UNLOCKED,
-                "PremiumSlotPurchased": DBEventType.PREMIUM_SLOT_PURCHASED,
-            }
-            
-            db_event_type = db_event_type_mapping.get(parsed_event.event_type.value)
-            if not db_event_type:
-                raise ValidationError(f"Unknown event type mapping: {parsed_event.event_type.value}")
-            
-            # Extract player_wallet from event data if available
-            player_wallet = None
-            if parsed_event.data:
-                player_wallet = parsed_event.data.get("owner") or parsed_event.data.get("wallet")
-            
-            event = Event(
-                transaction_signature=parsed_event.signature,
-                slot=parsed_event.slot,
-                block_time=parsed_event.block_time,
-                event_type=db_event_type,
-                raw_data=parsed_event.raw_data,
-                parsed_data=parsed_event.data,
-                player_wallet=player_wallet,
-                processed_at=datetime.utcnow()
-            )
-            
-            db.add(event)
+    def _build_event_row(
+        self,
+        parsed_event: ParsedEvent,
+        event_index: int,
+        processed_at: datetime
+    ) -> Dict[str, Any]:
+        """Validate a parsed event and build its events table row (raises ValidationError)."""
+        # Validate event data
+        if not self.event_parser.validate_event_data(parsed_event):
+            raise ValidationError("Event validation failed")
             
-            self.logger.debug(
-                "Event stored",
-                signature=parsed_event.signature,
-                event_type=parsed_event.event_type.value
-            )
-            
-        except Exception as e:
-            self.logger.error(
-                "Failed to store event",
-                signature=parsed_event.signature,
-                event_type=parsed_event.event_type.value,
-                error=str(e)
-            )
-            raise
+        # Additional validation using utils
+        validation_errors = validate_event_data(
+            parsed_event.event_type.value,
+            parsed_event.data
+        )
+        if validation_errors:
+            raise ValidationError(f"Event validation errors: {validation_errors}")
             
+        # Map parser event types to database event types
+        db_event_type = DB_EVENT_TYPE_MAPPING.get(parsed_event.event_type.value)
+        if not db_event_type:
+            raise ValidationError(f"Unknown event type mapping: {parsed_event.event_type.value}")
+        
+        # Extract player_wallet from event data if available
+        player_wallet = None
+        if parsed_event.data:
+            player_wallet = parsed_event.data.get("owner") or parsed_event.data.get("wallet")
+        
+        return {
+            "transaction_signature": parsed_event.signature,
+            "instruction_index": 0,
+            "event_index": event_index,  # Position within the transaction
+            "slot": parsed_event.slot,
+            "block_time": parsed_event.block_time,
+            "event_type": db_event_type,
+            "raw_data": parsed_event.raw_data,
+            "parsed_data": parsed_event.data,
+            "player_wallet": player_wallet,
+            "processed_at": processed_at,
+        }
+        
     async def _load_checkpoint(self):
         """Load the last checkpoint from database."""
         try:
             async with get_async_session() as db:
-                # Get the last processed event
+                # Get the saved checkpoint (primary key lookup)
                 result = await db.execute(
-                    select(Event)
-                    .order_by(desc(Event.slot), desc(Event.processed_at))
-                    .limit(1)
+                    select(Checkpoint).where(Checkpoint.service_name == CHECKPOINT_SERVICE_NAME)
                 )
-                last_event = result.scalar_one_or_none()
+                saved = result.scalar_one_or_none()
                 
-                if last_event:
+                if saved:
                     # Check if checkpoint is too old (configurable lag threshold)
-                    current_slot = await self.solana_client.get_slot()
+                    current_slot = await self._current_slot()
                     MAX_SLOT_LAG = 50000  # If checkpoint is more than 50k slots behind, reset
                     BACKFILL_SLOTS = 1000  # Start 1k slots back for backfill
                     
-                    slot_lag = current_slot - last_event.slot
+                    slot_lag = current_slot - saved.last_slot
                     
                     if slot_lag > MAX_SLOT_LAG:
                         # Checkpoint too old, reset to recent slot
                         reset_slot = max(0, current_slot - BACKFILL_SLOTS)
                         self.logger.warning(
                             "Checkpoint too old, resetting to recent slot",
-                            old_slot=last_event.slot,
+                            old_slot=saved.last_slot,
                             current_slot=current_slot,
                             slot_lag=slot_lag,
                             reset_to_slot=reset_slot
@@ -409,15 +797,15 @@ class TransactionIndexer:
                     else:
                         # Use existing checkpoint
                         self.checkpoint = IndexerCheckpoint(
-                            last_processed_slot=last_event.slot,
-                            last_processed_signature=last_event.transaction_signature,
-                            last_update=last_event.processed_at,
+                            last_processed_slot=saved.last_slot,
+                            last_processed_signature=saved.last_signature,
+                            last_update=saved.updated_at,
                             processed_count=0,  # Could be calculated
                             error_count=0
                         )
                 else:
                     # Start from earlier slot to catch historical transactions
-                    current_slot = await self.solana_client.get_slot()
+                    current_slot = await self._current_slot()
                     # Start from 10000 slots ago to catch business creation transactions (increased to cover user transactions)
                     start_slot = max(0, current_slot - 10000)
                     self.checkpoint = IndexerCheckpoint(
@@ -439,18 +827,45 @@ class TransactionIndexer:
                 error_count=0
             )
             
-    async def _save_checkpoint(self, db: AsyncSession, slot: int, signature: str):
-        """Save checkpoint to track progress."""
+    async def _save_checkpoint(
+        self,
+        db: AsyncSession,
+        slot: int,
+        signature: str,
+        now: Optional[datetime] = None
+    ):
+        """
+        Save checkpoint to track progress (single-row UPSERT), stamped with the batch time.
+        
+        The checkpoint never moves backwards: an older slot leaves the saved
+        one in place.
+        """
+        now = now or datetime.utcnow()
+        if self.checkpoint and slot >= self.checkpoint.last_processed_slot:
+            self.checkpoint.last_processed_slot = slot
+            self.checkpoint.last_processed_signature = signature
+            self.checkpoint.last_update = now
+            
         try:
-            if self.checkpoint:
-                self.checkpoint.last_processed_slot = slot
-                self.checkpoint.last_processed_signature = signature
-                self.checkpoint.last_update = datetime.utcnow()
-                
-            # Note: In a production system, you might want to store checkpoints
-            # in a dedicated table for better recovery capabilities
+            stmt = pg_insert(Checkpoint).values(
+                service_name=CHECKPOINT_SERVICE_NAME,
+                last_slot=slot,
+                last_signature=signature,
+                updated_at=now
+            )
+            await db.execute(stmt.on_conflict_do_update(
+                index_elements=[Checkpoint.service_name],
+                set_={
+                    "last_slot": stmt.excluded.last_slot,
+                    "last_signature": stmt.excluded.last_signature,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+                where=Checkpoint.last_slot <= stmt.excluded.last_slot
+            ))
+            await db.commit()
             
         except Exception as e:
+            await db.rollback()
             self.logger.error("Failed to save checkpoint", error=str(e))
             
     async def get_indexing_status(self) -> Dict[str, Any]:
@@ -459,21 +874,21 @@ class TransactionIndexer:
             async with get_async_session() as db:
                 # Get total events count
                 total_events_result = await db.execute(
-                    select(Event).count()
+                    select(func.count()).select_from(Event)
                 )
-                total_events = total_events_result.scalar()
+                total_events = total_events_result.scalar_one()
                 
                 # Get recent activity (last hour)
                 recent_cutoff = datetime.utcnow() - timedelta(hours=1)
                 recent_events_result = await db.execute(
-                    select(Event)
+                    select(func.count())
+                    .select_from(Event)
                     .where(Event.processed_at >= recent_cutoff)
-                    .count()
                 )
-                recent_events = recent_events_result.scalar()
+                recent_events = recent_events_result.scalar_one()
                 
                 # Get latest block info
-                current_slot = await self.solana_client.get_slot()
+                current_slot = await self._current_slot()
                 
                 return {
                     "status": "running" if self._running else "stopped",
@@ -481,8 +896,8 @@ class TransactionIndexer:
                     "last_processed_slot": self.checkpoint.last_processed_slot if self.checkpoint else None,
                     "total_events_indexed": total_events,
                     "recent_events_indexed": recent_events,
-                    "checkpoint": asdict(self.checkpoint) if self.checkpoint else None,
-                    "stats": asdict(self.stats)
+                    "checkpoint": self.checkpoint.as_dict() if self.checkpoint else None,
+                    "stats": self.stats.as_dict()
                 }
                 
         except Exception as e:
@@ -493,6 +908,11 @@ class TransactionIndexer:
         """
         Reindex transactions starting from a specific slot.
         
+        Slot windows are queued up front and indexed by REINDEX_WORKERS
+        concurrent workers. Event inserts are idempotent, so windows may finish
+        in any order; the checkpoint is saved once, after every window has
+        succeeded, so a failed window is never skipped by a later resume.
+        
         Args:
             start_slot: Slot number to start reindexing from
             batch_size: Number of transactions to process per batch
@@ -500,34 +920,73 @@ class TransactionIndexer:
         try:
             self.logger.info("Starting reindexing", start_slot=start_slot)
             
-            current_slot = await self.solana_client.get_slot()
+            current_slot = await self._current_slot()
             total_slots = current_slot - start_slot
             
-            processed_slots = 0
+            windows: asyncio.Queue = asyncio.Queue()
             current_start = start_slot
-            
-            while current_start < current_slot and not self._should_stop:
+            while current_start < current_slot:
                 batch_end = min(current_start + batch_size, current_slot)
-                
-                self.logger.info(
-                    "Processing slot batch",
-                    start=current_start,
-                    end=batch_end,
-                    progress=f"{processed_slots}/{total_slots}"
-                )
-                
-                batch_stats = await self.index_transactions_batch(
-                    current_start,
-                    batch_end,
-                    batch_size
-                )
-                
-                processed_slots += (batch_end - current_start)
+                windows.put_nowait((current_start, batch_end))
                 current_start = batch_end + 1
                 
-                # Brief pause to avoid overwhelming the RPC
-                await asyncio.sleep(1)
+            loop = asyncio.get_running_loop()
+            pace_lock = asyncio.Lock()
+            next_window_at = 0.0
+            processed_slots = 0
+            newest: Optional[IndexingStats] = None
+            failed = False
+            
+            async def worker():
+                nonlocal next_window_at, processed_slots, newest, failed
+                while not self._should_stop and not failed:
+                    try:
+                        window_start, window_end = windows.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                        
+                    # Space window starts to avoid overwhelming the RPC
+                    async with pace_lock:
+                        delay = next_window_at - loop.time()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        next_window_at = loop.time() + REINDEX_WINDOW_INTERVAL
+                        
+                    try:
+                        window_stats = await self.index_transactions_batch(
+                            window_start, window_end, batch_size, save_checkpoint=False
+                        )
+                    except Exception:
+                        failed = True
+                        raise
+                        
+                    if window_stats.last_processed_slot is not None and (
+                        newest is None or window_stats.last_processed_slot > newest.last_processed_slot
+                    ):
+                        newest = window_stats
+                    processed_slots += window_end - window_start
+                    self.logger.info(
+                        "Processed slot batch",
+                        start=window_start,
+                        end=window_end,
+                        progress=f"{processed_slots}/{total_slots}"
+                    )
+                    
+            results = await asyncio.gather(
+                *(worker() for _ in range(REINDEX_WORKERS)),
+                return_exceptions=True
+            )
+            errors = [result for result in results if isinstance(result, Exception)]
+            if errors:
+                raise errors[0]
                 
+            # A stop request leaves windows unindexed, so the checkpoint stays put
+            if newest is not None and not self._should_stop:
+                async with get_async_session() as db:
+                    await self._save_checkpoint(
+                        db, newest.last_processed_slot, newest.last_processed_signature, newest.start_time
+                    )
+                    
             self.logger.info("Reindexing completed", processed_slots=processed_slots)
             
         except Exception as e:
@@ -552,36 +1011,148 @@ class TransactionIndexer:
         self.logger.info("Stopping transaction indexer")
         self._should_stop = True
         self._running = False
+        
+        for task in self._tasks:
+            task.cancel()
     
     async def _continuous_indexing(self):
-        """Continuously index new transactions."""
+        """
+        Continuously index new transactions.
+        
+        The logs subscription pushes new program signatures as they land and a
+        worker indexes them in small batches; a periodic slot-range pass
+        covers whatever the subscription missed.
+        """
+        self._signature_queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._subscribe_program_logs()),
+            asyncio.create_task(self._drain_signatures()),
+            asyncio.create_task(self._reconcile_slots()),
+        ]
+        
+        try:
+            await asyncio.gather(*self._tasks)
+        except asyncio.CancelledError:
+            self.logger.info("Transaction indexer cancelled")
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+            
+    async def _subscribe_program_logs(self):
+        """Queue signatures of new successful program transactions from logsSubscribe."""
+        attempt = 0
+        
         while self._running and not self._should_stop:
             try:
-                # Get current slot
-                current_slot = await self.solana_client.get_slot()
+                async with websockets.connect(settings.solana_ws_url, ping_interval=20, ping_timeout=20) as websocket:
+                    await websocket.send(LOGS_SUBSCRIBE_REQUEST)
+                    self.logger.info("Subscribed to program logs", url=settings.solana_ws_url)
+                    attempt = 0
+                    
+                    async for raw_message in websocket:
+                        message = orjson.loads(raw_message)
+                        if message.get("method") != "logsNotification":
+                            if "error" in message:
+                                raise IndexerError(f"Subscription error: {message['error']}")
+                            continue
+                            
+                        result = message["params"]["result"]
+                        value = result["value"]
+                        # Failed transactions are never indexed
+                        if value.get("err") is None and value.get("signature"):
+                            self._signature_queue.put_nowait({
+                                "signature": value["signature"],
+                                "slot": result["context"]["slot"],
+                            })
+                            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** attempt) + random.uniform(0, 1)
+                attempt += 1
+                self.logger.error("Program logs subscription failed", error=str(e), retry_in=delay)
+                await asyncio.sleep(delay)
                 
-                # Check if we need to process new slots
-                if self.checkpoint and current_slot > self.checkpoint.last_processed_slot:
-                    start_slot = self.checkpoint.last_processed_slot + 1
-                    end_slot = min(start_slot + 2000, current_slot)  # Process in larger batches to catch up
+    async def _drain_signatures(self):
+        """Index queued signatures, batching those that arrive close together."""
+        loop = asyncio.get_running_loop()
+        
+        while self._running and not self._should_stop:
+            batch = [await self._signature_queue.get()]
+            deadline = loop.time() + LIVE_BATCH_WINDOW
+            
+            while len(batch) < RPC_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._signature_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
                     
-                    self.logger.debug(
-                        "Processing new slots",
-                        start_slot=start_slot,
-                        end_slot=end_slot
-                    )
+            try:
+                batch_stats = IndexingStats(start_time=datetime.utcnow())
+                # The checkpoint stays with the slot-range pass so gaps
+                # left by a dropped subscription are still reconciled
+                async with get_async_session() as db:
+                    await self._index_signatures(db, batch, batch_stats)
+                    
+                if self._debug:
+                    self.logger.debug("Indexed pushed signatures", stats=batch_stats.as_dict())
                     
-                    await self.index_transactions_batch(start_slot, end_slot, 50)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error("Failed to index pushed signatures", count=len(batch), error=str(e))
+                
+    async def _reconcile_slots(self):
+        """Periodically index everything since the checkpoint."""
+        while self._running and not self._should_stop:
+            try:
+                if self.checkpoint and self.checkpoint.last_processed_signature:
+                    # Cursor from the last indexed signature: the RPC node bounds the range
+                    await self.index_new_transactions()
+                else:
+                    # No signature yet (fresh start): fall back to the slot range
+                    await self._reconcile_slot_range()
+                    
+                self._consecutive_errors = 0
                 
                 # Wait before next check
-                await asyncio.sleep(30)  # Check every 30 seconds
+                await asyncio.sleep(RECONCILE_INTERVAL)
                 
             except asyncio.CancelledError:
-                self.logger.info("Transaction indexer cancelled")
-                break
+                raise
             except Exception as e:
-                self.logger.error("Error in continuous indexing", error=str(e))
-                await asyncio.sleep(60)  # Wait longer on error
+                self._consecutive_errors += 1
+                delay = min(RETRY_MAX_DELAY, 2 ** self._consecutive_errors) + random.uniform(0, RETRY_JITTER)
+                self.logger.error(
+                    "Error in continuous indexing",
+                    error=str(e),
+                    consecutive_errors=self._consecutive_errors,
+                    retry_in=round(delay, 1),
+                    rpc_circuit_open=self._rpc_breaker.is_open
+                )
+                await asyncio.sleep(delay)
+                
+    async def _reconcile_slot_range(self):
+        """Index the slot range after the checkpoint slot."""
+        current_slot = await self._current_slot()
+        
+        # Check if we need to process new slots
+        if self.checkpoint and current_slot > self.checkpoint.last_processed_slot:
+            start_slot = self.checkpoint.last_processed_slot + 1
+            end_slot = min(start_slot + 2000, current_slot)  # Process in larger batches to catch up
+            
+            self.logger.debug(
+                "Processing new slots",
+                start_slot=start_slot,
+                end_slot=end_slot
+            )
+            
+            await self.index_transactions_batch(start_slot, end_slot, 50)
 
 
 # Global indexer instance
@@ -3,19 +3,21 @@ Main FastAPI application entry point.
 """
 
 import asyncio
+import importlib
+import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Dict, Optional
 from fastapi import FastAPI, status, WebSocket
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 
 from app.core.config import settings
 from app.core.logging import setup_logging
-from app.core.database import init_database, close_database
+from app.core.database import init_database, warm_up_database, close_database, get_async_session
 from app.api.middleware import add_middleware
 from app.api.schemas.common import HealthCheckResponse, APIResponse
-from app.api.routes import players, businesses, earnings, stats, transactions, referrals, prestige, quests, leaderboards, sync
-from app.api import business_sync
 from app.websocket.websocket_handler import websocket_handler, get_websocket_stats
-from app.admin.admin_routes import admin_router
 
 import structlog
 
@@ -23,6 +25,88 @@ import structlog
 setup_logging()
 logger = structlog.get_logger(__name__)
 
+# Health probe statement, built once for all requests
+_HEALTH_STMT = text("SELECT 1")
+# A healthy probe is reused for a few seconds by every health endpoint so
+# polling clients don't each take a pool connection; failures are not reused
+HEALTH_CACHE_TTL = 5.0
+DB_PROBE_TIMEOUT_ERROR = "Database probe timed out"
+_health_lock = asyncio.Lock()
+_db_health: Dict[str, Any] = {"checked_at": float("-inf"), "error": None}
+
+
+async def _probe_db() -> Optional[str]:
+    """Check database connectivity; returns the error, or None when healthy."""
+    requested_at = time.monotonic()
+    async with _health_lock:
+        checked_at = _db_health["checked_at"]
+        # Reuse a probe that finished while we waited, or a fresh healthy one
+        if checked_at >= requested_at or (
+            _db_health["error"] is None and requested_at - checked_at < HEALTH_CACHE_TTL
+        ):
+            return _db_health["error"]
+            
+        try:
+            async with get_async_session() as db:
+                # Bounded so a stalled database fails the probe fast
+                await asyncio.wait_for(db.execute(_HEALTH_STMT), timeout=settings.health_db_timeout_s)
+            error = None
+        except asyncio.TimeoutError:
+            error = DB_PROBE_TIMEOUT_ERROR
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            
+        _db_health["checked_at"] = time.monotonic()
+        _db_health["error"] = error
+        return error
+
+
+# API routers as ("module:attribute", path segment under the API prefix, tag);
+# imported at startup so route modules and their services aren't loaded at import
+API_ROUTERS = (
+    ("app.api.routes.players:router", "players", "Players"),
+    ("app.api.routes.businesses:router", "businesses", "Businesses"),
+    ("app.api.routes.earnings:router", "earnings", "Earnings"),
+    ("app.api.routes.stats:router", "stats", "Statistics"),
+    ("app.api.routes.transactions:router", "transactions", "Transactions"),
+    ("app.api.routes.referrals:router", "referrals", "Referrals"),
+    ("app.api.routes.prestige:router", "prestige", "Prestige"),
+    ("app.api.routes.quests:router", "quests", "Quests"),
+    ("app.api.routes.leaderboards:router", "leaderboards", "Leaderboards"),
+    ("app.api.routes.sync:router", "sync", "Blockchain Sync"),
+    ("app.api.business_sync:router", "business-sync", "Business Sync"),
+    # Admin endpoints
+    ("app.admin.admin_routes:admin_router", "admin", "Admin"),
+)
+
+
+def include_api_routers(app: FastAPI):
+    """Import the API route modules and include their routers (once per app)."""
+    if getattr(app.state, "api_routers_included", False):
+        return
+        
+    api_prefix = settings.api_v1_prefix
+    for target, segment, tag in API_ROUTERS:
+        module_name, _, attribute = target.partition(":")
+        router = getattr(importlib.import_module(module_name), attribute)
+        app.include_router(router, prefix=f"{api_prefix}/{segment}", tags=[tag])
+    app.state.api_routers_included = True
+
+
+def start_background_task(app: FastAPI, coro, name: str) -> asyncio.Task:
+    """Start a named background task that is kept referenced until it finishes."""
+    task = asyncio.create_task(coro, name=name)
+    app.state.bg_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    task.add_done_callback(app.state.bg_tasks.discard)
+    return task
+
+
+def _on_background_task_done(task: asyncio.Task):
+    """Log background task failures instead of losing them."""
+    if not task.cancelled() and task.exception():
+        logger.error("Background task failed", task=task.get_name(), error=str(task.exception()))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -32,23 +116,49 @@ async def lifespan(app: FastAPI):
     
     try:
         await init_database()
+        await warm_up_database()
         logger.info("Database initialized successfully")
         
-        # Start signature processor (always needed)
-        from app.services.signature_processor import get_signature_processor
-        signature_processor = await get_signature_processor()
-        logger.info("Signature processor started")
+        include_api_routers(app)
+        logger.info("API routers included")
         
-        # Initialize background services
+        # Initialize background services (tracked so shutdown can cancel them)
+        app.state.bg_tasks = set()
         if settings.dynamic_pricing_enabled:
             from app.services.dynamic_pricing_service import dynamic_pricing_service
             logger.info("Starting dynamic pricing service")
-            asyncio.create_task(dynamic_pricing_service.start_price_monitoring())
+            start_background_task(
+                app, dynamic_pricing_service.start_price_monitoring(), "dynamic_pricing"
+            )
         
-        # Start blockchain sync service
+        from app.services.signature_processor import get_signature_processor
+        from app.websocket.pubsub import notification_relay
         from app.services.blockchain_sync_service import start_blockchain_sync
-        await start_blockchain_sync()
-        logger.info("Blockchain sync service started")
+        
+        # Services below only depend on the database, so they start concurrently;
+        # each failure is logged, and only required services abort startup
+        startup_steps = (
+            # (name, coroutine, required)
+            ("Signature processor", get_signature_processor(), True),
+            # Deliver notifications published by the indexer to our WebSocket clients
+            ("WebSocket notification relay", notification_relay.start(), False),
+            ("Blockchain sync service", start_blockchain_sync(), True),
+        )
+        results = await asyncio.gather(
+            *(coro for _, coro, _ in startup_steps), return_exceptions=True
+        )
+        
+        startup_error = None
+        for (name, _, required), result in zip(startup_steps, results):
+            if not isinstance(result, BaseException):
+                logger.info(f"{name} started")
+            elif required:
+                logger.error(f"{name} failed to start", error=str(result))
+                startup_error = startup_error or result
+            else:
+                logger.warning(f"{name} unavailable", error=str(result))
+        if startup_error:
+            raise startup_error
             
         if settings.is_production:
             logger.info("Production mode - additional services initialized")
@@ -64,16 +174,30 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application")
     try:
+        # Cancel background services before their connections are closed
+        bg_tasks = list(app.state.bg_tasks)
+        for task in bg_tasks:
+            task.cancel()
+        await asyncio.gather(*bg_tasks, return_exceptions=True)
+        
         # Stop blockchain sync service
         from app.services.blockchain_sync_service import stop_blockchain_sync
         await stop_blockchain_sync()
         logger.info("Blockchain sync service stopped")
         
+        # Stop notification relay
+        from app.websocket.pubsub import notification_relay
+        await notification_relay.stop()
+        
         # Stop signature processor
         from app.services.signature_processor import shutdown_signature_processor
         await shutdown_signature_processor()
         logger.info("Signature processor stopped")
         
+        # Close the process-wide Solana RPC client (shared connection pool)
+        from app.services.solana_client import close_solana_client
+        await close_solana_client()
+        
         await close_database()
         logger.info("Database connections closed")
     except Exception as e:
@@ -116,51 +240,74 @@ app = FastAPI(
     """,
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Add middleware
 add_middleware(app)
 
-# Health check endpoint
+# Liveness probe: answers without touching dependencies so polling can't load the DB
 @app.get(
     "/health",
     response_model=HealthCheckResponse,
     tags=["System"],
     summary="Health Check",
-    description="Check API server health and service status"
+    description="Liveness probe: the API process is up and serving. "
+                "Use /health/db for readiness and /health/deep for a full dependency check"
 )
 async def health_check():
     """Health check endpoint."""
+    return HealthCheckResponse(
+        status="healthy",
+        version=settings.app_version,
+        services={"api": "healthy"}
+    )
+
+# Deep health check
+@app.get(
+    "/health/deep",
+    response_model=HealthCheckResponse,
+    tags=["System"],
+    summary="Deep Health Check",
+    description="Check API server health and the database and cache services"
+)
+async def deep_health_check():
+    """Cross-service health check endpoint."""
+    from app.cache.redis_client import get_redis_client
+    
+    error = await _probe_db()
+    services = {
+        "database": "healthy" if error is None
+        else "timeout" if error == DB_PROBE_TIMEOUT_ERROR else "unhealthy",
+        "api": "healthy"
+    }
+    
     try:
-        # Check database connectivity
-        from app.core.database import get_async_session
-        from sqlalchemy import text
-        async with get_async_session() as db:
-            await db.execute(text("SELECT 1"))
-        
+        redis_client = await asyncio.wait_for(get_redis_client(), timeout=settings.health_db_timeout_s)
+        cache_health = await asyncio.wait_for(redis_client.health_check(), timeout=settings.health_db_timeout_s)
+        services["cache"] = "healthy" if cache_health.get("status") == "healthy" else "unhealthy"
+    except Exception as e:
+        logger.warning("Cache health check failed", error=str(e) or type(e).__name__)
+        services["cache"] = "unhealthy"
+    
+    if error is None:
         return HealthCheckResponse(
-            status="healthy",
+            status="healthy" if services["cache"] == "healthy" else "degraded",
             version=settings.app_version,
-            services={
-                "database": "healthy",
-                "api": "healthy"
-            }
-        )
-    except Exception as e:
-        logger.error("Health check failed", error=str(e))
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "status": "unhealthy",
-                "version": settings.app_version,
-                "services": {
-                    "database": "unhealthy",
-                    "api": "healthy"
-                },
-                "error": str(e)
-            }
+            services=services
         )
+        
+    logger.error("Health check failed", error=error)
+    return ORJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": "unhealthy",
+            "version": settings.app_version,
+            "services": services,
+            "error": error
+        }
+    )
 
 # Root endpoint
 @app.get(
@@ -172,6 +319,12 @@ async def health_check():
 )
 async def root():
     """Root endpoint with API information."""
+    return _root_response()
+
+
+@lru_cache(maxsize=1)
+def _root_response() -> APIResponse:
+    """API information is fixed for the process lifetime, so it's built once."""
     return APIResponse(
         message=f"Solana Mafia API v{settings.app_version} - Ready to serve!",
         data={
@@ -195,111 +348,55 @@ async def root():
     "/health/db",
     tags=["System"],
     summary="Database Health Check",
-    description="Check database connectivity and health"
+    description="Readiness probe: check database connectivity and health"
 )
 async def database_health():
     """Database health check endpoint."""
-    try:
-        from app.core.database import get_async_session
-        async with get_async_session() as db:
-            await db.execute("SELECT 1")
-        
+    error = await _probe_db()
+    if error is None:
         return {
             "status": "healthy",
             "database": "connected",
             "timestamp": "2024-01-01T00:00:00Z"
         }
-    except Exception as e:
-        logger.error("Database health check failed", error=str(e))
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "status": "unhealthy",
-                "database": "disconnected",
-                "error": str(e)
-            }
-        )
-
-# Include API routers
-app.include_router(
-    players.router,
-    prefix=f"{settings.api_v1_prefix}/players",
-    tags=["Players"]
-)
-
-app.include_router(
-    businesses.router,
-    prefix=f"{settings.api_v1_prefix}/businesses",
-    tags=["Businesses"]
-)
-
-app.include_router(
-    earnings.router,
-    prefix=f"{settings.api_v1_prefix}/earnings",
-    tags=["Earnings"]
-)
-
-app.include_router(
-    stats.router,
-    prefix=f"{settings.api_v1_prefix}/stats",
-    tags=["Statistics"]
-)
-
-app.include_router(
-    transactions.router,
-    prefix=f"{settings.api_v1_prefix}/transactions",
-    tags=["Transactions"]
-)
-
-app.include_router(
-    referrals.router,
-    prefix=f"{settings.api_v1_prefix}/referrals",
-    tags=["Referrals"]
-)
-
-app.include_router(
-    prestige.router,
-    prefix=f"{settings.api_v1_prefix}/prestige",
-    tags=["Prestige"]
-)
-
-app.include_router(
-    quests.router,
-    prefix=f"{settings.api_v1_prefix}/quests",
-    tags=["Quests"]
-)
-
-app.include_router(
-    leaderboards.router,
-    prefix=f"{settings.api_v1_prefix}/leaderboards",
-    tags=["Leaderboards"]
-)
-
-app.include_router(
-    sync.router,
-    prefix=f"{settings.api_v1_prefix}/sync",
-    tags=["Blockchain Sync"]
-)
+        
+    logger.error("Database health check failed", error=error)
+    return ORJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": "unhealthy",
+            "database": "timeout" if error == DB_PROBE_TIMEOUT_ERROR else "disconnected",
+            "error": error
+        }
+    )
 
-app.include_router(
-    business_sync.router,
-    prefix=f"{settings.api_v1_prefix}/business-sync",
-    tags=["Business Sync"]
-)
+# WebSocket endpoints  
+# Admission gate: connections beyond the cap are refused before the handshake
+_ws_slots = asyncio.Semaphore(settings.ws_max_connections)
+_ws_active = 0
+# /ws/stats snapshots are reused for a couple of seconds under polling
+WS_STATS_TTL = 2.0
+_ws_stats_lock = asyncio.Lock()
+_ws_stats_cache: Dict[str, Any] = {}
 
-# Admin endpoints
-app.include_router(
-    admin_router,
-    prefix=f"{settings.api_v1_prefix}/admin",
-    tags=["Admin"]
-)
 
-# WebSocket endpoints  
 @app.websocket("/ws/{wallet}")
 async def websocket_endpoint(websocket: WebSocket, wallet: str):
     """WebSocket endpoint for real-time player updates."""
+    global _ws_active
+    
+    if _ws_slots.locked():
+        logger.warning("WebSocket connection cap reached", limit=settings.ws_max_connections)
+        await websocket.close(code=1013, reason="Try again later")
+        return
+        
     client_id = websocket.query_params.get("client_id")
-    await websocket_handler(websocket, wallet, client_id)
+    async with _ws_slots:
+        _ws_active += 1
+        try:
+            await websocket_handler(websocket, wallet, client_id)
+        finally:
+            _ws_active -= 1
 
 # WebSocket stats endpoint
 @app.get(
@@ -310,11 +407,22 @@ async def websocket_endpoint(websocket: WebSocket, wallet: str):
 )
 async def websocket_stats():
     """Get WebSocket connection statistics."""
-    return await get_websocket_stats()
+    async with _ws_stats_lock:
+        # Concurrent pollers share one snapshot per WS_STATS_TTL
+        cached = _ws_stats_cache.get("response")
+        if cached and time.monotonic() - cached[0] < WS_STATS_TTL:
+            return cached[1]
+            
+        response = await get_websocket_stats(
+            admission={"active": _ws_active, "limit": settings.ws_max_connections}
+        )
+        _ws_stats_cache["response"] = (time.monotonic(), response)
+        return response
 
 logger.info("FastAPI application configured successfully")
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
     
     uvicorn.run(
@@ -322,5 +430,13 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        # reload runs a single worker
+        workers=1 if settings.debug else settings.workers,
+        # uvloop isn't available on Windows
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools",
+        ws="websockets",
+        ws_ping_interval=20,
+        ws_ping_timeout=20,
         log_level=settings.log_level.lower()
     )
\ No newline at end of file
@@ -9,6 +9,7 @@ from .base import BaseModel, TimestampMixin
 from .player import Player
 from .business import Business, BusinessSlot
 from .event import Event
+from .checkpoint import Checkpoint
 from .earnings import EarningsHistory
 from .user import User, UserType
 from .referral import (
@@ -31,6 +32,7 @@ __all__ = [
     "Business",
     "BusinessSlot",
     "Event",
+    "Checkpoint",
     "EarningsHistory",
     "User",
     "UserType",
@@ -3,10 +3,16 @@ Base model classes with common functionality.
 """
 
 from datetime import datetime
-from typing import Any
+from enum import Enum
+from itertools import islice
+from typing import Any, Dict, Iterable, Optional, Sequence, Type
 
-from sqlalchemy import DateTime, func
+import base58
+from sqlalchemy import DateTime, LargeBinary, SmallInteger, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
 
 class Base(DeclarativeBase):
@@ -14,6 +20,64 @@ class Base(DeclarativeBase):
     pass
 
 
+class WalletAddress(TypeDecorator):
+    """Solana address stored as its raw 32 bytes (BYTEA), used as a base58 string."""
+    
+    impl = LargeBinary(32)
+    cache_ok = True
+    
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        raw = base58.b58decode(value)
+        if len(raw) != 32:
+            raise ValueError(f"Invalid wallet address: {value}")
+        return raw
+    
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return base58.b58encode(bytes(value)).decode()
+
+
+class EnumCode(TypeDecorator):
+    """
+    Python Enum stored as a SMALLINT code: the member's declaration position.
+    
+    Codes are persisted, so new members must be appended to the enum, never
+    inserted or reordered.
+    """
+    
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class: Type[Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+    
+    def code(self, member: Enum) -> int:
+        """SMALLINT code of a member (for raw SQL and COPY, which bypass the type)."""
+        return self._codes[member]
+    
+    def member(self, code: int) -> Enum:
+        """Member stored under a code."""
+        return self._members[code]
+    
+    def process_bind_param(self, value: Optional[Enum], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if not isinstance(value, self.enum_class):
+            value = self.enum_class(value)
+        return self._codes[value]
+    
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[Enum]:
+        if value is None:
+            return None
+        return self._members[value]
+
+
 class BaseModel(Base):
     """Base model class with common functionality."""
     
@@ -31,6 +95,34 @@ class BaseModel(Base):
         for key, value in data.items():
             if hasattr(self, key):
                 setattr(self, key, value)
+    
+    @classmethod
+    async def bulk_insert(
+        cls,
+        session: AsyncSession,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = 1000,
+        ignore_conflicts: bool = False,
+        conflict_target: Optional[Sequence[str]] = None
+    ) -> int:
+        """
+        Insert column dicts with one multi-row INSERT per batch; returns the rows inserted.
+        
+        With ignore_conflicts, rows hitting a unique constraint (conflict_target
+        when given, any otherwise) are skipped and not counted. Rows are
+        consumed lazily, so generators keep memory bounded. Runs in the
+        session's transaction; the caller commits.
+        """
+        rows = iter(rows)
+        inserted = 0
+        while batch := list(islice(rows, batch_size)):
+            if ignore_conflicts:
+                stmt = pg_insert(cls).values(batch).on_conflict_do_nothing(index_elements=conflict_target)
+            else:
+                stmt = insert(cls).values(batch)
+            result = await session.execute(stmt)
+            inserted += max(result.rowcount, 0)
+        return inserted
 
 
 class TimestampMixin:
@@ -47,6 +139,5 @@ class TimestampMixin:
         DateTime(timezone=True),
         server_default=func.now(),
         onupdate=func.now(),
-        nullable=False,
-        index=True
+        nullable=False
     )
\ No newline at end of file
@@ -36,6 +36,17 @@ class SlotType(Enum):
     LEGENDARY = 3
 
 
+# Display names shown for each business type
+_BUSINESS_NAMES = {
+    BusinessType.TOBACCO_SHOP: "Lucky Strike Cigars",
+    BusinessType.FUNERAL_SERVICE: "Eternal Rest Funeral",
+    BusinessType.CAR_WORKSHOP: "Midnight Motors Garage",
+    BusinessType.ITALIAN_RESTAURANT: "Nonna's Secret Kitchen",
+    BusinessType.GENTLEMEN_CLUB: "Velvet Shadows Club",
+    BusinessType.CHARITY_FUND: "Angel's Mercy Foundation",
+}
+
+
 class Business(BaseModel, TimestampMixin):
     """Business model representing individual business instances."""
     
@@ -157,15 +168,7 @@ class Business(BaseModel, TimestampMixin):
     @property
     def name(self) -> str:
         """Get business display name."""
-        business_names = {
-            BusinessType.TOBACCO_SHOP: "Lucky Strike Cigars",
-            BusinessType.FUNERAL_SERVICE: "Eternal Rest Funeral",
-            BusinessType.CAR_WORKSHOP: "Midnight Motors Garage", 
-            BusinessType.ITALIAN_RESTAURANT: "Nonna's Secret Kitchen",
-            BusinessType.GENTLEMEN_CLUB: "Velvet Shadows Club",
-            BusinessType.CHARITY_FUND: "Angel's Mercy Foundation"
-        }
-        return business_names.get(self.business_type, "Unknown Business")
+        return _BUSINESS_NAMES.get(self.business_type, "Unknown Business")
     
     @property
     def daily_earnings_estimate(self) -> int:
@@ -0,0 +1,41 @@
+"""
+Checkpoint model - persisted indexer progress.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import String, BigInteger, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class Checkpoint(BaseModel):
+    """Last processed position of an indexer service (one row per service)."""
+    
+    __tablename__ = "indexer_checkpoints"
+    
+    service_name: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+        comment="Indexer service owning the checkpoint"
+    )
+    
+    last_slot: Mapped[int] = mapped_column(
+        BigInteger,
+        comment="Last processed slot"
+    )
+    
+    last_signature: Mapped[str] = mapped_column(
+        String(88),
+        default="",
+        comment="Last processed transaction signature"
+    )
+    
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        comment="When the checkpoint was last saved"
+    )
+    
+    def __repr__(self) -> str:
+        return f"<Checkpoint(service={self.service_name}, slot={self.last_slot})>"
@@ -6,10 +6,16 @@ from datetime import datetime, date
 from typing import List, Optional
 from enum import Enum
 
-from sqlalchemy import Column, Integer, String, DateTime, Date, Boolean, Text, ForeignKey, Index
+from sqlalchemy import Column, Integer, BigInteger, Float, String, DateTime, Date, Boolean, Text, ForeignKey, Index, Computed, func, text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.base import WalletAddress
+
+
+def _utc_now():
+    """Server-side now() as naive UTC, matching the datetime.utcnow() values the tracker writes."""
+    return func.timezone("utc", func.now())
 
 
 class EarningsRunStatus(str, Enum):
@@ -36,6 +42,9 @@ class DailyEarningsRun(Base):
     Tracks each daily earnings processing run to ensure all players are processed.
     """
     __tablename__ = "daily_earnings_runs"
+    # Timestamps are filled by the database; fetch them back with RETURNING
+    # so async code never lazy-loads them
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     
@@ -43,7 +52,7 @@ class DailyEarningsRun(Base):
     earnings_date = Column(Date, nullable=False, comment="Date for which earnings are being processed")
     
     # Run metadata
-    started_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="When the run started")
+    started_at = Column(DateTime, nullable=False, server_default=_utc_now(), comment="When the run started")
     completed_at = Column(DateTime, nullable=True, comment="When the run completed")
     status = Column(String(20), nullable=False, default=EarningsRunStatus.STARTED, comment="Current status of the run")
     
@@ -52,6 +61,15 @@ class DailyEarningsRun(Base):
     players_processed = Column(Integer, nullable=False, default=0, comment="Players successfully processed")
     players_failed = Column(Integer, nullable=False, default=0, comment="Players that failed processing")
     players_skipped = Column(Integer, nullable=False, default=0, comment="Players skipped (no businesses, etc)")
+    success_rate = Column(
+        Float,
+        Computed(
+            "CASE WHEN total_players_found = 0 THEN 0 "
+            "ELSE players_processed * 100.0 / total_players_found END",
+            persisted=True
+        ),
+        comment="Success rate as percentage (generated)"
+    )
     
     # Processing details
     batch_size = Column(Integer, nullable=False, default=500, comment="Batch size used for processing")
@@ -70,19 +88,12 @@ class DailyEarningsRun(Base):
     player_statuses = relationship("PlayerDailyEarningsStatus", back_populates="earnings_run", cascade="all, delete-orphan")
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=_utc_now())
+    updated_at = Column(DateTime, nullable=False, server_default=_utc_now(), onupdate=_utc_now())
     
     def __repr__(self):
         return f"<DailyEarningsRun(id={self.id}, date={self.earnings_date}, status={self.status})>"
     
-    @property
-    def success_rate(self) -> float:
-        """Calculate success rate as percentage."""
-        if self.total_players_found == 0:
-            return 0.0
-        return (self.players_processed / self.total_players_found) * 100
-    
     @property
     def is_complete(self) -> bool:
         """Check if run is completed (successfully or failed)."""
@@ -99,11 +110,12 @@ class PlayerDailyEarningsStatus(Base):
     Tracks the earnings status for each player on each day to ensure no one is missed.
     """
     __tablename__ = "player_daily_earnings_status"
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     
     # Player and date
-    player_wallet = Column(String(44), nullable=False, comment="Player wallet address")
+    player_wallet = Column(WalletAddress, nullable=False, comment="Player wallet address (32 raw bytes)")
     earnings_date = Column(Date, nullable=False, comment="Date for which earnings are tracked")
     earnings_run_id = Column(Integer, ForeignKey("daily_earnings_runs.id"), nullable=False, comment="Associated earnings run")
     
@@ -113,10 +125,19 @@ class PlayerDailyEarningsStatus(Base):
     # Business information at time of processing
     businesses_count = Column(Integer, nullable=False, default=0, comment="Number of businesses player had")
     total_business_levels = Column(Integer, nullable=False, default=0, comment="Sum of all business levels")
-    expected_earnings_lamports = Column(Integer, nullable=False, default=0, comment="Expected earnings amount in lamports")
+    expected_earnings_lamports = Column(BigInteger, nullable=False, default=0, comment="Expected earnings amount in lamports")
     
     # Processing results
-    actual_earnings_applied = Column(Integer, nullable=True, comment="Actual earnings applied in lamports")
+    actual_earnings_applied = Column(BigInteger, nullable=True, comment="Actual earnings applied in lamports")
+    earnings_variance_percentage = Column(
+        Float,
+        Computed(
+            "CASE WHEN expected_earnings_lamports = 0 OR COALESCE(actual_earnings_applied, 0) = 0 THEN 0 "
+            "ELSE abs(expected_earnings_lamports - actual_earnings_applied) * 100.0 / expected_earnings_lamports END",
+            persisted=True
+        ),
+        comment="Variance between expected and actual earnings as percentage (generated)"
+    )
     processing_attempts = Column(Integer, nullable=False, default=0, comment="Number of processing attempts")
     
     # Timing
@@ -138,8 +159,8 @@ class PlayerDailyEarningsStatus(Base):
     earnings_run = relationship("DailyEarningsRun", back_populates="player_statuses")
     
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=_utc_now())
+    updated_at = Column(DateTime, nullable=False, server_default=_utc_now(), onupdate=_utc_now())
     
     def __repr__(self):
         return f"<PlayerDailyEarningsStatus(player={self.player_wallet}, date={self.earnings_date}, status={self.status})>"
@@ -153,15 +174,6 @@ class PlayerDailyEarningsStatus(Base):
     def is_successful(self) -> bool:
         """Check if player processing succeeded."""
         return self.status == PlayerEarningsStatus.SUCCESS
-    
-    @property
-    def earnings_variance_percentage(self) -> float:
-        """Calculate variance between expected and actual earnings."""
-        if self.expected_earnings_lamports == 0 or not self.actual_earnings_applied:
-            return 0.0
-        
-        variance = abs(self.expected_earnings_lamports - self.actual_earnings_applied)
-        return (variance / self.expected_earnings_lamports) * 100
 
 
 # Database indexes for performance
@@ -170,5 +182,33 @@ Index('idx_daily_earnings_runs_status', DailyEarningsRun.status)
 
 Index('idx_player_earnings_status_date', PlayerDailyEarningsStatus.earnings_date)
 Index('idx_player_earnings_status_player_date', PlayerDailyEarningsStatus.player_wallet, PlayerDailyEarningsStatus.earnings_date)
-Index('idx_player_earnings_status_failed', PlayerDailyEarningsStatus.status, PlayerDailyEarningsStatus.needs_manual_review)
-Index('idx_player_earnings_status_run', PlayerDailyEarningsStatus.earnings_run_id)
\ No newline at end of file
+# Partial indexes: successful rows (the vast majority) stay out of the
+# failed/pending scans, so these indexes don't grow with history
+Index(
+    'idx_player_earnings_status_failed',
+    PlayerDailyEarningsStatus.earnings_date,
+    PlayerDailyEarningsStatus.status,
+    PlayerDailyEarningsStatus.needs_manual_review,
+    postgresql_where=text("status <> 'success'")
+)
+Index(
+    'idx_player_earnings_status_pending',
+    PlayerDailyEarningsStatus.earnings_date,
+    PlayerDailyEarningsStatus.player_wallet,
+    postgresql_where=text("status = 'pending'")
+)
+# One status row per player per run (conflict target for the bulk insert);
+# also serves lookups by run alone
+Index(
+    'uq_player_earnings_status_run_player',
+    PlayerDailyEarningsStatus.earnings_run_id,
+    PlayerDailyEarningsStatus.player_wallet,
+    unique=True
+)
+# Scheduler's due-row scan: pending players of a run
+Index(
+    'idx_player_earnings_status_run_pending',
+    PlayerDailyEarningsStatus.earnings_run_id,
+    PlayerDailyEarningsStatus.player_wallet,
+    postgresql_where=text("status = 'pending'")
+)
\ No newline at end of file
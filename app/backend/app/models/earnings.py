@@ -7,8 +7,8 @@ from typing import Optional
 from enum import Enum
 
 from sqlalchemy import (
-    String, Integer, BigInteger, Boolean, ForeignKey, Index, 
-    Enum as SQLEnum, Text
+    String, Integer, BigInteger, Boolean, DateTime, ForeignKey, Identity, Index, 
+    Enum as SQLEnum, Text, func
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,7 +22,8 @@ class EarningsHistory(BaseModel, TimestampMixin):
     __tablename__ = "earnings_history"
     
     # Primary key
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # Identity caches 100 ids per session so bulk inserts rarely touch the sequence
+    id: Mapped[int] = mapped_column(BigInteger, Identity(always=False, cache=100), primary_key=True)
     
     # Player reference
     player_wallet: Mapped[str] = mapped_column(
@@ -96,6 +97,13 @@ class EarningsHistory(BaseModel, TimestampMixin):
         comment="Version of system that processed this"
     )
     
+    # TimestampMixin column without its B-tree: idx_earnings_history_created_brin covers it
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    
     # Relationships
     player: Mapped["Player"] = relationship(
         "Player",
@@ -106,18 +114,13 @@ class EarningsHistory(BaseModel, TimestampMixin):
     __table_args__ = (
         Index("idx_earnings_history_player_time", "player_wallet", "created_at"),
         Index("idx_earnings_history_event_type", "event_type", "created_at"),
-        Index("idx_earnings_history_amount", "amount"),
         Index("idx_earnings_history_signature", "transaction_signature"),
+        Index("idx_earnings_history_created_brin", "created_at", postgresql_using="brin"),
     )
     
     def __repr__(self) -> str:
         return f"<EarningsHistory(player={self.player_wallet}, type={self.event_type}, amount={self.amount})>"
     
-    @property
-    def amount_in_sol(self) -> float:
-        """Get amount in SOL (assuming 1 SOL = 1e9 lamports)."""
-        return self.amount / 1e9
-    
     @classmethod
     def create_update_record(
         cls,
@@ -3,19 +3,21 @@ Event model - stores indexed blockchain events.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 from enum import Enum
 
 from sqlalchemy import (
-    String, Integer, BigInteger, Text, Index, JSON, Enum as SQLEnum
+    String, Integer, BigInteger, DateTime, Sequence, Text, Index, func, text
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 
-from .base import BaseModel, TimestampMixin
+from .base import BaseModel, TimestampMixin, EnumCode
 
 
 class EventType(Enum):
-    """Event types matching the Solana program events."""
+    """Event types matching the Solana program events (stored by position: append only)."""
     
     # Player events
     PLAYER_CREATED = "player_created"
@@ -48,7 +50,7 @@ class EventType(Enum):
 
 
 class EventStatus(Enum):
-    """Event processing status."""
+    """Event processing status (stored by position: append only)."""
     PENDING = "pending"
     PROCESSING = "processing"
     PROCESSED = "processed"
@@ -56,17 +58,70 @@ class EventStatus(Enum):
     SKIPPED = "skipped"
 
 
+# Partitioned tables can't have identity columns before Postgres 17, so ids come
+# from a plain sequence; CACHE 100 hands each session a block of ids
+EVENT_ID_SEQUENCE = Sequence("events_id_seq", cache=100)
+
+# Columns of idx_event_signature_unique, the ON CONFLICT target for event inserts
+EVENT_UNIQUE_KEY = ("transaction_signature", "instruction_index", "event_index", "block_time")
+
+
+# Event groups used by the is_*_event checks
+_PLAYER_EVENTS = frozenset({
+    EventType.PLAYER_CREATED,
+    EventType.EARNINGS_UPDATED,
+    EventType.EARNINGS_CLAIMED,
+    EventType.SLOT_UNLOCKED,
+    EventType.PREMIUM_SLOT_PURCHASED,
+    EventType.REFERRAL_BONUS_ADDED,
+})
+
+_BUSINESS_EVENTS = frozenset({
+    EventType.BUSINESS_CREATED,
+    EventType.BUSINESS_UPGRADED,
+    EventType.BUSINESS_SOLD,
+    EventType.BUSINESS_CREATED_IN_SLOT,
+    EventType.BUSINESS_UPGRADED_IN_SLOT,
+    EventType.BUSINESS_SOLD_FROM_SLOT,
+})
+
+_NFT_EVENTS = frozenset({
+    EventType.BUSINESS_NFT_MINTED,
+    EventType.BUSINESS_NFT_BURNED,
+    EventType.BUSINESS_NFT_UPGRADED,
+    EventType.BUSINESS_TRANSFERRED,
+    EventType.BUSINESS_DEACTIVATED,
+})
+
+# Human-readable summaries, filled with the event's wallet / mint
+_EVENT_SUMMARY_TEMPLATES: Dict[EventType, str] = {
+    EventType.PLAYER_CREATED: "Player {wallet} created",
+    EventType.BUSINESS_CREATED: "Business created by {wallet}",
+    EventType.BUSINESS_UPGRADED: "Business upgraded by {wallet}",
+    EventType.BUSINESS_SOLD: "Business sold by {wallet}",
+    EventType.EARNINGS_UPDATED: "Earnings updated for {wallet}",
+    EventType.EARNINGS_CLAIMED: "Earnings claimed by {wallet}",
+    EventType.BUSINESS_NFT_MINTED: "Business NFT {mint} minted",
+    EventType.BUSINESS_NFT_BURNED: "Business NFT {mint} burned",
+}
+
+
 class Event(BaseModel, TimestampMixin):
     """Event model for storing indexed blockchain events."""
     
     __tablename__ = "events"
     
-    # Primary key
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # Primary key (with block_time, the partition key)
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        EVENT_ID_SEQUENCE,
+        server_default=EVENT_ID_SEQUENCE.next_value(),
+        primary_key=True
+    )
     
     # Event identification
     event_type: Mapped[EventType] = mapped_column(
-        SQLEnum(EventType),
+        EnumCode(EventType),
         comment="Type of event"
     )
     
@@ -94,17 +149,18 @@ class Event(BaseModel, TimestampMixin):
     )
     
     block_time: Mapped[datetime] = mapped_column(
-        comment="Block timestamp"
+        primary_key=True,
+        comment="Block timestamp (monthly partition key)"
     )
     
     # Event data
     raw_data: Mapped[Dict[str, Any]] = mapped_column(
-        JSON,
+        JSONB,
         comment="Raw event data from blockchain"
     )
     
     parsed_data: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONB,
         comment="Parsed and structured event data"
     )
     
@@ -121,7 +177,7 @@ class Event(BaseModel, TimestampMixin):
     
     # Processing status
     status: Mapped[EventStatus] = mapped_column(
-        SQLEnum(EventStatus),
+        EnumCode(EventStatus),
         default=EventStatus.PENDING,
         comment="Processing status"
     )
@@ -148,62 +204,91 @@ class Event(BaseModel, TimestampMixin):
         comment="Version of indexer that processed this event"
     )
     
+    # TimestampMixin column without its B-tree: idx_event_created_brin covers it
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    
     # Indexes for performance
     __table_args__ = (
         Index("idx_event_type_slot", "event_type", "slot"),
         Index("idx_event_player_type", "player_wallet", "event_type"),
-        Index("idx_event_signature_unique", "transaction_signature", "instruction_index", "event_index", unique=True),
+        # Unique indexes on a partitioned table must include the partition key
+        Index("idx_event_signature_unique", *EVENT_UNIQUE_KEY, unique=True),
         Index("idx_event_status_created", "status", "created_at"),
-        Index("idx_event_block_time", "block_time"),
+        # Append-ordered timestamps: BRIN block ranges instead of a full B-tree
+        Index("idx_event_block_time_brin", "block_time", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("idx_event_created_brin", "created_at", postgresql_using="brin"),
         Index("idx_event_business_mint", "business_mint"),
-        Index("idx_event_pending_retry", "status", "retry_count"),
+        # Retry scan only ever looks at failed events (3 = EventStatus.FAILED code)
+        Index("idx_event_pending_retry", "retry_count", postgresql_where=text("status = 3")),
+        Index("idx_event_processed_at", "processed_at"),
+        # Containment lookups on event payload fields (parsed_data @> '{...}')
+        Index(
+            "idx_event_parsed_gin", "parsed_data",
+            postgresql_using="gin", postgresql_ops={"parsed_data": "jsonb_path_ops"}
+        ),
+        # Monthly partitions, see ensure_partitions()
+        {"postgresql_partition_by": "RANGE (block_time)"},
     )
     
+    @classmethod
+    async def ensure_partitions(
+        cls,
+        session: Union[AsyncSession, AsyncConnection],
+        months_ahead: int = 1,
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Create the monthly partitions from the current month through
+        `months_ahead` months ahead, plus the default partition that catches
+        anything outside them; returns the monthly partition names.
+        
+        Existing partitions are left alone. Runs in the caller's transaction,
+        on either a session (scheduler) or a connection (create_tables).
+        """
+        now = now or datetime.utcnow()
+        table = cls.__tablename__
+        await session.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+        
+        names = []
+        year, month = now.year, now.month
+        for _ in range(months_ahead + 1):
+            start = datetime(year, month, 1)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            end = datetime(year, month, 1)
+            name = f"{table}_{start:%Y_%m}"
+            await session.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+            ))
+            names.append(name)
+        return names
+    
     def __repr__(self) -> str:
         return f"<Event(id={self.id}, type={self.event_type.value}, signature={self.transaction_signature[:8]}...)>"
     
     @property
     def is_player_event(self) -> bool:
         """Check if this is a player-related event."""
-        player_events = {
-            EventType.PLAYER_CREATED,
-            EventType.EARNINGS_UPDATED,
-            EventType.EARNINGS_CLAIMED,
-            EventType.SLOT_UNLOCKED,
-            EventType.PREMIUM_SLOT_PURCHASED,
-            EventType.REFERRAL_BONUS_ADDED,
-        }
-        return self.event_type in player_events
+        return self.event_type in _PLAYER_EVENTS
     
     @property
     def is_business_event(self) -> bool:
         """Check if this is a business-related event."""
-        business_events = {
-            EventType.BUSINESS_CREATED,
-            EventType.BUSINESS_UPGRADED,
-            EventType.BUSINESS_SOLD,
-            EventType.BUSINESS_CREATED_IN_SLOT,
-            EventType.BUSINESS_UPGRADED_IN_SLOT,
-            EventType.BUSINESS_SOLD_FROM_SLOT,
-        }
-        return self.event_type in business_events
+        return self.event_type in _BUSINESS_EVENTS
     
     @property
     def is_nft_event(self) -> bool:
         """Check if this is an NFT-related event."""
-        nft_events = {
-            EventType.BUSINESS_NFT_MINTED,
-            EventType.BUSINESS_NFT_BURNED,
-            EventType.BUSINESS_NFT_UPGRADED,
-            EventType.BUSINESS_TRANSFERRED,
-            EventType.BUSINESS_DEACTIVATED,
-        }
-        return self.event_type in nft_events
-    
-    def mark_as_processed(self) -> None:
-        """Mark event as successfully processed."""
+        return self.event_type in _NFT_EVENTS
+    
+    def mark_as_processed(self, now: Optional[datetime] = None) -> None:
+        """Mark event as successfully processed (now: shared batch timestamp)."""
         self.status = EventStatus.PROCESSED
-        self.processed_at = datetime.utcnow()
+        self.processed_at = now or datetime.utcnow()
         self.error_message = None
     
     def mark_as_failed(self, error: str) -> None:
@@ -222,18 +307,7 @@ class Event(BaseModel, TimestampMixin):
     
     def get_event_summary(self) -> str:
         """Get human-readable event summary."""
-        summaries = {
-            EventType.PLAYER_CREATED: f"Player {self.player_wallet} created",
-            EventType.BUSINESS_CREATED: f"Business created by {self.player_wallet}",
-            EventType.BUSINESS_UPGRADED: f"Business upgraded by {self.player_wallet}",
-            EventType.BUSINESS_SOLD: f"Business sold by {self.player_wallet}",
-            EventType.EARNINGS_UPDATED: f"Earnings updated for {self.player_wallet}",
-            EventType.EARNINGS_CLAIMED: f"Earnings claimed by {self.player_wallet}",
-            EventType.BUSINESS_NFT_MINTED: f"Business NFT {self.business_mint} minted",
-            EventType.BUSINESS_NFT_BURNED: f"Business NFT {self.business_mint} burned",
-        }
-        
-        return summaries.get(
-            self.event_type,
-            f"{self.event_type.value} event"
-        )
\ No newline at end of file
+        template = _EVENT_SUMMARY_TEMPLATES.get(self.event_type)
+        if template is None:
+            return f"{self.event_type.value} event"
+        return template.format(wallet=self.player_wallet, mint=self.business_mint)
\ No newline at end of file
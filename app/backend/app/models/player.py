@@ -2,16 +2,32 @@
 Player model - mirrors the on-chain Player state with additional indexing.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
 from decimal import Decimal
 
 from sqlalchemy import (
-    String, Integer, BigInteger, Boolean, DECIMAL, Text, Index, DateTime
+    String, Integer, BigInteger, Boolean, DECIMAL, Text, Index, DateTime,
+    select, func, case
 )
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel, TimestampMixin
+from .business import Business
+
+
+# Early sell fee brackets from the smart contract (constants.rs) as
+# (held for fewer than N days, fee percent); held longer: FINAL_SELL_FEE_PERCENT
+SELL_FEE_BRACKETS = ((7, 25), (14, 20), (21, 15), (28, 10), (31, 5))
+FINAL_SELL_FEE_PERCENT = 2
+
+# The brackets expanded to one fee per day held, for the in-Python path
+_EARLY_SELL_FEES = bytes(
+    fee
+    for (start, _), (end, fee) in zip(((0, None),) + SELL_FEE_BRACKETS, SELL_FEE_BRACKETS)
+    for _day in range(start, end)
+)
 
 
 class Player(BaseModel, TimestampMixin):
@@ -202,7 +218,8 @@ class Player(BaseModel, TimestampMixin):
     __table_args__ = (
         Index("idx_player_next_earnings", "next_earnings_time"),
         Index("idx_player_active_earnings", "is_active", "next_earnings_time"),
-        Index("idx_player_created_at", "created_at"),
+        # Leaderboard activity filter; the other tables' updated_at aren't queried
+        Index("ix_players_updated_at", "updated_at"),
         Index("idx_player_referrer", "referrer_wallet"),
         Index("idx_player_sync", "last_sync_at"),
         Index("idx_player_prestige_level_main", "prestige_level"),
@@ -231,17 +248,6 @@ class Player(BaseModel, TimestampMixin):
         total_liquidation_value = 0
         current_time = datetime.utcnow()
         
-        # Early sell fee schedule from smart contract (constants.rs)
-        # Days 0-6: 25%, Days 7-13: 20%, Days 14-20: 15%, Days 21-27: 10%, Days 28-30: 5%, After: 2%
-        early_sell_fees = [
-            25, 25, 25, 25, 25, 25, 25,  # Days 0-6: 25%
-            20, 20, 20, 20, 20, 20, 20,  # Days 7-13: 20%
-            15, 15, 15, 15, 15, 15, 15,  # Days 14-20: 15%
-            10, 10, 10, 10, 10, 10, 10,  # Days 21-27: 10%
-            5,  5,  5,  2               # Days 28-30: 5%, final: 2%
-        ]
-        final_sell_fee_percent = 2
-        
         for business in businesses:
             if not business.is_active:
                 continue
@@ -254,10 +260,10 @@ class Player(BaseModel, TimestampMixin):
                 days_held = (current_time - business.created_at).days if business.created_at else 0
             
             # Get base fee percentage based on days held
-            if days_held < len(early_sell_fees):
-                base_fee_percent = early_sell_fees[days_held]
+            if days_held < len(_EARLY_SELL_FEES):
+                base_fee_percent = _EARLY_SELL_FEES[days_held]
             else:
-                base_fee_percent = final_sell_fee_percent
+                base_fee_percent = FINAL_SELL_FEE_PERCENT
             
             # TODO: Account for slot discounts (Premium/VIP/Legendary slots reduce fees)
             # For now, use base fee without slot discounts
@@ -272,19 +278,51 @@ class Player(BaseModel, TimestampMixin):
         
         return total_liquidation_value
 
-    @property
-    def net_profit(self) -> int:
-        """Net profit including current liquidation value of businesses."""
+    @classmethod
+    async def get_business_liquidation_value(cls, session: AsyncSession, wallet: str) -> int:
+        """
+        Total liquidation value of a player's active businesses, summed in SQL.
+        
+        Same fee schedule as calculate_business_liquidation_value, without
+        loading the businesses relationship (which can't lazy-load in async code).
+        """
+        # Compare naive UTC timestamps, as the Python path does with utcnow():
+        # mixing in timestamptz would shift the brackets by the session TimeZone
+        held_since = func.coalesce(
+            Business.on_chain_created_at, func.timezone("utc", Business.created_at)
+        )
+        now_utc = func.timezone("utc", func.now())
+        invested = Business.total_invested_amount
+        fee_percent = case(
+            *[
+                (held_since > now_utc - timedelta(days=days), fee)
+                for days, fee in SELL_FEE_BRACKETS
+            ],
+            else_=FINAL_SELL_FEE_PERCENT
+        )
+        result = await session.execute(
+            select(func.coalesce(func.sum(invested - invested * fee_percent // 100), 0))
+            .where(Business.player_wallet == wallet, Business.is_active == True)
+        )
+        return int(result.scalar_one())
+
+    def calculate_net_profit(self, liquidation_value: int) -> int:
+        """Net profit given the current liquidation value of the player's businesses."""
         total_investment = self.total_invested + self.total_upgrade_spent + self.total_slot_spent
         
         # Include ONLY claimed earnings + liquidation value of businesses
         # Pending earnings are NOT included to avoid double counting when they get claimed
         total_assets = (
             self.total_earned +  # Already claimed earnings
-            self.calculate_business_liquidation_value()  # Current sale value of businesses
+            liquidation_value  # Current sale value of businesses
         )
         
         return total_assets - total_investment
+
+    @property
+    def net_profit(self) -> int:
+        """Net profit including current liquidation value of businesses."""
+        return self.calculate_net_profit(self.calculate_business_liquidation_value())
     
     @property
     def is_earnings_due(self) -> bool:
@@ -327,6 +327,9 @@ class BlockchainEarningsScheduler:
                     PlayerDailyEarningsStatus.status == PlayerEarningsStatus.PENDING
                 )
             )
+            # Stable row order (served by the run_pending index) so concurrent
+            # runs update players in the same sequence
+            .order_by(PlayerDailyEarningsStatus.player_wallet)
         )
         pending_players = result.scalars().all()
         
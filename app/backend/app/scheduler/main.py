@@ -41,6 +41,13 @@ class SchedulerMain:
             self.earnings_scheduler = BlockchainEarningsScheduler()
             self.task_scheduler = TaskScheduler()
             
+            # Events are partitioned by month; keep the next one created ahead
+            self.task_scheduler.register_task(
+                "event_partitions",
+                self.task_scheduler.ensure_event_partitions,
+                interval_seconds=86400,  # 1 day
+                run_immediately=True
+            )
             
             logger.info("Scheduler service initialized successfully")
             
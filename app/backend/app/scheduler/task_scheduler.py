@@ -258,6 +258,12 @@ class TaskScheduler:
         }
     
     # Task implementations
+    async def ensure_event_partitions(self):
+        """Create next month's events partition ahead of time."""
+        async with get_async_session() as session:
+            partitions = await Event.ensure_partitions(session)
+        logger.debug("Event partitions ensured", partitions=partitions)
+    
     async def _cleanup_old_events(self):
         """Clean up old events from database."""
         cutoff_date = datetime.utcnow() - timedelta(days=30)  # Keep 30 days
@@ -29,6 +29,9 @@ from typing import Any
 
 logger = structlog.get_logger(__name__)
 
+# Endpoint cool-down after errors, indexed by error count: 1s, 2s, 4s ... 64s cap
+ENDPOINT_BACKOFF = tuple(timedelta(seconds=2 ** n) for n in range(7))
+
 
 class RpcPlanType(Enum):
     FREE = "free"
@@ -245,7 +248,7 @@ class AdaptiveRpcClient:
         for endpoint in self.endpoints:
             # Skip endpoints with recent errors (exponential backoff)
             if endpoint.last_error_time:
-                backoff_duration = timedelta(seconds=2 ** min(endpoint.error_count, 6))
+                backoff_duration = ENDPOINT_BACKOFF[min(endpoint.error_count, len(ENDPOINT_BACKOFF) - 1)]
                 if current_time - endpoint.last_error_time < backoff_duration:
                     continue
             
@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, and_, func, desc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 
 import structlog
@@ -42,7 +43,7 @@ class EarningsRunSummary:
     failed_players: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerEarningsInfo:
     """Information about a player's businesses and expected earnings."""
     wallet: str
@@ -109,21 +110,26 @@ class DailyEarningsTracker:
         self.db.add(earnings_run)
         await self.db.flush()  # Get the ID
         
-        # Create status records for all players
-        player_statuses = []
-        for player_info in players_info:
-            status = PlayerDailyEarningsStatus(
-                player_wallet=player_info.wallet,
-                earnings_date=earnings_date,
-                earnings_run_id=earnings_run.id,
-                status=PlayerEarningsStatus.PENDING,
-                businesses_count=player_info.businesses_count,
-                total_business_levels=player_info.total_levels,
-                expected_earnings_lamports=player_info.expected_earnings
+        # Create status records for all players (one executemany INSERT,
+        # batched by SQLAlchemy, instead of an ORM INSERT per player)
+        if players_info:
+            await self.db.execute(
+                pg_insert(PlayerDailyEarningsStatus).on_conflict_do_nothing(
+                    index_elements=["earnings_run_id", "player_wallet"]
+                ),
+                [
+                    {
+                        "player_wallet": player_info.wallet,
+                        "earnings_date": earnings_date,
+                        "earnings_run_id": earnings_run.id,
+                        "status": PlayerEarningsStatus.PENDING.value,
+                        "businesses_count": player_info.businesses_count,
+                        "total_business_levels": player_info.total_levels,
+                        "expected_earnings_lamports": player_info.expected_earnings,
+                    }
+                    for player_info in players_info
+                ]
             )
-            player_statuses.append(status)
-        
-        self.db.add_all(player_statuses)
         
         # Update run status
         earnings_run.status = EarningsRunStatus.IN_PROGRESS
@@ -146,6 +152,8 @@ class DailyEarningsTracker:
         player_wallet: str
     ) -> None:
         """Mark a player as currently being processed."""
+        # One clock read for both attempt columns of this write
+        now = datetime.utcnow()
         await self.db.execute(
             update(PlayerDailyEarningsStatus)
             .where(
@@ -156,8 +164,8 @@ class DailyEarningsTracker:
             )
             .values(
                 status=PlayerEarningsStatus.PROCESSING,
-                first_attempt_at=datetime.utcnow(),
-                last_attempt_at=datetime.utcnow(),
+                first_attempt_at=now,
+                last_attempt_at=now,
                 processing_attempts=PlayerDailyEarningsStatus.processing_attempts + 1
             )
         )
@@ -169,6 +177,8 @@ class DailyEarningsTracker:
         actual_earnings: int
     ) -> None:
         """Mark a player as successfully processed."""
+        # Stamped when the result is written, not when processing started
+        now = datetime.utcnow()
         await self.db.execute(
             update(PlayerDailyEarningsStatus)
             .where(
@@ -180,8 +190,8 @@ class DailyEarningsTracker:
             .values(
                 status=PlayerEarningsStatus.SUCCESS,
                 actual_earnings_applied=actual_earnings,
-                success_at=datetime.utcnow(),
-                last_attempt_at=datetime.utcnow()
+                success_at=now,
+                last_attempt_at=now
             )
         )
         
@@ -5,6 +5,7 @@ Handles parsing, validation, and transformation of blockchain events into databa
 
 import json
 import base64
+import re
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 from dataclasses import dataclass
@@ -23,6 +24,28 @@ from app.services.solana_client import TransactionInfo
 logger = structlog.get_logger(__name__)
 
 
+# Precompiled little-endian Borsh layouts (discriminator already stripped).
+# Borsh is packed, so fields follow each other with no alignment padding and
+# the layouts mirror the #[event] structs in lib.rs field by field.
+# Fixed-size events are decoded with a single unpack_from() call instead of
+# slicing and unpacking every field separately.
+PLAYER_CREATED_LAYOUT = struct.Struct("<32sQqq")  # wallet, entry_fee, created_at, next_earnings_time
+EARNINGS_UPDATED_LAYOUT = struct.Struct("<32sQQqB")  # player, earnings_added, total_pending, next_earnings_time, businesses_count
+EARNINGS_CLAIMED_LAYOUT = struct.Struct("<32sQq")  # player, amount, claimed_at
+BUSINESS_CREATED_LAYOUT = struct.Struct("<32sBQHQq")  # player, business_type, invested_amount, daily_rate, treasury_fee, created_at
+BUSINESS_CREATED_IN_SLOT_LAYOUT = struct.Struct("<32sBBBQQQH")  # player, slot_index, business_type, level, base_cost, slot_cost, total_paid, daily_rate
+BUSINESS_UPGRADED_LAYOUT = struct.Struct("<32sBBQH")  # player, business_index, new_level, upgrade_cost, new_daily_rate
+BUSINESS_UPGRADED_IN_SLOT_LAYOUT = struct.Struct("<32sBBBQH")  # player, slot_index, old_level, new_level, upgrade_cost, new_daily_rate
+
+# Log lines that can carry an event: Anchor "Program data:", the human-readable
+# earnings log, or a legacy "Program log: <event_signature>:" line
+EVENT_LOG_RE = re.compile(
+    r"Program data:|💰 Earnings updated for player:|Program log:\s*(?:"
+    + "|".join(re.escape(name) for name in SolanaConfig.EVENT_SIGNATURES.values())
+    + "):"
+)
+
+
 class EventType(Enum):
     """Enumeration of all supported event types from the Solana program."""
     PLAYER_CREATED = "PlayerCreated"
@@ -41,7 +64,7 @@ class EventType(Enum):
     REFERRAL_BONUS_ADDED = "ReferralBonusAdded"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedEvent:
     """Parsed event data from a Solana transaction."""
     event_type: EventType
@@ -51,9 +74,12 @@ class ParsedEvent:
     data: Dict[str, Any]
     raw_data: Dict[str, Any]
     instruction_index: Optional[int] = None
+    # True when every field was decoded from a full fixed-layout Borsh blob,
+    # i.e. the event needs no RPC round-trip to be complete
+    data_complete: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerCreatedEvent:
     """Player created event data."""
     wallet: str
@@ -63,7 +89,7 @@ class PlayerCreatedEvent:
     signature: str
 
 
-@dataclass  
+@dataclass(slots=True)
 class BusinessCreatedEvent:
     """Business created event data."""
     business_id: str
@@ -77,7 +103,7 @@ class BusinessCreatedEvent:
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessUpgradedEvent:
     """Business upgraded event data."""
     business_id: str
@@ -90,7 +116,7 @@ class BusinessUpgradedEvent:
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessSoldEvent:
     """Business sold event data."""
     business_id: str
@@ -104,7 +130,7 @@ class BusinessSoldEvent:
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EarningsUpdatedEvent:
     """Earnings updated event data."""
     wallet: str
@@ -116,7 +142,7 @@ class EarningsUpdatedEvent:
     signature: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EarningsClaimedEvent:
     """Earnings claimed event data."""
     wallet: str
@@ -129,7 +155,7 @@ class EarningsClaimedEvent:
 
 
 
-@dataclass
+@dataclass(slots=True)
 class SlotEvent:
     """Slot unlocked/purchased event data."""
     wallet: str
@@ -153,6 +179,10 @@ class EventParser:
         self.logger = logger.bind(service="event_parser")
         self.event_signatures = SolanaConfig.EVENT_SIGNATURES
         
+    def has_event_logs(self, logs: List[str]) -> bool:
+        """Cheap check whether any log line can carry an event, to skip parsing otherwise."""
+        return any(EVENT_LOG_RE.search(line) for line in logs)
+        
     def parse_transaction_events(self, tx_info: TransactionInfo) -> List[ParsedEvent]:
         """
         Parse all events from a transaction.
@@ -512,11 +542,8 @@ class EventParser:
                 return None
                 
             # Unpack the event data
-            player_bytes = data[0:32]
-            earnings_added = struct.unpack('<Q', data[32:40])[0]
-            total_pending = struct.unpack('<Q', data[40:48])[0]
-            next_earnings_time = struct.unpack('<q', data[48:56])[0]
-            businesses_count = struct.unpack('<B', data[56:57])[0]
+            (player_bytes, earnings_added, total_pending,
+             next_earnings_time, businesses_count) = EARNINGS_UPDATED_LAYOUT.unpack_from(data)
             
             # Convert player bytes to pubkey string
             player_pubkey = base58.b58encode(player_bytes).decode('ascii')
@@ -921,7 +948,7 @@ class EventParser:
             parsed_events = []
             
             # 🔍 ДЕТАЛЬНОЕ ЛОГИРОВАНИЕ: Показываем все входящие логи
-            self.logger.info(
+            self.logger.debug(
                 "🔍 REAL-TIME LOGS DEBUG: Received logs for parsing",
                 signature=signature,
                 log_count=len(logs),
@@ -944,7 +971,7 @@ class EventParser:
                 
                 # Handle Anchor events in "Program data:" logs
                 if "Program data:" in log_line:
-                    self.logger.info(
+                    self.logger.debug(
                         "🎯 REAL-TIME: Found Program data line",
                         signature=signature,
                         line_preview=log_line[:100] + "..." if len(log_line) > 100 else log_line
@@ -957,7 +984,7 @@ class EventParser:
                 if "Program log:" not in log_line:
                     continue
                 
-                self.logger.info(
+                self.logger.debug(
                     "🎯 REAL-TIME: Found Program log line",
                     signature=signature,
                     line_preview=log_line[:100] + "..." if len(log_line) > 100 else log_line
@@ -1040,7 +1067,7 @@ class EventParser:
             data_part = log_line.split("Program data:", 1)[1].strip()
             
             # 🔍 ДЕТАЛЬНОЕ ЛОГИРОВАНИЕ
-            self.logger.info(
+            self.logger.debug(
                 "🔍 REAL-TIME ANCHOR EVENT DEBUG",
                 signature=signature,
                 data_part_length=len(data_part),
@@ -1051,7 +1078,7 @@ class EventParser:
             # Decode base64 data
             try:
                 decoded_data = base64.b64decode(data_part)
-                self.logger.info(
+                self.logger.debug(
                     "✅ REAL-TIME: Base64 decoded successfully",
                     signature=signature,
                     decoded_length=len(decoded_data),
@@ -1079,7 +1106,7 @@ class EventParser:
             discriminator = decoded_data[:8]
             event_data = decoded_data[8:]
             
-            self.logger.info(
+            self.logger.debug(
                 "🔍 REAL-TIME: Parsing discriminator",
                 signature=signature,
                 discriminator_hex=discriminator.hex(),
@@ -1092,7 +1119,7 @@ class EventParser:
             )
             if parsed_event:
                 events.append(parsed_event)
-                self.logger.info(
+                self.logger.debug(
                     "✅ REAL-TIME: Successfully parsed anchor event",
                     signature=signature,
                     event_type=parsed_event.event_type.value if parsed_event.event_type else "unknown"
@@ -1188,33 +1215,24 @@ class EventParser:
         """Parse BusinessCreatedInSlot event for real-time processing."""
         try:
             # 🔧 ИСПРАВЛЕНИЕ: discriminator уже извлечен выше!
-            # BusinessCreatedInSlot structure (69 bytes WITHOUT discriminator):
+            # BusinessCreatedInSlot structure (69 bytes WITHOUT discriminator, Borsh is packed):
             # player: Pubkey (32 bytes, offset 0-31)
             # slot_index: u8 (1 byte, offset 32)
             # business_type: u8 (1 byte, offset 33)
             # level: u8 (1 byte, offset 34)
-            # padding: 5 bytes (offset 35-39, Rust alignment)
-            # base_cost: u64 (8 bytes, offset 40-47)  
-            # slot_cost: u64 (8 bytes, offset 48-55)
-            # total_paid: u64 (8 bytes, offset 56-63)
-            # daily_rate: u16 (2 bytes, offset 64-65)
-            # created_at: u32 (4 bytes, offset 66-69)
+            # base_cost: u64 (8 bytes, offset 35-42)
+            # slot_cost: u64 (8 bytes, offset 43-50)
+            # total_paid: u64 (8 bytes, offset 51-58)
+            # daily_rate: u16 (2 bytes, offset 59-60)
+            # created_at: i64 (8 bytes, offset 61-68)
             # Total: 69 bytes (discriminator already removed)
             
-            if len(data) < 66:  # Минимально до daily_rate
-                self.logger.debug(f"Insufficient data for BusinessCreatedInSlot: {len(data)} bytes, need 66")
+            if len(data) < BUSINESS_CREATED_IN_SLOT_LAYOUT.size:  # Минимально до daily_rate
+                self.logger.debug(f"Insufficient data for BusinessCreatedInSlot: {len(data)} bytes, need {BUSINESS_CREATED_IN_SLOT_LAYOUT.size}")
                 return None
                 
-            # 🔧 ИСПРАВЛЕННЫЕ ОФФСЕТЫ: без discriminator
-            player_bytes = data[0:32]  # Теперь player с начала
-            slot_index = struct.unpack('<B', data[32:33])[0]
-            business_type = struct.unpack('<B', data[33:34])[0]  # 🔧 ИСПРАВЛЕНО: -8 
-            level = struct.unpack('<B', data[34:35])[0]  # 🔧 ИСПРАВЛЕНО: -8
-            # Skip padding (5 bytes) to align to u64
-            base_cost = struct.unpack('<Q', data[40:48])[0]  # 🔧 ИСПРАВЛЕНО: -8
-            slot_cost = struct.unpack('<Q', data[48:56])[0]  # 🔧 ИСПРАВЛЕНО: -8
-            total_paid = struct.unpack('<Q', data[56:64])[0]  # 🔧 ИСПРАВЛЕНО: -8
-            daily_rate = struct.unpack('<H', data[64:66])[0]  # 🔧 ИСПРАВЛЕНО: -8
+            (player_bytes, slot_index, business_type, level,
+             base_cost, slot_cost, total_paid, daily_rate) = BUSINESS_CREATED_IN_SLOT_LAYOUT.unpack_from(data)
             # Use block_time since created_at field is truncated
             created_at_raw = int(block_time.timestamp()) if block_time else 0
             
@@ -1243,7 +1261,8 @@ class EventParser:
                 raw_data={
                     "discriminator": discriminator.hex(),
                     "raw_data": data.hex()
-                }
+                },
+                data_complete=True
             )
             
         except Exception as e:
@@ -1273,11 +1292,8 @@ class EventParser:
                 return None
                 
             # Parse earnings updated event data with all fields
-            player_bytes = data[0:32]
-            earnings_added = struct.unpack('<Q', data[32:40])[0]
-            total_pending = struct.unpack('<Q', data[40:48])[0]
-            next_earnings_time = struct.unpack('<q', data[48:56])[0]
-            businesses_count = struct.unpack('<B', data[56:57])[0]
+            (player_bytes, earnings_added, total_pending,
+             next_earnings_time, businesses_count) = EARNINGS_UPDATED_LAYOUT.unpack_from(data)
             
             player_pubkey = Pubkey(player_bytes)
             player_address = str(player_pubkey)
@@ -1305,7 +1321,8 @@ class EventParser:
                 raw_data={
                     "discriminator": discriminator.hex(),
                     "raw_data": data.hex()
-                }
+                },
+                data_complete=True
             )
             
         except Exception as e:
@@ -1378,10 +1395,7 @@ class EventParser:
             if len(data) < 56:
                 return None
                 
-            player_bytes = data[0:32]
-            entry_fee = struct.unpack('<Q', data[32:40])[0]
-            created_at = struct.unpack('<q', data[40:48])[0]
-            next_earnings_time = struct.unpack('<q', data[48:56])[0]
+            player_bytes, entry_fee, created_at, next_earnings_time = PLAYER_CREATED_LAYOUT.unpack_from(data)
             
             player_pubkey = Pubkey(player_bytes)
             player_address = str(player_pubkey)
@@ -1400,7 +1414,8 @@ class EventParser:
                 slot=slot,
                 block_time=block_time,
                 data=event_data,
-                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()}
+                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()},
+                data_complete=True
             )
             
         except Exception as e:
@@ -1421,14 +1436,8 @@ class EventParser:
             if len(data) < 59:
                 return None
                 
-            player_bytes = data[0:32]
-            business_type = struct.unpack('<B', data[32:33])[0]
-            # Skip 7 bytes padding
-            invested_amount = struct.unpack('<Q', data[40:48])[0]
-            daily_rate = struct.unpack('<H', data[48:50])[0]
-            # Skip 6 bytes padding
-            treasury_fee = struct.unpack('<Q', data[56:64])[0]
-            created_at = struct.unpack('<q', data[64:72])[0]
+            (player_bytes, business_type, invested_amount,
+             daily_rate, treasury_fee, created_at) = BUSINESS_CREATED_LAYOUT.unpack_from(data)
             
             player_pubkey = Pubkey(player_bytes)
             player_address = str(player_pubkey)
@@ -1449,7 +1458,8 @@ class EventParser:
                 slot=slot,
                 block_time=block_time,
                 data=event_data,
-                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()}
+                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()},
+                data_complete=True
             )
             
         except Exception as e:
@@ -1470,9 +1480,7 @@ class EventParser:
             if len(data) < 48:
                 return None
                 
-            player_bytes = data[0:32]
-            amount = struct.unpack('<Q', data[32:40])[0]
-            claimed_at = struct.unpack('<q', data[40:48])[0]
+            player_bytes, amount, claimed_at = EARNINGS_CLAIMED_LAYOUT.unpack_from(data)
             
             player_pubkey = Pubkey(player_bytes)
             player_address = str(player_pubkey)
@@ -1490,7 +1498,8 @@ class EventParser:
                 slot=slot,
                 block_time=block_time,
                 data=event_data,
-                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()}
+                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()},
+                data_complete=True
             )
             
         except Exception as e:
@@ -1505,10 +1514,7 @@ class EventParser:
                 self.logger.debug("Insufficient data for PlayerCreated", data_len=len(data))
                 return None
                 
-            player_bytes = data[0:32]
-            entry_fee = struct.unpack('<Q', data[32:40])[0]
-            created_at = struct.unpack('<q', data[40:48])[0]
-            next_earnings_time = struct.unpack('<q', data[48:56])[0]
+            player_bytes, entry_fee, created_at, next_earnings_time = PLAYER_CREATED_LAYOUT.unpack_from(data)
             
             player_pubkey = base58.b58encode(player_bytes).decode('ascii')
             
@@ -1540,9 +1546,7 @@ class EventParser:
                 self.logger.debug("Insufficient data for EarningsClaimed", data_len=len(data))
                 return None
                 
-            player_bytes = data[0:32]
-            amount = struct.unpack('<Q', data[32:40])[0]
-            claimed_at = struct.unpack('<q', data[40:48])[0]
+            player_bytes, amount, claimed_at = EARNINGS_CLAIMED_LAYOUT.unpack_from(data)
             
             player_pubkey = base58.b58encode(player_bytes).decode('ascii')
             
@@ -1568,17 +1572,13 @@ class EventParser:
     def _parse_business_upgraded_event(self, discriminator: bytes, data: bytes, tx_info: TransactionInfo) -> Optional[ParsedEvent]:
         """Parse BusinessUpgraded event from anchor data."""
         try:
-            # BusinessUpgraded structure estimation - will need actual struct analysis
-            if len(data) < 60:
+            # BusinessUpgraded structure: player(32) + business_index(1) + new_level(1) + upgrade_cost(8) + new_daily_rate(2) = 44 bytes
+            if len(data) < BUSINESS_UPGRADED_LAYOUT.size:
                 self.logger.debug("Insufficient data for BusinessUpgraded", data_len=len(data))
                 return None
                 
-            player_bytes = data[0:32]
-            business_index = struct.unpack('<B', data[32:33])[0]
-            new_level = struct.unpack('<B', data[33:34])[0]
-            # Skip padding
-            upgrade_cost = struct.unpack('<Q', data[40:48])[0]
-            new_daily_rate = struct.unpack('<H', data[48:50])[0]
+            (player_bytes, business_index, new_level,
+             upgrade_cost, new_daily_rate) = BUSINESS_UPGRADED_LAYOUT.unpack_from(data)
             
             player_pubkey = base58.b58encode(player_bytes).decode('ascii')
             
@@ -1612,22 +1612,9 @@ class EventParser:
                 self.logger.debug("Insufficient data for BusinessUpgradedInSlot", data_len=len(data))
                 return None
                 
-            player_bytes = data[0:32]
-            slot_index = struct.unpack('<B', data[32:33])[0]
-            old_level = struct.unpack('<B', data[33:34])[0]
-            new_level = struct.unpack('<B', data[34:35])[0]
-            # Fixed positions from real transaction data (with fallback)
-            upgrade_cost = 0
-            new_daily_rate = 0
-            
-            # Try to extract upgrade_cost (8 bytes) at expected position
-            if len(data) >= 43:
-                upgrade_cost = struct.unpack('<Q', data[35:43])[0]  # 35-42 (8 bytes)
-            
-            # Try to extract daily_rate (2 bytes) at expected position  
-            if len(data) >= 45:
-                new_daily_rate = struct.unpack('<H', data[43:45])[0]  # 43-44 (2 bytes)
-            # upgraded_at would be at later position
+            # Fixed positions from real transaction data; upgraded_at would be at a later position
+            (player_bytes, slot_index, old_level, new_level,
+             upgrade_cost, new_daily_rate) = BUSINESS_UPGRADED_IN_SLOT_LAYOUT.unpack_from(data)
             
             player_pubkey = base58.b58encode(player_bytes).decode('ascii')
             
@@ -1696,14 +1683,11 @@ class EventParser:
     ) -> Optional[ParsedEvent]:
         """Parse BusinessUpgraded event for real-time processing."""
         try:
-            if len(data) < 60:
+            if len(data) < BUSINESS_UPGRADED_LAYOUT.size:
                 return None
                 
-            player_bytes = data[0:32]
-            business_index = struct.unpack('<B', data[32:33])[0]
-            new_level = struct.unpack('<B', data[33:34])[0]
-            upgrade_cost = struct.unpack('<Q', data[40:48])[0]
-            new_daily_rate = struct.unpack('<H', data[48:50])[0]
+            (player_bytes, business_index, new_level,
+             upgrade_cost, new_daily_rate) = BUSINESS_UPGRADED_LAYOUT.unpack_from(data)
             
             player_pubkey = Pubkey(player_bytes)
             player_address = str(player_pubkey)
@@ -1723,7 +1707,8 @@ class EventParser:
                 slot=slot,
                 block_time=block_time,
                 data=event_data,
-                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()}
+                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()},
+                data_complete=True
             )
             
         except Exception as e:
@@ -1744,21 +1729,9 @@ class EventParser:
             if len(data) < 45:  # Minimum: player(32) + levels(3) + cost(8) + rate(2) = 45
                 return None
                 
-            player_bytes = data[0:32]
-            slot_index = struct.unpack('<B', data[32:33])[0]
-            old_level = struct.unpack('<B', data[33:34])[0]
-            new_level = struct.unpack('<B', data[34:35])[0]
-            # Fixed positions from real transaction analysis (with fallback)
-            upgrade_cost = 0
-            new_daily_rate = 0
-            
-            # Try to extract upgrade_cost (8 bytes) at expected position
-            if len(data) >= 43:
-                upgrade_cost = struct.unpack('<Q', data[35:43])[0]  # 35-42 (8 bytes)
-            
-            # Try to extract daily_rate (2 bytes) at expected position  
-            if len(data) >= 45:
-                new_daily_rate = struct.unpack('<H', data[43:45])[0]  # 43-44 (2 bytes)
+            # Fixed positions from real transaction analysis
+            (player_bytes, slot_index, old_level, new_level,
+             upgrade_cost, new_daily_rate) = BUSINESS_UPGRADED_IN_SLOT_LAYOUT.unpack_from(data)
             
             player_pubkey = Pubkey(player_bytes)
             player_address = str(player_pubkey)
@@ -1779,7 +1752,8 @@ class EventParser:
                 slot=slot,
                 block_time=block_time,
                 data=event_data,
-                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()}
+                raw_data={"discriminator": discriminator.hex(), "raw_data": data.hex()},
+                data_complete=True
             )
             
         except Exception as e:
@@ -9,15 +9,22 @@ from dataclasses import dataclass
 from datetime import datetime
 import base64
 import json
+import orjson
 import websockets
 import uuid
 
+import httpx
+
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
 from solana.rpc.types import TxOpts
+from solders.commitment_config import CommitmentLevel
 from solders.pubkey import Pubkey
+from solders.rpc.config import RpcTransactionConfig
+from solders.rpc.requests import GetTransaction
+from solders.rpc.responses import GetTransactionResp
 from solders.signature import Signature
-from solders.transaction_status import TransactionConfirmationStatus
+from solders.transaction_status import TransactionConfirmationStatus, UiTransactionEncoding
 import structlog
 
 from app.core.config import settings, SolanaConfig
@@ -70,6 +77,26 @@ class SolanaClient:
             commitment=Commitment(self.rpc_config["commitment"]),
             timeout=self.rpc_config["timeout"]
         )
+        # One long-lived pooled session for every RPC call: keeps TCP/TLS
+        # connections alive between requests instead of re-handshaking.
+        # AsyncClient (solana-py 0.32) takes no session argument, so the
+        # provider's default one is swapped out and closed in close().
+        self._default_session = self.client._provider.session
+        self.client._provider.session = httpx.AsyncClient(
+            # Fail fast on unreachable endpoints, allow slow RPC responses
+            timeout=httpx.Timeout(self.rpc_config["timeout"], connect=self.rpc_config["connect_timeout"]),
+            limits=httpx.Limits(
+                max_connections=self.rpc_config["max_connections"],
+                max_keepalive_connections=self.rpc_config["max_connections"],
+                keepalive_expiry=self.rpc_config["keepalive_expiry"],
+            ),
+        )
+        # Same config get_transaction() sends, reused for batch requests
+        self._transaction_config = RpcTransactionConfig(
+            encoding=UiTransactionEncoding.Json,
+            commitment=CommitmentLevel.from_string(self.rpc_config["commitment"]),
+            max_supported_transaction_version=0
+        )
         self.program_id = Pubkey.from_string(settings.solana_program_id)
         self.logger = logger.bind(service="solana_client")
         
@@ -84,6 +111,7 @@ class SolanaClient:
     async def close(self):
         """Close the RPC client connection."""
         await self.client.close()
+        await self._default_session.aclose()
         
     async def get_health(self) -> bool:
         """Check if the RPC endpoint is healthy."""
@@ -166,46 +194,81 @@ class SolanaClient:
                 self.logger.warning(f"❌ SolanaClient: No transaction data returned for {signature[:20]}...")
                 return None
                 
-            tx = response.value
-            meta = tx.transaction.meta
+            return self._to_transaction_info(signature, response.value)
             
-            if not meta:
-                self.logger.warning(f"❌ SolanaClient: No meta data for {signature[:20]}...")
-                return None
-                
-            self.logger.info(f"✅ SolanaClient: Successfully parsed transaction {signature[:20]}... slot: {tx.slot}")
-            # Parse transaction data
-            transaction_info = TransactionInfo(
-                signature=signature,
-                slot=tx.slot,
-                block_time=datetime.fromtimestamp(tx.block_time) if tx.block_time else None,
-                success=meta.err is None,
-                logs=meta.log_messages or [],
-                accounts=[str(acc) for acc in tx.transaction.transaction.message.account_keys],
-                instructions=[],
-                events=[]
-            )
+        except Exception as e:
+            self.logger.error("Failed to get transaction", signature=signature, error=str(e))
+            raise SolanaRPCError(f"Failed to get transaction: {e}")
             
-            # Parse instructions
-            if hasattr(tx.transaction.transaction.message, 'instructions'):
-                for idx, instr in enumerate(tx.transaction.transaction.message.instructions):
-                    instruction_data = {
-                        "program_id_index": instr.program_id_index,
-                        "accounts": list(instr.accounts),
-                        "data": str(instr.data) if instr.data else "",
-                        "index": idx
-                    }
-                    transaction_info.instructions.append(instruction_data)
+    async def get_transactions_batch(self, signatures: List[str]) -> List[Optional[TransactionInfo]]:
+        """
+        Get several transactions in one JSON-RPC batch request.
+        
+        Results are in the same order as ``signatures``; transactions the node
+        could not return (missing or per-item errors) are None.
+        """
+        if not signatures:
+            return []
             
-            # Parse events from logs
-            transaction_info.events = self._parse_events_from_logs(transaction_info.logs)
+        try:
+            requests = tuple(
+                GetTransaction(Signature.from_string(signature), self._transaction_config, idx)
+                for idx, signature in enumerate(signatures)
+            )
+            responses = await self.client._provider.make_batch_request(
+                requests, (GetTransactionResp,) * len(requests)
+            )
             
-            return transaction_info
+            transactions = []
+            for signature, response in zip(signatures, responses):
+                if not isinstance(response, GetTransactionResp) or not response.value:
+                    transactions.append(None)
+                    continue
+                transactions.append(self._to_transaction_info(signature, response.value))
+                
+            return transactions
             
         except Exception as e:
-            self.logger.error("Failed to get transaction", signature=signature, error=str(e))
-            raise SolanaRPCError(f"Failed to get transaction: {e}")
+            self.logger.error("Failed to get transactions batch", count=len(signatures), error=str(e))
+            raise SolanaRPCError(f"Failed to get transactions batch: {e}")
+            
+    def _to_transaction_info(self, signature: str, tx: Any) -> Optional[TransactionInfo]:
+        """Build TransactionInfo from an encoded confirmed transaction."""
+        meta = tx.transaction.meta
+        
+        if not meta:
+            self.logger.warning(f"❌ SolanaClient: No meta data for {signature[:20]}...")
+            return None
             
+        self.logger.debug("✅ SolanaClient: Parsed transaction", signature=signature[:20], slot=tx.slot)
+        # Parse transaction data
+        transaction_info = TransactionInfo(
+            signature=signature,
+            slot=tx.slot,
+            block_time=datetime.fromtimestamp(tx.block_time) if tx.block_time else None,
+            success=meta.err is None,
+            logs=meta.log_messages or [],
+            accounts=[str(acc) for acc in tx.transaction.transaction.message.account_keys],
+            instructions=[],
+            events=[]
+        )
+        
+        # Parse instructions
+        if hasattr(tx.transaction.transaction.message, 'instructions'):
+            for idx, instr in enumerate(tx.transaction.transaction.message.instructions):
+                instruction_data = {
+                    "program_id_index": instr.program_id_index,
+                    "accounts": list(instr.accounts),
+                    "data": str(instr.data) if instr.data else "",
+                    "index": idx
+                }
+                transaction_info.instructions.append(instruction_data)
+        
+        # Parse events from logs
+        transaction_info.events = self._parse_events_from_logs(transaction_info.logs)
+        
+        return transaction_info
+        
     async def get_account_info(self, address: Union[str, Pubkey]) -> Optional[AccountInfo]:
         """Get account information."""
         try:
@@ -406,7 +469,8 @@ class SolanaClient:
                         ]
                     }
                     
-                    await websocket.send(json.dumps(subscribe_msg))
+                    # Pubsub expects text frames, so send orjson output as str
+                    await websocket.send(orjson.dumps(subscribe_msg).decode())
                     self.logger.info("✅ Subscribed to program logs", program_id=str(self.program_id))
                     
                     # Reset reconnect counter on successful connection
@@ -3,6 +3,7 @@ WebSocket connection manager for handling real-time connections.
 """
 
 import asyncio
+import orjson
 from datetime import datetime
 from typing import Dict, List, Set, Optional, Any
 from fastapi import WebSocket, WebSocketDisconnect
@@ -20,6 +21,20 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Per-connection outbound buffer; messages beyond this are dropped so a slow
+# client cannot hold up delivery to everyone else
+OUTBOUND_QUEUE_SIZE = 256
+
+# Socket writes in flight across all connections, and how long one may take
+# before the client is treated as too slow and disconnected
+MAX_CONCURRENT_SENDS = 100
+SEND_TIMEOUT = 5.0  # seconds
+
+
+def serialize_message(message: WebSocketMessage) -> str:
+    """Serialize a message to the JSON text frame sent to clients."""
+    return orjson.dumps(message.model_dump(), option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class Connection:
     """Represents a single WebSocket connection."""
@@ -32,7 +47,37 @@ class Connection:
         self.last_ping = datetime.utcnow()
         self.subscriptions: Set[MessageType] = set()
         self.filters: Dict[str, Any] = {}
+        # Outbound queue drained by the manager's relay task
+        self.out_queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self.relay_task: Optional[asyncio.Task] = None
         
+    def enqueue_payload(self, payload: str) -> bool:
+        """Queue a serialized message for delivery without waiting on the socket."""
+        try:
+            self.out_queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            logger.warning(
+                "Outbound queue full, dropping message",
+                client_id=self.client_id,
+                wallet=self.wallet
+            )
+            return False
+    
+    async def send_payload(self, payload: str) -> bool:
+        """Send an already serialized message to this connection."""
+        try:
+            await self.websocket.send_text(payload)
+            return True
+        except Exception as e:
+            logger.error(
+                "Failed to send message to connection",
+                client_id=self.client_id,
+                wallet=self.wallet,
+                error=str(e)
+            )
+            return False
+    
     async def send_message(self, message: WebSocketMessage) -> bool:
         """Send a message to this connection."""
         try:
@@ -95,10 +140,20 @@ class ConnectionManager:
         self.wallet_connections: Dict[str, Set[str]] = defaultdict(set)
         # Subscription tracking
         self.subscription_map: Dict[MessageType, Set[str]] = defaultdict(set)
+        # Cached number of active connections
+        self._count = 0
+        # Cross-process notification relay (see pubsub.py), set when running
+        self.wallet_subscriber: Optional[Any] = None
         # Background tasks
         self._background_tasks: Set[asyncio.Task] = set()
         self._cleanup_interval = 60  # seconds
+        self._send_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
         
+    @property
+    def count(self) -> int:
+        """Number of active connections."""
+        return self._count
+    
     async def connect(self, websocket: WebSocket, wallet: str, client_id: str) -> Connection:
         """Accept a new WebSocket connection."""
         try:
@@ -106,10 +161,27 @@ class ConnectionManager:
             
             connection = Connection(websocket, wallet, client_id)
             
-            # Store connection
+            # Store connection; a reconnect under the same client_id replaces
+            # the old entry, so stop its relay before the queue is orphaned
+            previous = self.connections.get(client_id)
+            if previous is None:
+                self._count += 1
+            elif previous.relay_task and not previous.relay_task.done():
+                previous.relay_task.cancel()
+            first_for_wallet = wallet not in self.wallet_connections
             self.connections[client_id] = connection
             self.wallet_connections[wallet].add(client_id)
             
+            # Receive notifications published for this wallet by other services
+            if first_for_wallet and self.wallet_subscriber:
+                try:
+                    await self.wallet_subscriber.subscribe_wallet(wallet)
+                except Exception as e:
+                    logger.warning("Failed to subscribe wallet notifications", wallet=wallet, error=str(e))
+            
+            # Start relaying queued messages to the socket
+            connection.relay_task = asyncio.create_task(self._relay(connection))
+            
             # Send connection status
             status_msg = ConnectionStatusMessage(
                 data={
@@ -160,8 +232,19 @@ class ConnectionManager:
             self.wallet_connections[wallet].discard(client_id)
             if not self.wallet_connections[wallet]:
                 del self.wallet_connections[wallet]
+                if self.wallet_subscriber:
+                    try:
+                        await self.wallet_subscriber.unsubscribe_wallet(wallet)
+                    except Exception as e:
+                        logger.warning("Failed to unsubscribe wallet notifications", wallet=wallet, error=str(e))
             
             del self.connections[client_id]
+            self._count -= 1
+            
+            # Stop the relay unless we are being called from it
+            relay_task = connection.relay_task
+            if relay_task and relay_task is not asyncio.current_task() and not relay_task.done():
+                relay_task.cancel()
             
             # Close the websocket
             if connection.websocket.client_state.name != "DISCONNECTED":
@@ -194,17 +277,18 @@ class ConnectionManager:
         
         client_ids = list(self.wallet_connections[wallet])
         sent_count = 0
+        payload: Optional[str] = None
         
         for client_id in client_ids:
             if client_id in self.connections:
                 connection = self.connections[client_id]
                 if connection.should_receive_message(message):
-                    success = await connection.send_message(message)
-                    if success:
+                    # Serialize once and share the payload across recipients
+                    if payload is None:
+                        payload = serialize_message(message)
+                    # Queued for the relay task; delivery failures disconnect there
+                    if connection.enqueue_payload(payload):
                         sent_count += 1
-                    else:
-                        # Connection failed, schedule for removal
-                        await self.disconnect(client_id, code=1011)
         
         return sent_count
     
@@ -215,17 +299,18 @@ class ConnectionManager:
         
         client_ids = list(self.subscription_map[message.type])
         sent_count = 0
+        payload: Optional[str] = None
         
         for client_id in client_ids:
             if client_id in self.connections:
                 connection = self.connections[client_id]
                 if connection.should_receive_message(message):
-                    success = await connection.send_message(message)
-                    if success:
+                    # Serialize once and share the payload across recipients
+                    if payload is None:
+                        payload = serialize_message(message)
+                    # Queued for the relay task; delivery failures disconnect there
+                    if connection.enqueue_payload(payload):
                         sent_count += 1
-                    else:
-                        # Connection failed, schedule for removal
-                        await self.disconnect(client_id, code=1011)
         
         return sent_count
     
@@ -233,16 +318,17 @@ class ConnectionManager:
         """Broadcast a message to all connected clients."""
         client_ids = list(self.connections.keys())
         sent_count = 0
+        payload: Optional[str] = None
         
         for client_id in client_ids:
             connection = self.connections[client_id]
             if connection.should_receive_message(message):
-                success = await connection.send_message(message)
-                if success:
+                # Serialize once and share the payload across recipients
+                if payload is None:
+                    payload = serialize_message(message)
+                # Queued for the relay task; delivery failures disconnect there
+                if connection.enqueue_payload(payload):
                     sent_count += 1
-                else:
-                    # Connection failed, schedule for removal
-                    await self.disconnect(client_id, code=1011)
         
         return sent_count
     
@@ -301,15 +387,16 @@ class ConnectionManager:
         current_time = datetime.utcnow()
         failed_connections = []
         
+        # Same ping for everyone, serialized once
+        ping_payload = serialize_message(WebSocketMessage(
+            type=MessageType.CONNECTION_STATUS,
+            data={"ping": current_time.isoformat()}
+        ))
+        
         for client_id, connection in self.connections.items():
             try:
-                # Send a simple ping message
-                ping_msg = WebSocketMessage(
-                    type=MessageType.CONNECTION_STATUS,
-                    data={"ping": current_time.isoformat()}
-                )
-                success = await connection.send_message(ping_msg)
-                if success:
+                # A client whose queue is still full is not keeping up
+                if connection.enqueue_payload(ping_payload):
                     connection.update_ping()
                 else:
                     failed_connections.append(client_id)
@@ -322,6 +409,28 @@ class ConnectionManager:
         
         return len(self.connections) - len(failed_connections)
     
+    async def _relay(self, connection: Connection):
+        """Drain a connection's outbound queue into its socket."""
+        try:
+            while True:
+                payload = await connection.out_queue.get()
+                async with self._send_semaphore:
+                    try:
+                        sent = await asyncio.wait_for(connection.send_payload(payload), SEND_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        logger.warning(
+                            "WebSocket send timed out, disconnecting slow client",
+                            client_id=connection.client_id,
+                            wallet=connection.wallet
+                        )
+                        sent = False
+                if not sent:
+                    # Connection failed or too slow, remove it
+                    await self.disconnect(connection.client_id, code=1011)
+                    return
+        except asyncio.CancelledError:
+            pass
+    
     def _start_cleanup_task(self):
         """Start the background cleanup task."""
         if not self._background_tasks:
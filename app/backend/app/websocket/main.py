@@ -125,6 +125,13 @@ def create_websocket_app() -> FastAPI:
         connection_manager = get_connection_manager()
         # Connection manager doesn't need explicit initialization
         
+        # Deliver notifications published by the indexer to our clients
+        from .pubsub import notification_relay
+        try:
+            await notification_relay.start()
+        except Exception as e:
+            logger.warning("WebSocket notification relay unavailable", error=str(e))
+        
         logger.info("WebSocket server started successfully")
     
     @app.on_event("shutdown")
@@ -132,6 +139,9 @@ def create_websocket_app() -> FastAPI:
         """Cleanup on shutdown."""
         logger.info("Shutting down WebSocket server")
         
+        from .pubsub import notification_relay
+        await notification_relay.stop()
+        
         # Close all connections
         connection_manager = get_connection_manager()
         # Disconnect all active connections
@@ -178,4 +188,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop outside development; must be set before asyncio.run creates the loop
+    if not settings.is_development:
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            logger.warning("uvloop not installed, using default asyncio event loop")
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Redis pub/sub bridge for WebSocket notifications across processes.
+
+Services without WebSocket clients of their own (the indexer) publish wallet
+notifications to Redis; every process that serves WebSocket connections
+subscribes to the shard channels of the wallets it has clients for and
+delivers them locally.
+"""
+
+import asyncio
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set
+
+import orjson
+
+from app.cache.redis_client import RedisClient, get_redis_client
+from app.core.config import settings
+from .connection_manager import connection_manager
+from .notification_service import notification_service
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+WALLET_CHANNEL_PREFIX = f"{settings.redis_prefix}ws:wallets:"
+# Wallets are spread over a fixed set of channels so a worker holds at most
+# WALLET_SHARDS subscriptions regardless of how many wallets it serves
+WALLET_SHARDS = 16
+
+# Event type -> NotificationService method that builds and delivers the message
+NOTIFICATION_METHODS = {
+    "business_created": "notify_business_created",
+    "business_upgraded": "notify_business_upgraded",
+    "business_sold": "notify_business_sold",
+    "earnings_updated": "notify_earnings_updated",
+    "player_updated": "notify_player_updated",
+}
+
+# Processing status notifications carry keyword arguments instead of wallet + data
+SIGNATURE_PROCESSING = "signature_processing"
+
+
+def wallet_shard(wallet: str) -> int:
+    """Shard for a wallet; crc32 is stable across processes, unlike hash()."""
+    return zlib.crc32(wallet.encode()) % WALLET_SHARDS
+
+
+def wallet_channel(wallet: str) -> str:
+    """Redis shard channel carrying a wallet's notifications."""
+    return f"{WALLET_CHANNEL_PREFIX}{wallet_shard(wallet)}"
+
+
+@lru_cache(maxsize=1024)
+def _serialize_flat(wallet: str, event_type: str, items: tuple) -> bytes:
+    """Cached serialization for notifications whose data is flat and hashable."""
+    return orjson.dumps(
+        {"wallet": wallet, "event_type": event_type, "data": {key: value for key, _, value in items}},
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS
+    )
+
+
+def serialize_notification(wallet: str, event_type: str, data: Dict[str, Any]) -> bytes:
+    """Serialize a wallet notification, reusing the bytes of identical repeats."""
+    try:
+        # Value types are part of the key so 1, 1.0 and True don't share an entry
+        items = tuple((key, type(value), value) for key, value in sorted(data.items()))
+        return _serialize_flat(wallet, event_type, items)
+    except TypeError:
+        # Nested (unhashable) values or mixed key types: serialize directly
+        return orjson.dumps(
+            {"wallet": wallet, "event_type": event_type, "data": data},
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+async def publish_wallet_notification(
+    redis_client: RedisClient,
+    wallet: str,
+    event_type: str,
+    data: Dict[str, Any]
+) -> int:
+    """Publish one notification for a wallet; returns the number of receivers."""
+    payload = serialize_notification(wallet, event_type, data)
+    return await redis_client.publish(wallet_channel(wallet), payload)
+
+
+class NotificationRelay:
+    """Delivers published wallet notifications to this process's connections."""
+
+    def __init__(self):
+        self._pubsub = None
+        self._task: Optional[asyncio.Task] = None
+        # Shard channel -> local wallets that need it
+        self._channel_wallets: Dict[str, Set[str]] = defaultdict(set)
+
+    async def start(self):
+        """Open the pub/sub connection and subscribe to already connected wallets."""
+        if self._task:
+            return
+
+        redis_client = await get_redis_client()
+        self._pubsub = redis_client.client.pubsub()
+        connection_manager.wallet_subscriber = self
+
+        for wallet in list(connection_manager.wallet_connections):
+            await self.subscribe_wallet(wallet)
+
+        self._task = asyncio.create_task(self._listen())
+        logger.info("WebSocket notification relay started")
+
+    async def stop(self):
+        """Stop listening and close the pub/sub connection."""
+        connection_manager.wallet_subscriber = None
+
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        if self._pubsub:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        self._channel_wallets.clear()
+
+    async def subscribe_wallet(self, wallet: str):
+        """Start receiving notifications for a wallet (subscribes its shard once)."""
+        if not self._pubsub:
+            return
+        channel = wallet_channel(wallet)
+        wallets = self._channel_wallets[channel]
+        if not wallets:
+            await self._pubsub.subscribe(channel)
+        wallets.add(wallet)
+
+    async def unsubscribe_wallet(self, wallet: str):
+        """Stop receiving notifications for a wallet (drops its shard when unused)."""
+        if not self._pubsub:
+            return
+        channel = wallet_channel(wallet)
+        wallets = self._channel_wallets.get(channel)
+        if not wallets:
+            return
+        wallets.discard(wallet)
+        if not wallets:
+            del self._channel_wallets[channel]
+            await self._pubsub.unsubscribe(channel)
+
+    async def _listen(self):
+        """Read published notifications and deliver them locally."""
+        while True:
+            try:
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(0.5)
+                    continue
+
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message and message["type"] == "message":
+                    await self._deliver(orjson.loads(message["data"]))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Notification relay error", error=str(e))
+                await asyncio.sleep(1)
+
+    async def _deliver(self, notification: Dict[str, Any]):
+        """Hand a published notification to NotificationService."""
+        wallet = notification.get("wallet")
+        # Shards are shared, so most messages are for wallets served elsewhere
+        if wallet not in connection_manager.wallet_connections:
+            return
+
+        event_type = notification.get("event_type")
+        data = notification.get("data") or {}
+
+        if event_type == SIGNATURE_PROCESSING:
+            await notification_service.notify_signature_processing(**data)
+            return
+
+        method_name = NOTIFICATION_METHODS.get(event_type)
+        if method_name is None:
+            logger.warning("Unknown relayed notification", event_type=event_type)
+            return
+        await getattr(notification_service, method_name)(wallet, data)
+
+
+# Global relay instance for processes that serve WebSocket clients
+notification_relay = NotificationRelay()
+
+
+def get_notification_relay() -> NotificationRelay:
+    """Get the global notification relay instance."""
+    return notification_relay
@@ -5,7 +5,7 @@ WebSocket endpoint handler for real-time communication.
 import asyncio
 import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from uuid import uuid4
 
 from fastapi import WebSocket, WebSocketDisconnect, Query, Depends, HTTPException, status
@@ -316,9 +316,11 @@ async def _send_initial_player_data(connection, wallet: str):
         # Don't re-raise the error - WebSocket connection should continue working
 
 
-async def get_websocket_stats():
-    """Get WebSocket connection statistics."""
+async def get_websocket_stats(admission: Optional[Dict[str, Any]] = None):
+    """Get WebSocket connection statistics (plus the caller's admission gate state)."""
     stats = connection_manager.get_connection_stats()
+    if admission is not None:
+        stats["admission"] = admission
     return JSONResponse(
         content={
             "success": True,
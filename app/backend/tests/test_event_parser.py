@@ -0,0 +1,75 @@
+"""
+Round-trip tests for the Borsh event decoders
+"""
+import base64
+import struct
+
+from solders.pubkey import Pubkey
+
+from app.services.event_parser import EventParser, EventType
+
+
+PLAYER = Pubkey.from_string("11111111111111111111111111111112")
+SIGNATURE = "TestSignature"
+
+
+def _borsh(*fields):
+    """Pack fields one after another like Borsh does: little-endian, no padding."""
+    return b"".join(struct.pack("<" + fmt, value) for fmt, value in fields)
+
+
+def _parse(discriminator_hex: str, payload: bytes):
+    log_line = "Program data: " + base64.b64encode(bytes.fromhex(discriminator_hex) + payload).decode()
+    return EventParser().parse_logs_for_events([log_line], SIGNATURE, 1, None)
+
+
+def test_business_created_in_slot_round_trip():
+    payload = bytes(PLAYER) + _borsh(
+        ("B", 2), ("B", 3), ("B", 1),  # slot_index, business_type, level
+        ("Q", 100_000_000), ("Q", 5_000_000), ("Q", 105_000_000),  # base_cost, slot_cost, total_paid
+        ("H", 150), ("q", 1_700_000_000),  # daily_rate, created_at
+    )
+    assert len(payload) == 69
+
+    [event] = _parse("4a191ae88d56371c", payload)
+
+    assert event.event_type == EventType.BUSINESS_CREATED_IN_SLOT
+    assert event.data["owner"] == str(PLAYER)
+    assert (event.data["slot_index"], event.data["business_type"], event.data["level"]) == (2, 3, 1)
+    assert event.data["base_cost"] == 100_000_000
+    assert event.data["slot_cost"] == 5_000_000
+    assert event.data["total_paid"] == 105_000_000
+    assert event.data["daily_rate"] == 150
+    assert event.data_complete
+
+
+def test_business_created_round_trip():
+    payload = bytes(PLAYER) + _borsh(
+        ("B", 4), ("Q", 200_000_000), ("H", 120),  # business_type, invested_amount, daily_rate
+        ("Q", 40_000_000), ("q", 1_700_000_000),  # treasury_fee, created_at
+    )
+    assert len(payload) == 59
+
+    [event] = _parse("3fe9746a44105602", payload)
+
+    assert event.event_type == EventType.BUSINESS_CREATED
+    assert event.data["player"] == str(PLAYER)
+    assert event.data["business_type"] == 4
+    assert event.data["invested_amount"] == 200_000_000
+    assert event.data["daily_rate"] == 120
+    assert event.data["treasury_fee"] == 40_000_000
+
+
+def test_business_upgraded_round_trip():
+    payload = bytes(PLAYER) + _borsh(
+        ("B", 1), ("B", 2), ("Q", 30_000_000), ("H", 180),  # business_index, new_level, upgrade_cost, new_daily_rate
+    )
+    assert len(payload) == 44
+
+    [event] = _parse("a0a9e0fdbe38a29d", payload)
+
+    assert event.event_type == EventType.BUSINESS_UPGRADED
+    assert event.data["player"] == str(PLAYER)
+    assert (event.data["business_index"], event.data["new_level"]) == (1, 2)
+    assert event.data["upgrade_cost"] == 30_000_000
+    assert event.data["new_daily_rate"] == 180
@@ -0,0 +1,98 @@
+"""
+Test that the SQL and Python business liquidation values agree.
+"""
+
+import pytest
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import delete, select, text
+from sqlalchemy.orm import selectinload
+
+from app.core.database import init_database, close_database, get_async_session
+from app.models.player import Player
+from app.models.business import Business, BusinessType
+from app.models.user import User
+
+
+TEST_WALLET = "TestLiquidation1234567890123456789012345"
+INVESTED = 1_000_000_000
+
+# Days held on either side of the first, last and final fee bracket edges
+EDGE_DAYS = (6, 7, 27, 28, 30, 31)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Create an instance of the default event loop for the test session."""
+    loop = asyncio.get_event_loop_policy().new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def setup_database():
+    """Setup database for testing."""
+    await init_database()
+    yield
+    await close_database()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("days_held", EDGE_DAYS)
+async def test_liquidation_value_sql_matches_python(days_held):
+    """The SQL fee brackets match the Python ones at the bracket edges, on a non-UTC server."""
+    async with get_async_session() as session:
+        await session.execute(delete(Player).where(Player.wallet == TEST_WALLET))
+        await session.execute(delete(User).where(User.id == TEST_WALLET))
+
+        session.add(User(id=TEST_WALLET, user_type="wallet", wallet_address=TEST_WALLET))
+        session.add(Player(
+            wallet=TEST_WALLET,
+            total_invested=INVESTED,
+            total_upgrade_spent=0,
+            total_slot_spent=0,
+            total_earned=0,
+            pending_earnings=0,
+            pending_referral_earnings=0,
+            unlocked_slots_count=3,
+            premium_slots_count=0,
+            has_paid_entry=True,
+            is_active=True,
+            earnings_interval=86400,
+            referral_count=0,
+            sync_version=1,
+            daily_earnings_estimate=0
+        ))
+        # Half an hour past the day boundary, so a TimeZone shift of the SQL comparison crosses it
+        session.add(Business(
+            owner_id=TEST_WALLET,
+            player_wallet=TEST_WALLET,
+            business_type=BusinessType.TOBACCO_SHOP,
+            level=0,
+            base_cost=INVESTED,
+            total_invested_amount=INVESTED,
+            daily_rate=100,
+            is_active=True,
+            slot_index=0,
+            on_chain_created_at=datetime.utcnow() - timedelta(days=days_held, minutes=30)
+        ))
+        await session.commit()
+
+        try:
+            await session.execute(text("SET LOCAL TIME ZONE 'America/New_York'"))
+            sql_value = await Player.get_business_liquidation_value(session, TEST_WALLET)
+
+            result = await session.execute(
+                select(Player)
+                .where(Player.wallet == TEST_WALLET)
+                .options(selectinload(Player.businesses))
+                .execution_options(populate_existing=True)
+            )
+            python_value = result.scalar_one().calculate_business_liquidation_value()
+
+            assert sql_value == python_value
+        finally:
+            await session.rollback()
+            await session.execute(delete(Player).where(Player.wallet == TEST_WALLET))
+            await session.execute(delete(User).where(User.id == TEST_WALLET))
+            await session.commit()
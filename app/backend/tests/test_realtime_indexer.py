@@ -0,0 +1,68 @@
+"""
+Test the realtime indexer's WebSocket-logs fast path
+"""
+import base64
+import struct
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from solders.pubkey import Pubkey
+
+from app.indexer.realtime_indexer import RealTimeIndexer, LOG_TRUNCATED_MARKER
+
+
+PLAYER = Pubkey.from_string("11111111111111111111111111111112")
+BLOCK_TIME = datetime(2026, 1, 1)
+
+# BusinessUpgraded: player, business_index, new_level, upgrade_cost, new_daily_rate
+BUSINESS_UPGRADED_LOG = "Program data: " + base64.b64encode(
+    bytes.fromhex("a0a9e0fdbe38a29d") + bytes(PLAYER) + struct.pack("<BBQH", 1, 2, 30_000_000, 180)
+).decode()
+
+
+def _indexer() -> RealTimeIndexer:
+    indexer = RealTimeIndexer()
+    indexer.solana_client = AsyncMock()
+    indexer.solana_client.get_block_time.return_value = BLOCK_TIME
+    indexer._store_events = AsyncMock()
+    indexer._process_events_handlers = AsyncMock()
+    return indexer
+
+
+def _notification(signature: str, logs) -> dict:
+    return {
+        "subscription": 1,
+        "result": {
+            "context": {"slot": 42},
+            "value": {"signature": signature, "logs": logs, "err": None},
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_complete_logs_skip_rpc_fetch():
+    indexer = _indexer()
+
+    await indexer._handle_logs_notification(_notification("sig-complete", [BUSINESS_UPGRADED_LOG]))
+
+    indexer.solana_client.get_transaction.assert_not_awaited()
+    [stored] = indexer._store_events.await_args.args
+    assert len(stored) == 1
+    assert stored[0].data["upgrade_cost"] == 30_000_000
+    # The notification carries no block time, so it is resolved from the slot
+    assert stored[0].block_time == BLOCK_TIME
+    indexer.solana_client.get_block_time.assert_awaited_once_with(42)
+
+
+@pytest.mark.asyncio
+async def test_truncated_logs_fetch_transaction():
+    indexer = _indexer()
+    indexer.solana_client.get_transaction.return_value = None
+
+    await indexer._handle_logs_notification(
+        _notification("sig-truncated", [BUSINESS_UPGRADED_LOG, LOG_TRUNCATED_MARKER])
+    )
+
+    indexer.solana_client.get_transaction.assert_awaited_once_with("sig-truncated")
+    indexer._store_events.assert_not_awaited()
@@ -0,0 +1,70 @@
+"""
+Test the realtime notifier's per-wallet coalescing flushes
+"""
+import asyncio
+from functools import partial
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.indexer.simple_realtime_notifier import SimpleRealtimeNotifier
+
+
+WALLET = "TestNotifierWallet123456789012345678901234"
+
+
+def _notifier(sent: list) -> SimpleRealtimeNotifier:
+    notifier = SimpleRealtimeNotifier()
+
+    async def notify(user_wallet, data):
+        # Later updates finish faster, so concurrent sends would arrive reordered
+        await asyncio.sleep(0.01 / data["step"])
+        if data.get("fail"):
+            raise RuntimeError("publish failed")
+        sent.append(data["step"])
+
+    notifier._dispatch = {"signature_processing": notify}
+    notifier._initialized = True
+    return notifier
+
+
+@pytest.mark.asyncio
+async def test_flushes_deliver_in_enqueue_order():
+    sent = []
+    notifier = _notifier(sent)
+
+    notifier.queue_update(WALLET, "signature_processing", {"step": 1})
+    notifier.queue_update(WALLET, "signature_processing", {"step": 2})
+    notifier._flush(WALLET)
+    notifier.queue_update(WALLET, "signature_processing", {"step": 3})
+    notifier._flush(WALLET)
+    await asyncio.gather(*notifier._flush_tasks.values())
+
+    assert sent == [1, 2, 3]
+    assert notifier._flush_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_flush_failures_are_counted():
+    sent = []
+    notifier = _notifier(sent)
+
+    notifier.queue_update(WALLET, "signature_processing", {"step": 1, "fail": True})
+    notifier.queue_update(WALLET, "signature_processing", {"step": 2})
+    notifier._flush(WALLET)
+    await asyncio.gather(*notifier._flush_tasks.values())
+
+    assert sent == [2]
+    assert (notifier._sent_n, notifier._err_n) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_unreceived_publish_is_an_error():
+    notifier = SimpleRealtimeNotifier()
+    notifier._redis = AsyncMock()
+    notifier._redis.publish.return_value = 0
+    notifier._dispatch = {"business_created": partial(notifier._publish, "business_created")}
+    notifier._initialized = True
+
+    assert await notifier.send("business_created", WALLET, {"business_type": 1}) is False
+    assert (notifier._sent_n, notifier._err_n) == (0, 1)
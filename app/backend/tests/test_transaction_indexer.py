@@ -0,0 +1,51 @@
+"""
+Test the transaction indexer's checkpoint catch-up
+"""
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.indexer import transaction_indexer
+from app.indexer.transaction_indexer import IndexerCheckpoint, TransactionIndexer
+
+
+@asynccontextmanager
+async def _session():
+    yield AsyncMock()
+
+
+def _signature(number: int) -> dict:
+    return {"signature": f"sig{number}", "slot": number}
+
+
+@pytest.mark.asyncio
+async def test_catch_up_limit_indexes_oldest_signatures_first(monkeypatch):
+    monkeypatch.setattr(transaction_indexer, "SIGNATURES_PAGE_SIZE", 2)
+    monkeypatch.setattr(transaction_indexer, "get_async_session", _session)
+
+    # Five signatures newer than the checkpoint, served newest first
+    pages = [[_signature(9), _signature(8)], [_signature(7), _signature(6)], [_signature(5)]]
+    indexer = TransactionIndexer()
+    indexer.solana_client = AsyncMock()
+    indexer.solana_client.get_signatures_for_address.side_effect = pages
+    indexer.checkpoint = IndexerCheckpoint(
+        last_processed_slot=4,
+        last_processed_signature="sig4",
+        last_update=datetime.utcnow(),
+        processed_count=0,
+        error_count=0
+    )
+    indexer._index_signatures = AsyncMock()
+    indexer._save_checkpoint = AsyncMock()
+
+    await indexer.index_new_transactions(limit=3)
+
+    # Paged all the way back to the checkpoint cursor
+    assert indexer.solana_client.get_signatures_for_address.await_count == 3
+    indexed = indexer._index_signatures.await_args.args[1]
+    assert [sig_info["signature"] for sig_info in indexed] == ["sig5", "sig6", "sig7"]
+    # The next pass resumes after the newest indexed signature, so sig8/sig9 aren't lost
+    _, slot, signature, _ = indexer._save_checkpoint.await_args.args
+    assert (slot, signature) == (7, "sig7")